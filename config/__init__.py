@@ -3,17 +3,29 @@
 提供项目基础配置功能。日志系统已移至 utils.logging_utils 模块。
 """
 
+import copy
 import json
+import logging
+import warnings
 from pathlib import Path
 from typing import Any
 
 try:
     import yaml
 
+    # 优先使用libyaml的C加载器（PyYAML官方wheel通常已自带），比纯Python实现快数倍
+    try:
+        from yaml import CSafeLoader as _YamlLoader
+    except ImportError:
+        from yaml import SafeLoader as _YamlLoader
+
     YAML_AVAILABLE = True
 except ImportError:
     YAML_AVAILABLE = False
 
+# 已解析配置的进程内缓存，键为 (路径, mtime_ns, 格式)，文件修改后自动失效
+_CONFIG_CACHE: dict[tuple[str, int, str], dict[str, Any]] = {}
+
 
 def get_config_dir() -> Path:
     """获取配置目录路径。
@@ -64,21 +76,59 @@ def load_config(
         else:
             raise ValueError(f"不支持的配置格式: {config_format}")
 
-    if not config_path.exists():
+    try:
+        mtime_ns = config_path.stat().st_mtime_ns
+    except FileNotFoundError:
         # 返回空配置而不是抛出异常
         return {}
 
-    with open(config_path, encoding="utf-8") as f:
-        if config_format == "yaml":
-            if not YAML_AVAILABLE:
-                raise ImportError("需要安装PyYAML来使用YAML配置: pip install PyYAML")
-            config = yaml.safe_load(f) or {}
-        elif config_format == "json":
-            config = json.load(f)
-        else:
-            raise ValueError(f"不支持的配置格式: {config_format}")
+    cache_key = (str(config_path), mtime_ns, config_format)
+    cached = _CONFIG_CACHE.get(cache_key)
+    if cached is None:
+        cached = _parse_config_file(config_path, config_format, mtime_ns)
+        _CONFIG_CACHE[cache_key] = cached
 
-    return config
+    # 返回副本，调用方修改结果不会污染缓存
+    return copy.deepcopy(cached)
+
+
+def _parse_config_file(
+    config_path: Path, config_format: str, mtime_ns: int
+) -> dict[str, Any]:
+    """解析配置文件。
+
+    YAML配置会在旁边维护一个 ``<name>.yaml.json`` 解析结果缓存，
+    该文件比源文件新时直接用JSON加载（JSON解析远快于YAML）。
+    """
+    if config_format == "yaml":
+        if not YAML_AVAILABLE:
+            raise ImportError("需要安装PyYAML来使用YAML配置: pip install PyYAML")
+
+        sidecar_path = config_path.with_name(config_path.name + ".json")
+        try:
+            if sidecar_path.stat().st_mtime_ns >= mtime_ns:
+                with open(sidecar_path, encoding="utf-8") as f:
+                    return json.load(f)
+        except (OSError, ValueError):
+            pass
+
+        with open(config_path, encoding="utf-8") as f:
+            config = yaml.load(f, Loader=_YamlLoader) or {}
+
+        # 仅当JSON能无损表示该配置时才写入磁盘缓存（日期、非字符串键等会跳过）
+        try:
+            content = json.dumps(config, ensure_ascii=False)
+            if json.loads(content) == config:
+                sidecar_path.write_text(content, encoding="utf-8")
+        except (OSError, TypeError, ValueError):
+            pass
+        return config
+
+    if config_format == "json":
+        with open(config_path, encoding="utf-8") as f:
+            return json.load(f)
+
+    raise ValueError(f"不支持的配置格式: {config_format}")
 
 
 def get_config_path(
@@ -97,30 +147,49 @@ def get_config_path(
     return config_dir / f"{config_name}.{config_format}"
 
 
+# 已发出过废弃警告的函数名，每个进程只警告一次
+_deprecation_warned: set[str] = set()
+
+# logging_utils模块的解析结果：未解析时为_UNRESOLVED，不可用时为None
+_UNRESOLVED = object()
+_logging_utils: Any = _UNRESOLVED
+
+
+def _get_logging_utils() -> Any:
+    """解析一次 my_python_project.utils.logging_utils 并缓存结果。
+
+    首次调用时才导入（导入会触发项目日志初始化），之后不再执行import语句。
+    """
+    global _logging_utils
+    if _logging_utils is _UNRESOLVED:
+        try:
+            from my_python_project.utils import logging_utils
+
+            _logging_utils = logging_utils
+        except ImportError:
+            _logging_utils = None
+    return _logging_utils
+
+
 # 提供向后兼容性的函数
 def init_logging(*args, **kwargs):
     """向后兼容的日志初始化函数。
 
     注意: 此函数已废弃，请使用 utils.logging_utils.auto_setup_project_logging()
     """
-    import warnings
-
-    warnings.warn(
-        "config.init_logging 已废弃，请使用 utils.logging_utils.auto_setup_project_logging()",
-        DeprecationWarning,
-        stacklevel=2,
-    )
-
-    try:
-        from ..src.my_python_project.utils.logging_utils import (
-            auto_setup_project_logging,
+    if "init_logging" not in _deprecation_warned:
+        _deprecation_warned.add("init_logging")
+        warnings.warn(
+            "config.init_logging 已废弃，请使用 utils.logging_utils.auto_setup_project_logging()",
+            DeprecationWarning,
+            stacklevel=2,
         )
 
-        auto_setup_project_logging()
-    except ImportError:
+    logging_utils = _get_logging_utils()
+    if logging_utils is not None:
+        logging_utils.auto_setup_project_logging()
+    else:
         # 基本日志配置作为后备
-        import logging
-
         logging.basicConfig(
             level=logging.INFO,
             format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
@@ -132,19 +201,15 @@ def get_logger(name: str = None):
 
     注意: 此函数已废弃，请使用 utils.logging_utils.get_project_logger()
     """
-    import warnings
-
-    warnings.warn(
-        "config.get_logger 已废弃，请使用 utils.logging_utils.get_project_logger()",
-        DeprecationWarning,
-        stacklevel=2,
-    )
-
-    try:
-        from ..src.my_python_project.utils.logging_utils import get_project_logger
-
-        return get_project_logger(name)
-    except ImportError:
-        import logging
+    if "get_logger" not in _deprecation_warned:
+        _deprecation_warned.add("get_logger")
+        warnings.warn(
+            "config.get_logger 已废弃，请使用 utils.logging_utils.get_project_logger()",
+            DeprecationWarning,
+            stacklevel=2,
+        )
 
-        return logging.getLogger(name or "my_python_project")
+    logging_utils = _get_logging_utils()
+    if logging_utils is not None:
+        return logging_utils.get_project_logger(name)
+    return logging.getLogger(name or "my_python_project")
@@ -1,21 +1,33 @@
 #!/usr/bin/env python
 """uv项目初始化脚本"""
 
+import shutil
 import subprocess
 import sys
 from pathlib import Path
 
+# 上次成功同步依赖的时间戳文件
+SYNC_STAMP = Path(".venv") / ".init-sync-stamp"
+
 
 def check_uv():
-    """检查uv是否安装"""
-    try:
-        result = subprocess.run(
-            ["uv", "--version"], check=True, capture_output=True, text=True
-        )
-        print(f"✅ 检测到 {result.stdout.strip()}")
-        return True
-    except (subprocess.CalledProcessError, FileNotFoundError):
+    """检查uv是否安装（只在PATH中查找，不启动子进程）"""
+    uv_path = shutil.which("uv")
+    if not uv_path:
+        return False
+    print(f"✅ 检测到 uv: {uv_path}")
+    return True
+
+
+def dependencies_up_to_date():
+    """上次同步后pyproject.toml和uv.lock都未修改时返回True"""
+    if not SYNC_STAMP.exists():
         return False
+    stamp_mtime = SYNC_STAMP.stat().st_mtime
+    for path in (Path("pyproject.toml"), Path("uv.lock")):
+        if path.exists() and path.stat().st_mtime > stamp_mtime:
+            return False
+    return True
 
 
 def setup_uv_environment():
@@ -39,8 +51,12 @@ def setup_uv_environment():
             print("✅ 虚拟环境创建完成")
 
         # 同步依赖（使用full-dev分组获得完整开发环境）
-        subprocess.run(["uv", "sync", "--extra", "full-dev"], check=True)
-        print("✅ 依赖安装完成")
+        if dependencies_up_to_date():
+            print("✅ 依赖已是最新，跳过同步")
+        else:
+            subprocess.run(["uv", "sync", "--extra", "full-dev"], check=True)
+            SYNC_STAMP.touch()
+            print("✅ 依赖安装完成")
 
         return True
     except subprocess.CalledProcessError as e:
@@ -6,19 +6,12 @@ import os
 __author__ = """周元琦"""
 __email__ = "zyq1034378361@gmail.com"
 
-# 版本号获取，优先级：包元数据 > _version.py > fallback
-# 多级版本获取机制，确保在任何环境下都能正确获取版本号
-# Python 3.11+ 原生支持 importlib.metadata，符合最佳实践文档要求
-from importlib.metadata import PackageNotFoundError, version
-
+# 版本号直接读取构建时由setuptools_scm生成的_version.py
+# 不再通过importlib.metadata扫描包元数据，避免冷启动时的额外开销
 try:
-    __version__ = version("my_python_project")
-except PackageNotFoundError:
-    # 开发环境或未安装的包，尝试从_version.py获取
-    try:
-        from ._version import __version__
-    except ImportError:
-        __version__ = "0.1.0"  # fallback版本
+    from ._version import __version__
+except ImportError:
+    __version__ = "0.1.0"  # fallback版本
 
 
 # 配置日志系统
@@ -41,90 +34,109 @@ except Exception:
     logger = logging.getLogger("my_python_project")
     logger.warning("使用基本日志配置（高级日志系统初始化失败）")
 
-# 导入工具函数
+# 导入工具函数（utils包本身同样按需加载子模块，导入开销很小）
 from . import utils
 
-# 导出核心功能模块 - 只导出最常用的接口，减少启动时间
-try:
-    # 核心工具
-    from .utils.cache import FileCache, MemoryCache, MultiLevelCache, cache_result
-    from .utils.common import (
-        deep_merge,
-        format_datetime,
-        is_valid_email,
-        now_timestamp,
-        retry_on_failure,
-        safe_filename,
-        timing_decorator,
-    )
-    from .utils.config_manager import ConfigManager
-    from .utils.exceptions import (
-        BaseError,
-        CacheError,
-        ConfigError,
-        ErrorHandler,
-        ValidationError,
-        handle_exceptions,
-    )
-    from .utils.logging_utils import (
-        auto_setup_project_logging,
-        get_project_logger,
-        init_project_logging,
-        load_logging_config_from_file,
-    )
-    from .utils.path_manager import ProjectPathManager, init_project_paths
-    from .utils.performance import PerformanceMonitor, benchmark
-    from .utils.validators import (
-        DictValidator,
-        EmailValidator,
-        NumberValidator,
-        StringValidator,
-        validate_data,
-    )
+# 导出核心功能模块 - 按需延迟加载（PEP 562），首次访问时才导入对应子模块，
+# 避免在 import my_python_project 时加载pickle、yaml、验证器等全部依赖
+_LAZY_MAP = {
+    # 缓存
+    "MemoryCache": "my_python_project.utils.cache",
+    "FileCache": "my_python_project.utils.cache",
+    "MultiLevelCache": "my_python_project.utils.cache",
+    "cache_result": "my_python_project.utils.cache",
+    # 常用工具
+    "deep_merge": "my_python_project.utils.common",
+    "format_datetime": "my_python_project.utils.common",
+    "is_valid_email": "my_python_project.utils.common",
+    "now_timestamp": "my_python_project.utils.common",
+    "retry_on_failure": "my_python_project.utils.common",
+    "safe_filename": "my_python_project.utils.common",
+    "timing_decorator": "my_python_project.utils.common",
+    # 配置管理
+    "ConfigManager": "my_python_project.utils.config_manager",
+    # 异常处理
+    "BaseError": "my_python_project.utils.exceptions",
+    "CacheError": "my_python_project.utils.exceptions",
+    "ConfigError": "my_python_project.utils.exceptions",
+    "ErrorHandler": "my_python_project.utils.exceptions",
+    "ValidationError": "my_python_project.utils.exceptions",
+    "handle_exceptions": "my_python_project.utils.exceptions",
+    # 日志
+    "auto_setup_project_logging": "my_python_project.utils.logging_utils",
+    "get_project_logger": "my_python_project.utils.logging_utils",
+    "init_project_logging": "my_python_project.utils.logging_utils",
+    "load_logging_config_from_file": "my_python_project.utils.logging_utils",
+    # 路径管理
+    "ProjectPathManager": "my_python_project.utils.path_manager",
+    "init_project_paths": "my_python_project.utils.path_manager",
+    # 性能监控
+    "PerformanceMonitor": "my_python_project.utils.performance",
+    "benchmark": "my_python_project.utils.performance",
+    # 验证器
+    "DictValidator": "my_python_project.utils.validators",
+    "EmailValidator": "my_python_project.utils.validators",
+    "NumberValidator": "my_python_project.utils.validators",
+    "StringValidator": "my_python_project.utils.validators",
+    "validate_data": "my_python_project.utils.validators",
+}
+
+__all__ = [
+    # 版本和基础
+    "__version__",
+    "utils",
+    # 核心功能
+    "get_project_logger",
+    "auto_setup_project_logging",
+    "load_logging_config_from_file",
+    "init_project_logging",
+    "ConfigManager",
+    "validate_data",
+    "MemoryCache",
+    "FileCache",
+    "MultiLevelCache",
+    "cache_result",
+    # 性能监控
+    "PerformanceMonitor",
+    "benchmark",
+    # 路径管理
+    "ProjectPathManager",
+    "init_project_paths",
+    # 验证器
+    "StringValidator",
+    "NumberValidator",
+    "DictValidator",
+    "EmailValidator",
+    # 异常处理
+    "BaseError",
+    "ConfigError",
+    "ValidationError",
+    "CacheError",
+    "handle_exceptions",
+    "ErrorHandler",
+    # 常用工具
+    "now_timestamp",
+    "format_datetime",
+    "safe_filename",
+    "deep_merge",
+    "retry_on_failure",
+    "timing_decorator",
+    "is_valid_email",
+]
+
+
+def __getattr__(name: str):
+    """按需导入导出的名称，并缓存到模块命名空间中。"""
+    module_name = _LAZY_MAP.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    import importlib
+
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
 
-    __all__ = [
-        # 版本和基础
-        "__version__",
-        "utils",
-        # 核心功能
-        "get_project_logger",
-        "auto_setup_project_logging",
-        "load_logging_config_from_file",
-        "init_project_logging",
-        "ConfigManager",
-        "validate_data",
-        "MemoryCache",
-        "FileCache",
-        "MultiLevelCache",
-        "cache_result",
-        # 性能监控
-        "PerformanceMonitor",
-        "benchmark",
-        # 路径管理
-        "ProjectPathManager",
-        "init_project_paths",
-        # 验证器
-        "StringValidator",
-        "NumberValidator",
-        "DictValidator",
-        "EmailValidator",
-        # 异常处理
-        "BaseError",
-        "ConfigError",
-        "ValidationError",
-        "CacheError",
-        "handle_exceptions",
-        "ErrorHandler",
-        # 常用工具
-        "now_timestamp",
-        "format_datetime",
-        "safe_filename",
-        "deep_merge",
-        "retry_on_failure",
-        "timing_decorator",
-        "is_valid_email",
-    ]
 
-except ImportError as e:
-    logger.warning(f"某些模块导入失败，可能影响功能可用性: {e}")
-    __all__ = ["__version__", "utils"]
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -3,53 +3,69 @@
 此包包含项目中使用的各种实用工具函数。
 """
 
-# 明确导入各模块的主要功能
-from .logging_utils import get_project_logger, log_performance, log_function_call
-from .path_manager import ProjectPathManager, get_project_paths
-from .config_manager import ConfigManager, get_config, set_config
-from .validators import validate_data, StringValidator, NumberValidator
-from .cache import MemoryCache, FileCache, cache_result
-from .exceptions import (
-    BaseError,
-    ConfigError,
-    ValidationError,
-    CacheError,
-    handle_exceptions,
-    ErrorHandler,
-)
-from .common import (
+import importlib
+
+# 各导出名称所在的子模块，首次访问时才导入（PEP 562），
+# 避免 import my_python_project.utils 时加载全部子模块
+_LAZY_MAP = {
+    # 日志工具
+    "get_project_logger": ".logging_utils",
+    "log_performance": ".logging_utils",
+    "log_function_call": ".logging_utils",
+    # 路径管理
+    "ProjectPathManager": ".path_manager",
+    "get_project_paths": ".path_manager",
+    # 配置管理
+    "ConfigManager": ".config_manager",
+    "get_config": ".config_manager",
+    "set_config": ".config_manager",
+    # 数据验证
+    "validate_data": ".validators",
+    "StringValidator": ".validators",
+    "NumberValidator": ".validators",
+    # 缓存
+    "MemoryCache": ".cache",
+    "FileCache": ".cache",
+    "cache_result": ".cache",
+    # 异常处理
+    "BaseError": ".exceptions",
+    "ConfigError": ".exceptions",
+    "ValidationError": ".exceptions",
+    "CacheError": ".exceptions",
+    "handle_exceptions": ".exceptions",
+    "ErrorHandler": ".exceptions",
     # 时间工具
-    now_timestamp,
-    format_datetime,
-    parse_datetime,
+    "now_timestamp": ".common",
+    "format_datetime": ".common",
+    "parse_datetime": ".common",
     # 文件工具
-    safe_filename,
-    slugify,
-    ensure_dir,
-    load_json,
-    save_json,
-    load_yaml,
-    save_yaml,
-    list_files,
-    get_file_size,
+    "safe_filename": ".common",
+    "slugify": ".common",
+    "ensure_dir": ".common",
+    "load_json": ".common",
+    "save_json": ".common",
+    "load_yaml": ".common",
+    "save_yaml": ".common",
+    "list_files": ".common",
+    "get_file_size": ".common",
     # 数据工具
-    deep_merge,
-    flatten_dict,
-    clean_text,
-    chunk_list,
-    calculate_md5,
-    calculate_sha256,
-    get_date_range,
+    "deep_merge": ".common",
+    "flatten_dict": ".common",
+    "clean_text": ".common",
+    "chunk_list": ".common",
+    "calculate_md5": ".common",
+    "calculate_sha256": ".common",
+    "get_date_range": ".common",
     # 装饰器
-    retry_on_failure,
-    timing_decorator,
+    "retry_on_failure": ".common",
+    "timing_decorator": ".common",
     # 验证工具
-    is_valid_email,
-    is_valid_url,
+    "is_valid_email": ".common",
+    "is_valid_url": ".common",
     # 其他工具
-    generate_random_string,
-    generate_uuid,
-)
+    "generate_random_string": ".common",
+    "generate_uuid": ".common",
+}
 
 __all__ = [
     # 日志工具
@@ -110,3 +126,18 @@ __all__ = [
     "generate_random_string",
     "generate_uuid",
 ]
+
+
+def __getattr__(name: str):
+    """按需导入导出的名称，并缓存到包命名空间中。"""
+    module_name = _LAZY_MAP.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -4,23 +4,58 @@
 提供内存缓存、文件缓存、Redis缓存等多种缓存策略和装饰器。
 """
 
+import array
+import functools
 import hashlib
 import json
+import os
 import pickle
+import struct
+import tempfile
 import threading
 import time
 import warnings
 from abc import ABC, abstractmethod
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from functools import wraps
 from pathlib import Path
-from typing import Any, Callable, Dict, Generic, List, Optional, TypeVar, Union
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Generic,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+    Union,
+)
 
 from .exceptions import CacheError, CacheKeyError, CacheSerializationError
 
+try:
+    import msgpack
+
+    HAS_MSGPACK = True
+except ImportError:
+    HAS_MSGPACK = False
+
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 T = TypeVar("T")
 F = TypeVar("F", bound=Callable[..., Any])
 
+# 文件缓存头部：过期时间戳（小端double，0表示永不过期）和原始键的字节长度，
+# 其后依次为UTF-8编码的原始键和序列化后的值
+_FILE_HEADER = struct.Struct("<dI")
+
 
 # =============================================================================
 # 缓存接口
@@ -66,6 +101,16 @@ class CacheBackend(ABC, Generic[T]):
 # =============================================================================
 
 
+class _Entry:
+    """内存缓存项，使用__slots__避免每项一个字典的开销"""
+
+    __slots__ = ("expires_at", "value")
+
+    def __init__(self, value: Any, expires_at: Optional[float]):
+        self.value = value
+        self.expires_at = expires_at
+
+
 class MemoryCache(CacheBackend[T]):
     """内存缓存实现"""
 
@@ -81,26 +126,32 @@ class MemoryCache(CacheBackend[T]):
         """
         self.max_size = max_size
         self.default_ttl = default_ttl
-        self._cache: Dict[str, Dict[str, Any]] = {}
-        self._access_times: Dict[str, float] = {}
+        # 按访问顺序排列，最久未使用的项位于头部
+        self._cache: OrderedDict[str, _Entry] = OrderedDict()
         self._lock = threading.RLock()
+        self._hits = 0
+        self._misses = 0
 
     def get(self, key: str) -> Optional[T]:
         """获取缓存值"""
         with self._lock:
-            if key not in self._cache:
+            # 热路径：一次字典查找，过期检查内联，避免额外的方法调用
+            cache_item = self._cache.get(key)
+            if cache_item is None:
+                self._misses += 1
                 return None
 
-            cache_item = self._cache[key]
-
             # 检查是否过期
-            if self._is_expired(cache_item):
-                self.delete(key)
+            expires_at = cache_item.expires_at
+            if expires_at is not None and time.time() > expires_at:
+                del self._cache[key]
+                self._misses += 1
                 return None
 
-            # 更新访问时间
-            self._access_times[key] = time.time()
-            return cache_item["value"]
+            # 标记为最近使用
+            self._cache.move_to_end(key)
+            self._hits += 1
+            return cache_item.value
 
     def set(self, key: str, value: T, ttl=_UNSET) -> None:
         """设置缓存值
@@ -127,19 +178,14 @@ class MemoryCache(CacheBackend[T]):
             # 如果ttl is None，则expires_at保持None，表示不过期
 
             # 存储缓存项
-            self._cache[key] = {
-                "value": value,
-                "created_at": time.time(),
-                "expires_at": expires_at,
-            }
-            self._access_times[key] = time.time()
+            self._cache[key] = _Entry(value, expires_at)
+            self._cache.move_to_end(key)
 
     def delete(self, key: str) -> bool:
         """删除缓存值"""
         with self._lock:
             if key in self._cache:
                 del self._cache[key]
-                self._access_times.pop(key, None)
                 return True
             return False
 
@@ -151,7 +197,7 @@ class MemoryCache(CacheBackend[T]):
 
             cache_item = self._cache[key]
             if self._is_expired(cache_item):
-                self.delete(key)
+                del self._cache[key]
                 return False
 
             return True
@@ -160,19 +206,18 @@ class MemoryCache(CacheBackend[T]):
         """清空缓存"""
         with self._lock:
             self._cache.clear()
-            self._access_times.clear()
 
     def keys(self) -> List[str]:
         """获取所有缓存键"""
         with self._lock:
-            # 清理过期键
-            expired_keys = []
-            for key, cache_item in self._cache.items():
-                if self._is_expired(cache_item):
-                    expired_keys.append(key)
-
+            # 清理过期键（已持有锁，直接从字典移除，不再逐个调用delete）
+            expired_keys = [
+                key
+                for key, cache_item in self._cache.items()
+                if self._is_expired(cache_item)
+            ]
             for key in expired_keys:
-                self.delete(key)
+                del self._cache[key]
 
             return list(self._cache.keys())
 
@@ -182,28 +227,26 @@ class MemoryCache(CacheBackend[T]):
             return {
                 "size": len(self._cache),
                 "max_size": self.max_size,
+                "hits": self._hits,
+                "misses": self._misses,
                 "hit_ratio": self._calculate_hit_ratio(),
                 "keys": list(self._cache.keys()),
             }
 
-    def _is_expired(self, cache_item: Dict[str, Any]) -> bool:
+    def _is_expired(self, cache_item: _Entry) -> bool:
         """检查缓存项是否过期"""
-        expires_at = cache_item.get("expires_at")
+        expires_at = cache_item.expires_at
         return expires_at is not None and time.time() > expires_at
 
     def _evict_lru(self) -> None:
         """驱逐最近最少使用的项"""
-        if not self._access_times:
-            return
-
-        # 找到最久未访问的键
-        lru_key = min(self._access_times.keys(), key=lambda k: self._access_times[k])
-        self.delete(lru_key)
+        if self._cache:
+            self._cache.popitem(last=False)
 
     def _calculate_hit_ratio(self) -> float:
-        """计算命中率（简化实现）"""
-        # 这是一个简化的实现，实际应用中可能需要更复杂的统计
-        return 0.0
+        """计算命中率"""
+        total = self._hits + self._misses
+        return self._hits / total if total else 0.0
 
 
 # =============================================================================
@@ -226,36 +269,52 @@ class FileCache(CacheBackend[T]):
         Args:
             cache_dir: 缓存目录
             default_ttl: 默认过期时间（秒）
-            serializer: 序列化方式 ('pickle', 'json')
+            serializer: 序列化方式 ('pickle', 'json', 'msgpack', 'orjson')
         """
         self.cache_dir = Path(cache_dir)
         self.cache_dir.mkdir(parents=True, exist_ok=True)
         self.default_ttl = default_ttl
         self.serializer = serializer
         self._lock = threading.RLock()
+        # 缓存文件名 -> (过期时间, 原始键, 文件状态)，首次调用keys()时从文件头部构建
+        self._key_index: Optional[Dict[str, Tuple[float, str, os.stat_result]]] = None
 
     def get(self, key: str) -> Optional[T]:
-        """获取缓存值"""
-        with self._lock:
-            cache_file = self._get_cache_file(key)
+        """获取缓存值
 
-            if not cache_file.exists():
-                return None
+        写入通过os.replace原子替换文件，读取时总能看到完整的旧文件或新文件，
+        因此读路径不需要加锁。清理过期或损坏的文件时先确认它仍是读取过的
+        那个文件，避免误删其他进程刚写入的新值。
+        """
+        cache_file = self._get_cache_file(key)
+        file_stat = None
 
-            try:
-                with open(cache_file, "rb") as f:
-                    cache_data = pickle.load(f)
+        try:
+            with open(cache_file, "rb") as f:
+                file_stat = os.fstat(f.fileno())
+                expires_at, stored_key = self._read_header(f)
+                # 过期时无需读取和反序列化值
+                expired = self._is_expired(expires_at)
+                data = b"" if expired else f.read()
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            self._discard(key, cache_file, file_stat)
+            raise CacheSerializationError(f"文件缓存反序列化失败: {e}")
 
-                # 检查是否过期
-                if self._is_expired(cache_data):
-                    cache_file.unlink(missing_ok=True)
-                    return None
+        if stored_key != key:
+            # 文件名摘要冲突，视为未命中
+            return None
 
-                return self._deserialize(cache_data["value"])
+        if expired:
+            self._discard(key, cache_file, file_stat)
+            return None
 
-            except Exception as e:
-                cache_file.unlink(missing_ok=True)
-                raise CacheSerializationError(f"文件缓存反序列化失败: {e}")
+        try:
+            return self._deserialize(data)
+        except Exception as e:
+            self._discard(key, cache_file, file_stat)
+            raise CacheSerializationError(f"文件缓存反序列化失败: {e}")
 
     def set(self, key: str, value: T, ttl: Optional[int] = None) -> None:
         """设置缓存值"""
@@ -263,29 +322,41 @@ class FileCache(CacheBackend[T]):
             cache_file = self._get_cache_file(key)
 
             # 计算过期时间
-            expires_at = None
+            expires_at = 0.0
             if ttl is not None:
                 expires_at = time.time() + ttl
             elif self.default_ttl is not None:
                 expires_at = time.time() + self.default_ttl
 
-            # 序列化数据
-            cache_data = {
-                "value": self._serialize(value),
-                "created_at": time.time(),
-                "expires_at": expires_at,
-            }
-
             try:
-                with open(cache_file, "wb") as f:
-                    pickle.dump(cache_data, f)
+                data = self._serialize(value)
+                key_bytes = key.encode("utf-8")
+                # 先写入唯一的临时文件再原子替换，多进程共享目录时不会读到半个文件
+                fd, tmp_path = tempfile.mkstemp(
+                    dir=self.cache_dir, prefix=cache_file.stem, suffix=".tmp"
+                )
+                try:
+                    with os.fdopen(fd, "wb") as f:
+                        f.write(_FILE_HEADER.pack(expires_at, len(key_bytes)))
+                        f.write(key_bytes)
+                        f.write(data)
+                        f.flush()
+                        file_stat = os.fstat(f.fileno())
+                    os.replace(tmp_path, cache_file)
+                except BaseException:
+                    Path(tmp_path).unlink(missing_ok=True)
+                    raise
             except Exception as e:
                 raise CacheSerializationError(f"文件缓存序列化失败: {e}")
 
+            if self._key_index is not None:
+                self._key_index[cache_file.name] = (expires_at, key, file_stat)
+
     def delete(self, key: str) -> bool:
         """删除缓存值"""
         with self._lock:
             cache_file = self._get_cache_file(key)
+            self._forget(key)
             if cache_file.exists():
                 cache_file.unlink()
                 return True
@@ -293,51 +364,141 @@ class FileCache(CacheBackend[T]):
 
     def exists(self, key: str) -> bool:
         """检查缓存是否存在"""
-        return self.get(key) is not None
+        with self._lock:
+            cache_file = self._get_cache_file(key)
+            header = self._peek_header(cache_file)
+            if header is None or header[1] != key:
+                return False
+            if self._is_expired(header[0]):
+                self._discard(key, cache_file, header[2])
+                return False
+            return True
 
     def clear(self) -> None:
-        """清空缓存"""
+        """清空缓存
+
+        只删除缓存文件而不是整个目录，cache_dir中的其他文件不受影响；
+        os.scandir直接返回目录项，比Path.glob少一次逐项的路径对象构造。
+        """
         with self._lock:
-            for cache_file in self.cache_dir.glob("*.cache"):
-                cache_file.unlink(missing_ok=True)
+            with os.scandir(self.cache_dir) as entries:
+                for entry in entries:
+                    if entry.name.endswith(".cache") and entry.is_file():
+                        try:
+                            os.unlink(entry.path)
+                        except FileNotFoundError:
+                            pass
+            self._key_index = {}
 
     def keys(self) -> List[str]:
-        """获取所有缓存键"""
+        """获取所有缓存键
+
+        每次调用都会列出目录中的缓存文件校正键索引，以感知共享同一目录的
+        其他实例的写入和删除；只有新出现或被替换（inode或修改时间变化）的文件才需要
+        重新读取头部。
+        """
         with self._lock:
-            keys = []
-            for cache_file in self.cache_dir.glob("*.cache"):
-                key = cache_file.stem
-                if self.exists(key):
-                    keys.append(key)
-            return keys
+            self._key_index = self._sync_key_index()
+
+            expired = [
+                (name, header)
+                for name, header in self._key_index.items()
+                if self._is_expired(header[0])
+            ]
+            for name, (_, key, file_stat) in expired:
+                self._discard(key, self.cache_dir / name, file_stat)
+
+            return [key for _, key, _ in self._key_index.values()]
 
     def _get_cache_file(self, key: str) -> Path:
         """获取缓存文件路径"""
-        safe_key = hashlib.md5(key.encode()).hexdigest()
-        return self.cache_dir / f"{safe_key}.cache"
+        return self.cache_dir / f"{_hash_file_key(key)}.cache"
 
     def _serialize(self, value: T) -> bytes:
         """序列化值"""
-        if self.serializer == "pickle":
-            return pickle.dumps(value)
-        elif self.serializer == "json":
-            return json.dumps(value).encode()
-        else:
-            raise CacheSerializationError(f"不支持的序列化方式: {self.serializer}")
+        return _serialize_value(self.serializer, value)
 
     def _deserialize(self, data: bytes) -> T:
         """反序列化值"""
-        if self.serializer == "pickle":
-            return pickle.loads(data)
-        elif self.serializer == "json":
-            return json.loads(data.decode())
-        else:
-            raise CacheSerializationError(f"不支持的序列化方式: {self.serializer}")
-
-    def _is_expired(self, cache_data: Dict[str, Any]) -> bool:
+        return _deserialize_value(self.serializer, data)
+
+    def _is_expired(self, expires_at: float) -> bool:
         """检查缓存项是否过期"""
-        expires_at = cache_data.get("expires_at")
-        return expires_at is not None and time.time() > expires_at
+        return expires_at != 0.0 and time.time() > expires_at
+
+    @staticmethod
+    def _read_header(f) -> Tuple[float, str]:
+        """读取文件头部，返回 (过期时间, 原始键)"""
+        expires_at, key_len = _FILE_HEADER.unpack(f.read(_FILE_HEADER.size))
+        key_bytes = f.read(key_len)
+        if len(key_bytes) != key_len:
+            raise struct.error("缓存文件头部不完整")
+        return expires_at, key_bytes.decode("utf-8")
+
+    def _peek_header(
+        self, cache_file: Path
+    ) -> Optional[Tuple[float, str, os.stat_result]]:
+        """只读取文件头部，返回 (过期时间, 原始键, 文件状态)；
+        文件不存在或已损坏时返回None"""
+        try:
+            with open(cache_file, "rb") as f:
+                file_stat = os.fstat(f.fileno())
+                return (*self._read_header(f), file_stat)
+        except (OSError, struct.error, UnicodeDecodeError):
+            return None
+
+    def _discard(
+        self, key: str, cache_file: Path, file_stat: Optional[os.stat_result]
+    ) -> None:
+        """删除读取过的过期或损坏文件
+
+        读取时不持有锁，其他进程可能已用os.replace写入新文件；
+        只有inode和修改时间都与读取时一致才删除，否则保留新文件。
+        """
+        self._forget(key)
+        if file_stat is None:
+            return
+        try:
+            current = os.stat(cache_file)
+        except FileNotFoundError:
+            return
+        if (current.st_ino, current.st_mtime_ns) == (
+            file_stat.st_ino,
+            file_stat.st_mtime_ns,
+        ):
+            cache_file.unlink(missing_ok=True)
+
+    def _sync_key_index(self) -> Dict[str, Tuple[float, str, os.stat_result]]:
+        """按缓存目录的当前内容校正键索引，从文件头部恢复原始键"""
+        old_index = self._key_index or {}
+        index: Dict[str, Tuple[float, str, os.stat_result]] = {}
+        with os.scandir(self.cache_dir) as entries:
+            for entry in entries:
+                if not entry.name.endswith(".cache") or not entry.is_file():
+                    continue
+                header = old_index.get(entry.name)
+                # inode可能在删除后被复用，需同时比较修改时间
+                if header is not None:
+                    try:
+                        current = entry.stat()
+                    except FileNotFoundError:
+                        continue
+                    if (current.st_ino, current.st_mtime_ns) != (
+                        header[2].st_ino,
+                        header[2].st_mtime_ns,
+                    ):
+                        header = None
+                if header is None:
+                    header = self._peek_header(Path(entry.path))
+                if header is not None:
+                    index[entry.name] = header
+        return index
+
+    def _forget(self, key: str) -> None:
+        """从键索引中移除"""
+        with self._lock:
+            if self._key_index is not None:
+                self._key_index.pop(self._get_cache_file(key).name, None)
 
 
 # =============================================================================
@@ -362,7 +523,7 @@ class RedisCache(CacheBackend[T]):
             redis_client: Redis客户端
             key_prefix: 键前缀
             default_ttl: 默认过期时间（秒）
-            serializer: 序列化方式 ('pickle', 'json')
+            serializer: 序列化方式 ('pickle', 'json', 'msgpack', 'orjson')
         """
         self.redis = redis_client
         self.key_prefix = key_prefix
@@ -445,27 +606,53 @@ class RedisCache(CacheBackend[T]):
         except Exception as e:
             raise CacheError(f"Redis获取键列表失败: {e}")
 
+    def get_many(self, keys: List[str]) -> Dict[str, Optional[T]]:
+        """批量获取缓存值，使用一次MGET往返完成"""
+        if not keys:
+            return {}
+
+        try:
+            full_keys = [self._get_full_key(key) for key in keys]
+            raw_values = self.redis.mget(full_keys)
+            return {
+                key: (self._deserialize(data) if data is not None else None)
+                for key, data in zip(keys, raw_values)
+            }
+
+        except Exception as e:
+            raise CacheError(f"Redis批量获取缓存失败: {e}")
+
+    def set_many(self, mapping: Dict[str, T], ttl: Optional[int] = None) -> None:
+        """批量设置缓存值，通过pipeline一次往返提交"""
+        if not mapping:
+            return
+
+        try:
+            expire_time = ttl or self.default_ttl
+            with self.redis.pipeline() as pipe:
+                for key, value in mapping.items():
+                    full_key = self._get_full_key(key)
+                    serialized_value = self._serialize(value)
+                    if expire_time:
+                        pipe.setex(full_key, expire_time, serialized_value)
+                    else:
+                        pipe.set(full_key, serialized_value)
+                pipe.execute()
+
+        except Exception as e:
+            raise CacheError(f"Redis批量设置缓存失败: {e}")
+
     def _get_full_key(self, key: str) -> str:
         """获取完整的键名"""
         return f"{self.key_prefix}{key}"
 
     def _serialize(self, value: T) -> bytes:
         """序列化值"""
-        if self.serializer == "pickle":
-            return pickle.dumps(value)
-        elif self.serializer == "json":
-            return json.dumps(value).encode()
-        else:
-            raise CacheSerializationError(f"不支持的序列化方式: {self.serializer}")
+        return _serialize_value(self.serializer, value)
 
     def _deserialize(self, data: bytes) -> T:
         """反序列化值"""
-        if self.serializer == "pickle":
-            return pickle.loads(data)
-        elif self.serializer == "json":
-            return json.loads(data.decode())
-        else:
-            raise CacheSerializationError(f"不支持的序列化方式: {self.serializer}")
+        return _deserialize_value(self.serializer, data)
 
 
 # =============================================================================
@@ -476,15 +663,24 @@ class RedisCache(CacheBackend[T]):
 class MultiLevelCache(CacheBackend[T]):
     """多层缓存实现"""
 
-    def __init__(self, caches: List[CacheBackend[T]]):
+    def __init__(self, caches: List[CacheBackend[T]], async_writeback: bool = False):
         """
         初始化多层缓存
 
         Args:
             caches: 缓存后端列表，按优先级排序
+            async_writeback: 是否在后台线程中完成回写。开启后命中低层缓存时立即返回，
+                回写到高层缓存以及set()对第一层之外的写入交给线程池异步执行；
+                代价是写入短暂不可见，且与随后的delete()之间没有顺序保证
         """
         self.caches = caches
+        self.async_writeback = async_writeback
         self._lock = threading.RLock()
+        self._writeback: Optional[ThreadPoolExecutor] = (
+            ThreadPoolExecutor(max_workers=2, thread_name_prefix="cache-writeback")
+            if async_writeback
+            else None
+        )
 
     def get(self, key: str) -> Optional[T]:
         """获取缓存值"""
@@ -495,10 +691,7 @@ class MultiLevelCache(CacheBackend[T]):
                     if value is not None:
                         # 将值回写到更高层级的缓存
                         for j in range(i):
-                            try:
-                                self.caches[j].set(key, value)
-                            except Exception:
-                                pass
+                            self._write(self.caches[j].set, key, value)
                         return value
                 except Exception:
                     continue
@@ -507,12 +700,49 @@ class MultiLevelCache(CacheBackend[T]):
     def set(self, key: str, value: T, ttl: Optional[int] = None) -> None:
         """设置缓存值"""
         with self._lock:
-            for cache in self.caches:
+            for i, cache in enumerate(self.caches):
+                self._write(cache.set, key, value, ttl, background=i > 0)
+
+    def get_many(self, keys: List[str]) -> Dict[str, Optional[T]]:
+        """批量获取缓存值
+
+        逐层只查询仍未命中的键，支持批量接口的后端（如RedisCache）一次往返完成，
+        命中的值批量回写到更高层级的缓存。
+        """
+        with self._lock:
+            results: Dict[str, Optional[T]] = dict.fromkeys(keys)
+            missing = list(results)
+
+            for i, cache in enumerate(self.caches):
+                if not missing:
+                    break
                 try:
-                    cache.set(key, value, ttl)
+                    found = {
+                        key: value
+                        for key, value in _cache_get_many(cache, missing).items()
+                        if value is not None
+                    }
                 except Exception:
                     continue
 
+                if not found:
+                    continue
+
+                results.update(found)
+                missing = [key for key in missing if key not in found]
+
+                # 将值回写到更高层级的缓存
+                for j in range(i):
+                    self._write(_cache_set_many, self.caches[j], found)
+
+            return results
+
+    def set_many(self, mapping: Dict[str, T], ttl: Optional[int] = None) -> None:
+        """批量设置缓存值"""
+        with self._lock:
+            for i, cache in enumerate(self.caches):
+                self._write(_cache_set_many, cache, mapping, ttl, background=i > 0)
+
     def delete(self, key: str) -> bool:
         """删除缓存值"""
         with self._lock:
@@ -548,12 +778,37 @@ class MultiLevelCache(CacheBackend[T]):
                 continue
         return list(all_keys)
 
+    def close(self) -> None:
+        """等待所有后台回写完成并关闭线程池"""
+        if self._writeback is not None:
+            self._writeback.shutdown(wait=True)
+
+    def __del__(self):
+        writeback = getattr(self, "_writeback", None)
+        if writeback is not None:
+            writeback.shutdown(wait=False)
+
+    def _write(self, func: Callable, *args, background: bool = True) -> None:
+        """执行写操作，开启async_writeback时提交到后台线程；写入失败会被忽略"""
+        if background and self._writeback is not None:
+            self._writeback.submit(func, *args)
+            return
+        try:
+            func(*args)
+        except Exception:
+            pass
+
 
 # =============================================================================
 # 缓存管理器
 # =============================================================================
 
 
+# CacheManager统计计数器在数组中的下标
+_STAT_HITS, _STAT_MISSES, _STAT_SETS, _STAT_DELETES = range(4)
+_STAT_NAMES = ("hits", "misses", "sets", "deletes")
+
+
 class CacheManager:
     """缓存管理器"""
 
@@ -566,7 +821,8 @@ class CacheManager:
         """
         self.default_backend = default_backend or MemoryCache()
         self.backends: Dict[str, CacheBackend] = {}
-        self._stats = {"hits": 0, "misses": 0, "sets": 0, "deletes": 0}
+        # 定长无符号整数数组，按下标计数，免去字符串键的字典查找
+        self._stats = array.array("Q", [0] * len(_STAT_NAMES))
 
     def register_backend(self, name: str, backend: CacheBackend) -> None:
         """注册缓存后端"""
@@ -589,14 +845,14 @@ class CacheManager:
             value = cache.get(key)
 
             if value is not None:
-                self._stats["hits"] += 1
+                self._stats[_STAT_HITS] += 1
             else:
-                self._stats["misses"] += 1
+                self._stats[_STAT_MISSES] += 1
 
             return value
 
         except Exception as e:
-            self._stats["misses"] += 1
+            self._stats[_STAT_MISSES] += 1
             raise CacheError(f"获取缓存失败: {e}")
 
     def set(
@@ -610,7 +866,7 @@ class CacheManager:
         try:
             cache = self.get_backend(backend)
             cache.set(key, value, ttl)
-            self._stats["sets"] += 1
+            self._stats[_STAT_SETS] += 1
 
         except Exception as e:
             raise CacheError(f"设置缓存失败: {e}")
@@ -621,7 +877,7 @@ class CacheManager:
             cache = self.get_backend(backend)
             result = cache.delete(key)
             if result:
-                self._stats["deletes"] += 1
+                self._stats[_STAT_DELETES] += 1
             return result
 
         except Exception as e:
@@ -638,11 +894,11 @@ class CacheManager:
 
     def stats(self) -> Dict[str, Any]:
         """获取统计信息"""
-        return self._stats.copy()
+        return dict(zip(_STAT_NAMES, self._stats))
 
     def reset_stats(self) -> None:
         """重置统计信息"""
-        self._stats = {"hits": 0, "misses": 0, "sets": 0, "deletes": 0}
+        self._stats = array.array("Q", [0] * len(_STAT_NAMES))
 
 
 # =============================================================================
@@ -670,31 +926,45 @@ def cache_result(
     """
 
     def decorator(func: F) -> F:
-        manager = cache_manager or _get_global_cache_manager()
-
         @wraps(func)
         def wrapper(*args, **kwargs):
+            # 未指定管理器时跟随当前全局管理器（init_cache_manager替换后立即生效）
+            manager = (
+                cache_manager or _global_cache_manager or _get_global_cache_manager()
+            )
+
             # 生成缓存键
             if key_func:
                 cache_key = key_func(*args, **kwargs)
             else:
                 cache_key = _generate_cache_key(func, args, kwargs)
 
+            # 直接访问后端，省去CacheManager.get/set的查找和异常包装，统计口径保持一致
+            if backend is None:
+                cache = manager.default_backend
+            else:
+                cache = manager.backends.get(backend)
+
             # 尝试从缓存获取
-            try:
-                cached_value = manager.get(cache_key, backend)
+            if cache is not None:
+                try:
+                    cached_value = cache.get(cache_key)
+                except Exception:
+                    cached_value = None
                 if cached_value is not None:
+                    manager._stats[_STAT_HITS] += 1
                     return cached_value
-            except Exception:
-                pass
+            manager._stats[_STAT_MISSES] += 1
 
             # 执行函数并缓存结果
             result = func(*args, **kwargs)
 
-            try:
-                manager.set(cache_key, result, ttl, backend)
-            except Exception:
-                pass
+            if cache is not None:
+                try:
+                    cache.set(cache_key, result, ttl)
+                    manager._stats[_STAT_SETS] += 1
+                except Exception:
+                    pass
 
             return result
 
@@ -716,38 +986,21 @@ def timed_cache(ttl: int):
     return cache_result(ttl=ttl)
 
 
-def lru_cache(maxsize: int = 128):
+def lru_cache(maxsize: int = 128, typed: bool = False):
     """
     LRU缓存装饰器
 
+    直接使用标准库的functools.lru_cache，缓存查找在C层完成，
+    以参数元组本身作为键，因此参数必须可哈希。
+
     Args:
         maxsize: 最大缓存数量
+        typed: 是否区分不同类型的相等参数（如1和1.0）
 
     Returns:
         装饰器函数
     """
-
-    def decorator(func: F) -> F:
-        cache = MemoryCache(max_size=maxsize)
-
-        @wraps(func)
-        def wrapper(*args, **kwargs):
-            cache_key = _generate_cache_key(func, args, kwargs)
-
-            # 尝试从缓存获取
-            cached_value = cache.get(cache_key)
-            if cached_value is not None:
-                return cached_value
-
-            # 执行函数并缓存结果
-            result = func(*args, **kwargs)
-            cache.set(cache_key, result)
-
-            return result
-
-        return wrapper
-
-    return decorator
+    return functools.lru_cache(maxsize=maxsize, typed=typed)
 
 
 # =============================================================================
@@ -756,20 +1009,112 @@ def lru_cache(maxsize: int = 128):
 
 
 def _generate_cache_key(func: Callable, args: tuple, kwargs: dict) -> str:
-    """生成缓存键"""
-    key_parts = [func.__module__, func.__name__]
+    """生成缓存键
+
+    键由参数内容决定而不是hash()：hash(-1) == hash(-2)，且字符串哈希随进程变化，
+    不能用于文件/Redis等跨进程共享的后端。
+    """
+    key_string = _func_key_prefix(func)
 
     # 添加位置参数
     if args:
-        key_parts.append(str(args))
+        key_string += f"|{args}"
 
     # 添加关键字参数
     if kwargs:
-        sorted_kwargs = sorted(kwargs.items())
-        key_parts.append(str(sorted_kwargs))
+        key_string += f"|{sorted(kwargs.items())}"
+
+    return hashlib.blake2b(key_string.encode(), digest_size=16).hexdigest()
+
+
+@functools.lru_cache(maxsize=1024)
+def _func_key_prefix(func: Callable) -> str:
+    """缓存每个函数的键前缀，避免每次调用都读取__module__/__name__"""
+    return f"{func.__module__}|{func.__name__}"
+
+
+# pickle序列化器对bytes/str的快速路径：一个类型标记字节加原始内容，不经过pickle。
+# pickle协议2及以上的数据总以0x80开头，不会与这两个标记冲突，旧数据仍可读取
+_TAG_BYTES = b"\x00"
+_TAG_STR = b"\x01"
+
+
+def _serialize_value(serializer: str, value: Any) -> bytes:
+    """按指定方式序列化缓存值"""
+    if serializer == "pickle":
+        # 只匹配精确类型：子类（如StrEnum）和bytearray经pickle保留原类型
+        value_type = type(value)
+        if value_type is bytes:
+            return _TAG_BYTES + value
+        if value_type is str:
+            return _TAG_STR + value.encode("utf-8")
+        return pickle.dumps(value)
+    elif serializer == "json":
+        return json.dumps(value).encode()
+    elif serializer == "msgpack":
+        if not HAS_MSGPACK:
+            raise CacheSerializationError("需要安装msgpack: pip install msgpack")
+        return msgpack.packb(value, use_bin_type=True)
+    elif serializer == "orjson":
+        if not HAS_ORJSON:
+            raise CacheSerializationError("需要安装orjson: pip install orjson")
+        return orjson.dumps(value)
+    else:
+        raise CacheSerializationError(f"不支持的序列化方式: {serializer}")
+
+
+def _deserialize_value(serializer: str, data: bytes) -> Any:
+    """按指定方式反序列化缓存值"""
+    if serializer == "pickle":
+        tag = data[:1]
+        if tag == _TAG_BYTES:
+            return bytes(data[1:])
+        if tag == _TAG_STR:
+            return data[1:].decode("utf-8")
+        return pickle.loads(data)
+    elif serializer == "json":
+        return json.loads(data.decode())
+    elif serializer == "msgpack":
+        if not HAS_MSGPACK:
+            raise CacheSerializationError("需要安装msgpack: pip install msgpack")
+        return msgpack.unpackb(data, raw=False)
+    elif serializer == "orjson":
+        if not HAS_ORJSON:
+            raise CacheSerializationError("需要安装orjson: pip install orjson")
+        return orjson.loads(data)
+    else:
+        raise CacheSerializationError(f"不支持的序列化方式: {serializer}")
+
+
+def _cache_get_many(cache: CacheBackend, keys: List[str]) -> Dict[str, Any]:
+    """批量获取，后端没有get_many时退化为逐个get"""
+    get_many = getattr(cache, "get_many", None)
+    if get_many is not None:
+        return get_many(keys)
+    return {key: cache.get(key) for key in keys}
+
+
+def _cache_set_many(cache: CacheBackend, mapping: Dict[str, Any], *ttl_args) -> None:
+    """批量设置，后端没有set_many时退化为逐个set
+
+    ttl_args为可选的ttl参数，省略时使用后端自身的默认过期时间。
+    """
+    set_many = getattr(cache, "set_many", None)
+    if set_many is not None:
+        set_many(mapping, *ttl_args)
+        return
+    for key, value in mapping.items():
+        cache.set(key, value, *ttl_args)
+
 
-    key_string = "|".join(key_parts)
-    return hashlib.md5(key_string.encode()).hexdigest()
+@functools.lru_cache(maxsize=4096)
+def _hash_file_key(key: str) -> str:
+    """将缓存键转换为文件名安全的摘要
+
+    摘要只用于区分文件名而非安全用途，BLAKE2b比MD5更快；
+    结果按键缓存，重复访问同一个键时无需再次计算。
+    """
+    return hashlib.blake2b(key.encode("utf-8"), digest_size=16).hexdigest()
 
 
 def _get_global_cache_manager() -> CacheManager:
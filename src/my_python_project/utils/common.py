@@ -4,22 +4,31 @@
 提供日常开发中常用的工具函数，包括时间处理、字符串工具、文件操作、数据结构操作等。
 """
 
+import fnmatch
 import functools
 import hashlib
 import json
 import os
 import re
+import shutil
 import time
 import unicodedata
 import warnings
 from datetime import datetime, timedelta, timezone
-from decimal import Decimal
+from decimal import Decimal, InvalidOperation
 from pathlib import Path
 from typing import Any, Callable, Dict, List, Optional, Tuple, TypeVar, Union
 
 T = TypeVar("T")
 F = TypeVar("F", bound=Callable[..., Any])
 
+# 预编译的正则表达式
+_UNSAFE_FILENAME_RE = re.compile(r'[<>:"/\\|?*]')
+_SLUG_RE = re.compile(r"[^a-z0-9]+")
+_NUMBER_RE = re.compile(r"\d+\.?\d*")
+_EMAIL_RE = re.compile(r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$")
+_URL_RE = re.compile(r"^https?://[^\s/$.?#].[^\s]*$")
+
 
 # =============================================================================
 # 时间处理工具
@@ -54,6 +63,14 @@ def format_datetime(
     return dt.strftime(fmt)
 
 
+# 可用fromisoformat解析的格式及其日期与时间之间的分隔符（纯日期为空串）
+_ISO_DATETIME_FORMATS = {
+    "%Y-%m-%d": "",
+    "%Y-%m-%d %H:%M:%S": " ",
+    "%Y-%m-%dT%H:%M:%S": "T",
+}
+
+
 def parse_datetime(date_str: str, fmt: str = "%Y-%m-%d %H:%M:%S") -> datetime:
     """
     解析日期时间字符串
@@ -65,6 +82,22 @@ def parse_datetime(date_str: str, fmt: str = "%Y-%m-%d %H:%M:%S") -> datetime:
     Returns:
         解析后的日期时间对象
     """
+    # 常用ISO格式走C实现的fromisoformat；先校验长度和分隔符位置，
+    # 避免接受strptime会拒绝的写法（如带时区、ISO周日期）
+    separator = _ISO_DATETIME_FORMATS.get(fmt)
+    if (
+        separator is not None
+        and len(date_str) == (10 if separator == "" else 19)
+        and date_str[4] == date_str[7] == "-"
+        and (
+            separator == ""
+            or (date_str[10] == separator and date_str[13] == date_str[16] == ":")
+        )
+    ):
+        try:
+            return datetime.fromisoformat(date_str)
+        except ValueError:
+            pass
     return datetime.strptime(date_str, fmt)
 
 
@@ -121,8 +154,7 @@ def safe_filename(filename: str, replacement: str = "_") -> str:
     filename = "".join(c for c in filename if ord(c) >= 32)
 
     # 替换不安全字符
-    unsafe_chars = r'[<>:"/\\|?*]'
-    filename = re.sub(unsafe_chars, replacement, filename)
+    filename = _UNSAFE_FILENAME_RE.sub(replacement, filename)
 
     # 移除开头和结尾的点和空格
     filename = filename.strip(". ")
@@ -148,12 +180,10 @@ def slugify(text: str, separator: str = "-") -> str:
     """
     # 规范化unicode
     text = unicodedata.normalize("NFKD", text)
-    # 转换为ASCII
-    text = text.encode("ascii", "ignore").decode("ascii")
-    # 转换为小写
-    text = text.lower()
+    # 转换为ASCII并在bytes上转小写（纯ASCII，省去对str的一次完整遍历）
+    text = text.encode("ascii", "ignore").lower().decode("ascii")
     # 替换非字母数字字符
-    text = re.sub(r"[^a-z0-9]+", separator, text)
+    text = _SLUG_RE.sub(separator, text)
     # 移除开头和结尾的分隔符
     text = text.strip(separator)
     return text
@@ -182,12 +212,13 @@ def truncate_string(text: str, max_length: int, suffix: str = "...") -> str:
 
 def clean_whitespace(text: str) -> str:
     """清理多余的空白字符"""
-    return re.sub(r"\s+", " ", text.strip())
+    # str.split()按任意空白切分并丢弃首尾空白，一次C层扫描完成
+    return " ".join(text.split())
 
 
 def extract_numbers(text: str) -> List[str]:
     """从字符串中提取所有数字"""
-    return re.findall(r"\d+\.?\d*", text)
+    return _NUMBER_RE.findall(text)
 
 
 def mask_sensitive_data(text: str, mask_char: str = "*", show_chars: int = 4) -> str:
@@ -202,10 +233,15 @@ def mask_sensitive_data(text: str, mask_char: str = "*", show_chars: int = 4) ->
     Returns:
         掩码后的文本
     """
-    if len(text) <= show_chars:
-        return mask_char * len(text)
+    length = len(text)
+    if length <= show_chars:
+        return mask_char * length
 
-    return text[:show_chars] + mask_char * (len(text) - show_chars)
+    # 单字符掩码用ljust一次分配出结果，省去中间的掩码字符串和拼接
+    if len(mask_char) == 1 and show_chars >= 0:
+        return text[:show_chars].ljust(length, mask_char)
+
+    return text[:show_chars] + mask_char * (length - show_chars)
 
 
 # =============================================================================
@@ -254,17 +290,44 @@ def safe_write_file(
         backup: 是否创建备份
     """
     file_path = Path(file_path)
+    # 符号链接写入其指向的文件，与直接写入时行为一致
+    target_path = Path(os.path.realpath(file_path))
+
+    try:
+        original_mode = target_path.stat().st_mode
+    except FileNotFoundError:
+        original_mode = None
 
-    # 创建备份
-    if backup and file_path.exists():
+    # 创建备份：新内容通过替换写入，原文件inode不变，可直接硬链接
+    if backup and original_mode is not None:
         backup_path = file_path.with_suffix(file_path.suffix + ".bak")
-        backup_path.write_bytes(file_path.read_bytes())
+        backup_path.unlink(missing_ok=True)
+        try:
+            os.link(target_path, backup_path)
+        except OSError:
+            shutil.copyfile(target_path, backup_path)
 
     # 确保目录存在
-    file_path.parent.mkdir(parents=True, exist_ok=True)
+    target_path.parent.mkdir(parents=True, exist_ok=True)
+
+    # 先写临时文件再原子替换，避免写入中断留下不完整的文件
+    tmp_path = target_path.with_name(f".{target_path.name}.{os.urandom(4).hex()}.tmp")
+    try:
+        with open(tmp_path, "x", encoding=encoding) as f:
+            f.write(content)
+        if original_mode is not None:
+            os.chmod(tmp_path, original_mode & 0o7777)
+        os.replace(tmp_path, target_path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
 
-    # 写入文件
-    file_path.write_text(content, encoding=encoding)
+
+# 文件哈希仅用于校验，不用于安全场景
+_HASH_CTORS = {
+    name: functools.partial(getattr(hashlib, name), usedforsecurity=False)
+    for name in ("md5", "sha1", "sha256", "sha512")
+}
 
 
 def get_file_hash(file_path: Union[str, Path], algorithm: str = "sha256") -> str:
@@ -278,13 +341,12 @@ def get_file_hash(file_path: Union[str, Path], algorithm: str = "sha256") -> str
     Returns:
         文件哈希值
     """
-    hasher = hashlib.new(algorithm)
+    # 常用算法直接使用构造函数，其余仍按名称交给hashlib.new解析
+    digest = _HASH_CTORS.get(algorithm, algorithm)
 
+    # file_digest在C层以大块读取并直接交给OpenSSL，无需Python循环逐块update
     with open(file_path, "rb") as f:
-        for chunk in iter(lambda: f.read(4096), b""):
-            hasher.update(chunk)
-
-    return hasher.hexdigest()
+        return hashlib.file_digest(f, digest).hexdigest()
 
 
 def find_files(
@@ -301,12 +363,39 @@ def find_files(
     Returns:
         匹配的文件列表
     """
+    return list(_scan_tree(directory, pattern, recursive))
+
+
+def _scan_tree(directory: Union[str, Path], pattern: str, recursive: bool):
+    """
+    按文件名模式遍历目录，结果与 Path.glob/rglob 一致
+
+    使用 os.scandir 直接读取目录项，只为匹配结果创建 Path 对象。
+    模式中包含路径分隔符或 ``**`` 时交给 pathlib 处理。
+    """
     directory = Path(directory)
 
-    if recursive:
-        return list(directory.rglob(pattern))
-    else:
-        return list(directory.glob(pattern))
+    if not pattern or "/" in pattern or os.sep in pattern or "**" in pattern:
+        yield from (directory.rglob(pattern) if recursive else directory.glob(pattern))
+        return
+
+    flags = re.IGNORECASE if os.name == "nt" else 0
+    match = re.compile(fnmatch.translate(pattern), flags).match
+
+    # 与rglob相同：先输出当前目录的匹配项，再按顺序深入子目录（不跟随符号链接）
+    stack = [os.fspath(directory)]
+    while stack:
+        subdirs = []
+        try:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    if match(entry.name):
+                        yield Path(entry.path)
+                    if recursive and entry.is_dir(follow_symlinks=False):
+                        subdirs.append(entry.path)
+        except OSError:
+            continue
+        stack.extend(reversed(subdirs))
 
 
 # =============================================================================
@@ -326,12 +415,19 @@ def deep_merge(dict1: Dict[str, Any], dict2: Dict[str, Any]) -> Dict[str, Any]:
         合并后的字典
     """
     result = dict1.copy()
-
-    for key, value in dict2.items():
-        if key in result and isinstance(result[key], dict) and isinstance(value, dict):
-            result[key] = deep_merge(result[key], value)
-        else:
-            result[key] = value
+    # 显式栈代替递归，只复制实际发生合并的子字典
+    stack = [(result, dict2)]
+
+    while stack:
+        dst, src = stack.pop()
+        for key, value in src.items():
+            current = dst.get(key)
+            if isinstance(current, dict) and isinstance(value, dict):
+                merged = current.copy()
+                dst[key] = merged
+                stack.append((merged, value))
+            else:
+                dst[key] = value
 
     return result
 
@@ -351,12 +447,20 @@ def flatten_dict(
         扁平化后的字典
     """
     items = []
-    for key, value in d.items():
-        new_key = f"{parent_key}{sep}{key}" if parent_key else key
-        if isinstance(value, dict):
-            items.extend(flatten_dict(value, new_key, sep=sep).items())
-        else:
+    # 栈中保存 (前缀, 迭代器)，深度优先遍历以保持原有键顺序
+    stack = [(parent_key, iter(d.items()))]
+
+    while stack:
+        prefix, it = stack[-1]
+        for key, value in it:
+            new_key = f"{prefix}{sep}{key}" if prefix else key
+            if isinstance(value, dict):
+                stack.append((new_key, iter(value.items())))
+                break
             items.append((new_key, value))
+        else:
+            stack.pop()
+
     return dict(items)
 
 
@@ -394,15 +498,27 @@ def remove_none_values(d: Dict[str, Any], recursive: bool = True) -> Dict[str, A
     Returns:
         清理后的字典
     """
+    if not recursive:
+        return {key: value for key, value in d.items() if value is not None}
+
     result = {}
-    for key, value in d.items():
-        if value is not None:
-            if recursive and isinstance(value, dict):
-                cleaned = remove_none_values(value, recursive)
-                if cleaned:
-                    result[key] = cleaned
-            else:
-                result[key] = value
+    # 栈中保存 (迭代器, 当前结果, 父结果, 键)，子字典处理完且非空时才挂到父结果上
+    stack = [(iter(d.items()), result, None, None)]
+
+    while stack:
+        it, current, parent, parent_key = stack[-1]
+        for key, value in it:
+            if value is None:
+                continue
+            if isinstance(value, dict):
+                stack.append((iter(value.items()), {}, current, key))
+                break
+            current[key] = value
+        else:
+            stack.pop()
+            if parent is not None and current:
+                parent[parent_key] = current
+
     return result
 
 
@@ -417,11 +533,15 @@ def unique_list(lst: List[T], key: Optional[Callable[[T], Any]] = None) -> List[
     Returns:
         去重后的列表
     """
+    if key is None:
+        # dict保持插入顺序，去重完全在C层完成
+        return list(dict.fromkeys(lst))
+
     seen = set()
     result = []
 
     for item in lst:
-        k = key(item) if key else item
+        k = key(item)
         if k not in seen:
             seen.add(k)
             result.append(item)
@@ -452,9 +572,16 @@ def safe_float(value: Any, default: float = 0.0) -> float:
 
 def safe_decimal(value: Any, default: Optional[Decimal] = None) -> Decimal:
     """安全转换为Decimal"""
+    # Decimal不可变可直接返回；int可精确转换，无需经过str（bool除外，保持原有行为）
+    value_type = type(value)
+    if value_type is Decimal:
+        return value
+    if value_type is int:
+        return Decimal(value)
+
     try:
         return Decimal(str(value))
-    except (ValueError, TypeError):
+    except (ValueError, TypeError, InvalidOperation):
         return default or Decimal("0")
 
 
@@ -463,6 +590,11 @@ def format_number(number: Union[int, float], precision: int = 2) -> str:
     return f"{number:,.{precision}f}"
 
 
+_BYTE_UNITS = ("B", "KB", "MB", "GB", "TB", "PB")
+_BYTE_SHIFTS = tuple(1 << (10 * i) for i in range(len(_BYTE_UNITS)))
+_BYTE_UNIT_SIZES = dict(zip(_BYTE_UNITS[:-1], _BYTE_SHIFTS[:-1]))
+
+
 def format_bytes(bytes_count: int, unit: str = "auto") -> str:
     """
     格式化字节数
@@ -475,16 +607,20 @@ def format_bytes(bytes_count: int, unit: str = "auto") -> str:
         格式化后的字符串
     """
     if unit != "auto":
-        units = {"B": 1, "KB": 1024, "MB": 1024**2, "GB": 1024**3, "TB": 1024**4}
-        if unit in units:
-            return f"{bytes_count / units[unit]:.2f} {unit}"
+        size = _BYTE_UNIT_SIZES.get(unit)
+        if size is not None:
+            return f"{bytes_count / size:.2f} {unit}"
 
-    for unit in ["B", "KB", "MB", "GB", "TB"]:
-        if bytes_count < 1024.0:
-            return f"{bytes_count:.2f} {unit}"
-        bytes_count /= 1024.0
+    # 每个单位相差2**10，由整数位数直接算出单位下标
+    if bytes_count < 1024:
+        index = 0
+    else:
+        try:
+            index = min((int(bytes_count).bit_length() - 1) // 10, 5)
+        except (OverflowError, ValueError):
+            index = 5
 
-    return f"{bytes_count:.2f} PB"
+    return f"{bytes_count / _BYTE_SHIFTS[index]:.2f} {_BYTE_UNITS[index]}"
 
 
 # =============================================================================
@@ -591,14 +727,12 @@ def generate_random_string(
 
 def is_valid_email(email: str) -> bool:
     """验证邮箱格式"""
-    pattern = r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$"
-    return bool(re.match(pattern, email))
+    return bool(_EMAIL_RE.match(email))
 
 
 def is_valid_url(url: str) -> bool:
     """验证URL格式"""
-    pattern = r"^https?://[^\s/$.?#].[^\s]*$"
-    return bool(re.match(pattern, url))
+    return bool(_URL_RE.match(url))
 
 
 def get_object_size(obj: Any) -> int:
@@ -608,9 +742,46 @@ def get_object_size(obj: Any) -> int:
     return sys.getsizeof(obj)
 
 
+_PLAIN_ATOMS = frozenset((str, int, float, bool, bytes, type(None)))
+_PLAIN_CONTAINERS = frozenset((dict, list, tuple, set))
+
+
+def _is_plain_tree(obj: Any) -> bool:
+    """检查对象是否只由内置容器和基本类型组成（不含任何自定义类型）"""
+    stack = [obj]
+    seen = set()
+    while stack:
+        node = stack.pop()
+        node_type = type(node)
+        if node_type in _PLAIN_ATOMS:
+            continue
+        if node_type not in _PLAIN_CONTAINERS:
+            return False
+        # 共享或循环引用的容器只检查一次
+        if id(node) in seen:
+            continue
+        seen.add(id(node))
+        if node_type is dict:
+            stack.extend(node.keys())
+            stack.extend(node.values())
+        else:
+            stack.extend(node)
+    return True
+
+
 def deep_copy(obj: Any) -> Any:
-    """深度拷贝对象"""
+    """
+    深度拷贝对象
+
+    只由内置容器（dict/list/tuple/set）和基本类型组成的对象通过pickle往返拷贝，
+    比copy.deepcopy更快；包含其他类型时使用copy.deepcopy，
+    以保留嵌套对象自定义的__deepcopy__行为。
+    """
     import copy
+    import pickle
+
+    if type(obj) in _PLAIN_CONTAINERS and _is_plain_tree(obj):
+        return pickle.loads(pickle.dumps(obj, pickle.HIGHEST_PROTOCOL))
 
     return copy.deepcopy(obj)
 
@@ -707,11 +878,7 @@ def list_files(
     directory: Union[str, Path], pattern: str = "*", recursive: bool = False
 ) -> List[Path]:
     """列出目录中符合模式的所有文件"""
-    path = Path(directory)
-    if recursive:
-        return list(path.rglob(pattern))
-    else:
-        return list(path.glob(pattern))
+    return list(_scan_tree(directory, pattern, recursive))
 
 
 # =============================================================================
@@ -719,26 +886,30 @@ def list_files(
 # =============================================================================
 
 
-def calculate_md5(data: Union[str, bytes]) -> str:
-    """计算MD5哈希值"""
+def calculate_md5(data: Union[str, bytes, bytearray, memoryview]) -> str:
+    """计算MD5哈希值（仅用于校验，不用于安全场景）
+
+    bytes/bytearray/memoryview/mmap等缓冲区对象直接哈希，不会复制数据。
+    """
     if isinstance(data, str):
         data = data.encode("utf-8")
-    return hashlib.md5(data).hexdigest()
+    return hashlib.md5(data, usedforsecurity=False).hexdigest()
 
 
-def calculate_sha256(data: Union[str, bytes]) -> str:
-    """计算SHA256哈希值"""
+def calculate_sha256(data: Union[str, bytes, bytearray, memoryview]) -> str:
+    """计算SHA256哈希值（仅用于校验，不用于安全场景）
+
+    bytes/bytearray/memoryview/mmap等缓冲区对象直接哈希，不会复制数据。
+    """
     if isinstance(data, str):
         data = data.encode("utf-8")
-    return hashlib.sha256(data).hexdigest()
+    return hashlib.sha256(data, usedforsecurity=False).hexdigest()
 
 
 def clean_text(text: str) -> str:
     """清理文本，移除多余空白和特殊字符"""
-    # 替换多个空白为单个空格
-    text = re.sub(r"\s+", " ", text)
-    # 移除首尾空白
-    return text.strip()
+    # 合并连续空白为单个空格并移除首尾空白
+    return " ".join(text.split())
 
 
 def chunk_list(lst: List[Any], chunk_size: int) -> List[List[Any]]:
@@ -746,6 +917,16 @@ def chunk_list(lst: List[Any], chunk_size: int) -> List[List[Any]]:
     return [lst[i : i + chunk_size] for i in range(0, len(lst), chunk_size)]
 
 
+@functools.cache
+def _get_numpy() -> Any:
+    """按需导入NumPy（可选依赖），不可用时返回None"""
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+
 def get_date_range(
     start_date: Union[str, datetime],
     end_date: Union[str, datetime],
@@ -753,9 +934,27 @@ def get_date_range(
 ) -> List[str]:
     """获取日期范围内的所有日期"""
     if isinstance(start_date, str):
-        start_date = datetime.strptime(start_date, date_format)
+        start_date = parse_datetime(start_date, date_format)
     if isinstance(end_date, str):
-        end_date = datetime.strptime(end_date, date_format)
+        end_date = parse_datetime(end_date, date_format)
+
+    # 默认格式且均为零点的naive日期时，用NumPy向量化生成（datetime64[D]转字符串即为YYYY-MM-DD）；
+    # 先做廉价的条件判断，用不上向量化的调用不必导入NumPy
+    if (
+        date_format == "%Y-%m-%d"
+        and start_date.tzinfo is None
+        and end_date.tzinfo is None
+        and start_date.time() == end_date.time() == datetime.min.time()
+    ):
+        np = _get_numpy()
+        if np is not None:
+            if start_date > end_date:
+                return []
+            dates = np.arange(
+                np.datetime64(start_date.date(), "D"),
+                np.datetime64(end_date.date(), "D") + np.timedelta64(1, "D"),
+            )
+            return dates.astype(str).tolist()
 
     date_list = []
     curr_date = start_date
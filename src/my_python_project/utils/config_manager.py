@@ -4,38 +4,186 @@
 支持多种配置文件格式，环境变量覆盖，配置验证等功能。
 """
 
+import functools
+import io
 import json
 import os
+import shutil
+import sys
+import threading
+import time
 import warnings
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional, Type, TypeVar, Union
+from types import MappingProxyType
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Literal,
+    Mapping,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+    overload,
+)
 
 try:
-    import yaml
+    import orjson
 
-    HAS_YAML = True
+    HAS_ORJSON = True
 except ImportError:
-    HAS_YAML = False
-    warnings.warn("PyYAML not installed, YAML support disabled", stacklevel=2)
+    HAS_ORJSON = False
 
 try:
-    import tomllib
+    import ijson
 
-    HAS_TOML = True
+    HAS_IJSON = True
 except ImportError:
+    HAS_IJSON = False
+
+from .common import deep_copy
+from .exceptions import ConfigError
+
+T = TypeVar("T")
+
+_MISSING = object()  # 哨兵值，区分键不存在和值为None
+
+# 环境变量值类型转换用到的常量
+_ENV_TRUE = frozenset(("true", "yes", "1", "on"))
+_ENV_FALSE = frozenset(("false", "no", "0", "off"))
+_JSON_STARTS = ("{", "[", '"')
+
+
+@functools.cache
+def _get_yaml() -> Any:
+    """首次使用YAML时才导入PyYAML，不可用时返回None"""
     try:
-        import tomli as tomllib
+        import yaml
+    except ImportError:
+        warnings.warn("PyYAML not installed, YAML support disabled", stacklevel=2)
+        return None
+    return yaml
 
-        HAS_TOML = True
+
+@functools.cache
+def _get_toml() -> Any:
+    """首次使用TOML时才导入tomllib/tomli，不可用时返回None"""
+    try:
+        import tomllib
     except ImportError:
-        HAS_TOML = False
-        warnings.warn(
-            "tomllib/tomli not installed, TOML support disabled", stacklevel=2
-        )
+        try:
+            import tomli as tomllib
+        except ImportError:
+            warnings.warn(
+                "tomllib/tomli not installed, TOML support disabled", stacklevel=2
+            )
+            return None
+    return tomllib
+
+
+def __getattr__(name: str) -> Any:
+    """按需计算HAS_YAML/HAS_LIBYAML/HAS_TOML，访问时才导入对应模块"""
+    if name == "HAS_YAML":
+        return _get_yaml() is not None
+    if name == "HAS_LIBYAML":
+        yaml = _get_yaml()
+        return yaml is not None and yaml.__with_libyaml__
+    if name == "HAS_TOML":
+        return _get_toml() is not None
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def _loads_json(data: bytes) -> Any:
+    """解析JSON，优先使用orjson"""
+    if HAS_ORJSON:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # orjson不支持超过64位的整数和NaN等扩展写法，交给标准库处理
+            pass
+    return json.loads(data)
 
-from .exceptions import ConfigError
 
-T = TypeVar("T")
+def _reject_json_value(value: Any) -> Any:
+    """orjson的default回调：和标准库一样拒绝无法直接表示为JSON的值"""
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _dumps_json(data: Any) -> bytes:
+    """序列化为UTF-8 JSON（2空格缩进，不转义非ASCII字符）
+
+    orjson输出的浮点数写法与json.dumps不同（如1e+16写作1e16），解析结果相同。
+    日期、dataclass和内置类型的子类交给default处理，失败后由标准库决定接受
+    还是抛出TypeError，因此是否安装orjson不影响哪些配置可以保存。
+    """
+    if HAS_ORJSON:
+        try:
+            return orjson.dumps(
+                data,
+                default=_reject_json_value,
+                option=orjson.OPT_INDENT_2
+                | orjson.OPT_NON_STR_KEYS
+                | orjson.OPT_PASSTHROUGH_DATETIME
+                | orjson.OPT_PASSTHROUGH_DATACLASS
+                | orjson.OPT_PASSTHROUGH_SUBCLASS,
+            )
+        except orjson.JSONEncodeError:
+            # 如超过64位的整数或上述类型的值，交给标准库处理
+            pass
+    return json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+def _join_path(path: tuple) -> str:
+    """把键路径元组拼接为点号分隔的字符串"""
+    return ".".join(map(str, path))
+
+
+def _dumps_yaml(yaml: Any, data: Any) -> bytes:
+    """序列化为UTF-8 YAML，优先使用libyaml的C实现"""
+    return yaml.dump(
+        data,
+        Dumper=getattr(yaml, "CDumper", yaml.Dumper),
+        default_flow_style=False,
+        allow_unicode=True,
+        indent=2,
+        encoding="utf-8",
+    )
+
+
+@functools.lru_cache(maxsize=32)
+def _parse_file(path: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """
+    解析配置文件
+
+    结果按 (路径, 修改时间, 大小) 缓存，多个实例加载同一文件或文件未变化时
+    不再重复解析。返回值被缓存共享，调用方不得修改。
+    """
+    suffix = Path(path).suffix.lower()
+
+    if suffix == ".json":
+        # 以二进制读取，直接交给orjson解析，省去解码为str的一步
+        with open(path, "rb") as f:
+            return _loads_json(f.read())
+    elif suffix in [".yaml", ".yml"]:
+        yaml = _get_yaml()
+        if yaml is None:
+            raise ConfigError("YAML支持未安装，请安装PyYAML")
+        # 优先使用libyaml的C实现
+        loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+        with open(path, "r", encoding="utf-8") as f:
+            return yaml.load(f, Loader=loader) or {}
+    elif suffix == ".toml":
+        tomllib = _get_toml()
+        if tomllib is None:
+            raise ConfigError("TOML支持未安装，请安装tomllib或tomli")
+        # tomllib.load直接读取二进制文件，无需先读成str
+        with open(path, "rb") as f:
+            return tomllib.load(f)
+    else:
+        raise ConfigError(f"不支持的配置文件格式: {suffix}")
 
 
 class ConfigManager:
@@ -55,6 +203,7 @@ class ConfigManager:
         config_path: Optional[Union[str, Path]] = None,
         env_prefix: Optional[str] = None,
         auto_reload: bool = False,
+        lazy: bool = False,
     ):
         """
         初始化配置管理器
@@ -63,15 +212,31 @@ class ConfigManager:
             config_path: 配置文件路径
             env_prefix: 环境变量前缀，如 "MYAPP_"
             auto_reload: 是否自动重载配置文件
+            lazy: 是否按需解析JSON配置（需要安装ijson），只在首次访问某个
+                顶层键时解析该键，适合只读取少量键的大型JSON配置
         """
         self.config_path = Path(config_path) if config_path else None
         self.env_prefix = env_prefix or ""
         self.auto_reload = auto_reload
+        self.lazy = lazy
         self._config: Dict[str, Any] = {}
+        # 按需解析模式下的原始JSON内容和已解析的顶层键，全部解析后置为None
+        self._lazy_raw: Optional[bytes] = None
+        self._lazy_loaded: set = set()
         self._file_mtime: Optional[float] = None
+        # 点号路径 -> (从根到所在字典的 (键, 子字典) 链, 叶子键) 的扁平索引，
+        # 配置变更后置为None，按需重建
+        self._flat: Optional[Dict[str, tuple]] = None
+        # 正在监听的配置文件所在目录，未监听时为None
+        self._watch_dir: Optional[str] = None
+        # 带前缀的环境变量快照：(配置键路径, 原始值)，避免每次加载都扫描os.environ
+        self._env_overrides: List[Tuple[List[str], str]] = []
+        self.refresh_env()
 
         if self.config_path and self.config_path.exists():
             self.load()
+        else:
+            self._apply_env_overrides()
 
     @classmethod
     def from_file(
@@ -79,9 +244,10 @@ class ConfigManager:
         config_path: Union[str, Path],
         env_prefix: Optional[str] = None,
         auto_reload: bool = False,
+        lazy: bool = False,
     ) -> "ConfigManager":
         """从配置文件创建配置管理器"""
-        return cls(config_path, env_prefix, auto_reload)
+        return cls(config_path, env_prefix, auto_reload, lazy)
 
     @classmethod
     def from_dict(
@@ -93,82 +259,145 @@ class ConfigManager:
         manager._apply_env_overrides()
         return manager
 
+    def _load_lazy_key(self, key: str) -> None:
+        """按需解析单个顶层键，并应用该键对应的环境变量覆盖"""
+        self._lazy_loaded.add(key)
+        try:
+            for value in ijson.items(io.BytesIO(self._lazy_raw), key, use_float=True):
+                self._config[key] = value
+                break
+        except ijson.JSONError as e:
+            raise ConfigError(f"配置文件解析错误: {e}")
+        self._flat = None
+        self._apply_env_overrides(key)
+
+    def _materialize(self) -> None:
+        """按需解析模式下一次性解析全部配置，之后与普通模式一致"""
+        raw = self._lazy_raw
+        if raw is None:
+            return
+
+        self._lazy_raw = None
+        try:
+            parsed = _loads_json(raw)
+        except json.JSONDecodeError as e:
+            raise ConfigError(f"配置文件解析错误: {e}")
+
+        # 已解析的顶层键可能已被修改，保留当前值
+        for key in self._lazy_loaded:
+            if key in self._config:
+                parsed[key] = self._config[key]
+            else:
+                parsed.pop(key, None)
+        env_keys = {keys[0] for keys, _ in self._env_overrides}
+        self._config = parsed
+        self._flat = None
+        for key in env_keys - self._lazy_loaded:
+            self._apply_env_overrides(key)
+
     def load(self) -> None:
         """加载配置文件"""
         if not self.config_path or not self.config_path.exists():
             raise ConfigError(f"配置文件不存在: {self.config_path}")
 
         # 检查文件修改时间
-        current_mtime = self.config_path.stat().st_mtime
+        stat = self.config_path.stat()
+        current_mtime = stat.st_mtime
         if not self.auto_reload and self._file_mtime == current_mtime:
             return
 
         self._file_mtime = current_mtime
 
-        # 根据文件扩展名选择解析器
-        suffix = self.config_path.suffix.lower()
+        if self.lazy and HAS_IJSON and self.config_path.suffix.lower() == ".json":
+            # 只保存原始内容，顶层键在首次访问时再解析
+            with open(self.config_path, "rb") as f:
+                self._lazy_raw = f.read()
+            self._lazy_loaded = set()
+            self._config = {}
+            self._flat = None
+            return
 
-        try:
-            with open(self.config_path, "r", encoding="utf-8") as f:
-                if suffix == ".json":
-                    self._config = json.load(f)
-                elif suffix in [".yaml", ".yml"]:
-                    if not HAS_YAML:
-                        raise ConfigError("YAML支持未安装，请安装PyYAML")
-                    self._config = yaml.safe_load(f) or {}
-                elif suffix == ".toml":
-                    if not HAS_TOML:
-                        raise ConfigError("TOML支持未安装，请安装tomllib或tomli")
-                    content = f.read()
-                    self._config = tomllib.loads(content)
-                else:
-                    raise ConfigError(f"不支持的配置文件格式: {suffix}")
+        self._lazy_raw = None
 
-        except (json.JSONDecodeError, yaml.YAMLError) as e:
+        try:
+            parsed = _parse_file(
+                str(self.config_path.resolve()), stat.st_mtime_ns, stat.st_size
+            )
+        except json.JSONDecodeError as e:
             raise ConfigError(f"配置文件解析错误: {e}")
         except Exception as e:
+            # 只有YAML文件才可能抛出YAMLError，此时PyYAML已经导入
+            yaml = (
+                _get_yaml()
+                if self.config_path.suffix.lower() in (".yaml", ".yml")
+                else None
+            )
+            if yaml is not None and isinstance(e, yaml.YAMLError):
+                raise ConfigError(f"配置文件解析错误: {e}")
             raise ConfigError(f"加载配置文件失败: {e}")
 
+        # 解析结果在实例间共享，这里取副本以便后续修改
+        self._config = deep_copy(parsed)
+        self._flat = None
+
         # 应用环境变量覆盖
         self._apply_env_overrides()
 
-    def _apply_env_overrides(self) -> None:
-        """应用环境变量覆盖配置"""
-        if not self.env_prefix:
+    def refresh_env(self) -> None:
+        """重新读取带前缀的环境变量（构造后修改了环境变量时调用）"""
+        prefix = self.env_prefix
+        if not prefix:
+            self._env_overrides = []
             return
 
-        for key, value in os.environ.items():
-            if key.startswith(self.env_prefix):
-                # 移除前缀并转换为配置键
-                config_key = key[len(self.env_prefix) :].lower()
-                # 支持嵌套配置，用双下划线分隔
-                keys = config_key.split("__")
+        # 扫描时用切片比较前缀，并一次性算好配置键路径：
+        # 移除前缀后转小写，用双下划线分隔嵌套键
+        prefix_len = len(prefix)
+        self._env_overrides = [
+            (key[prefix_len:].lower().split("__"), value)
+            for key, value in os.environ.items()
+            if key[:prefix_len] == prefix
+        ]
+
+    def _apply_env_overrides(self, only_key: Optional[str] = None) -> None:
+        """
+        应用环境变量覆盖配置
+
+        Args:
+            only_key: 只应用该顶层键下的覆盖（按需解析模式使用）
+        """
+        if not self.env_prefix:
+            return
 
-                # 类型转换
-                converted_value = self._convert_env_value(value)
+        self._flat = None
+        for keys, value in self._env_overrides:
+            if only_key is not None and keys[0] != only_key:
+                continue
 
-                # 设置嵌套配置
-                self._set_nested_value(self._config, keys, converted_value)
+            # 类型转换后设置嵌套配置
+            self._set_nested_value(self._config, keys, self._convert_env_value(value))
 
     def _convert_env_value(self, value: str) -> Any:
         """转换环境变量值类型"""
         # 布尔值
-        if value.lower() in ("true", "yes", "1", "on"):
+        lowered = value.lower()
+        if lowered in _ENV_TRUE:
             return True
-        elif value.lower() in ("false", "no", "0", "off"):
+        elif lowered in _ENV_FALSE:
             return False
 
-        # 数字
+        # 数字：先按整数解析，只有含小数点时才尝试浮点数（避免"nan"、"1e5"等被转换）
         try:
-            if "." in value:
-                return float(value)
-            else:
-                return int(value)
+            return int(value)
         except ValueError:
-            pass
+            if "." in value:
+                try:
+                    return float(value)
+                except ValueError:
+                    pass
 
         # JSON格式
-        if value.startswith(("{", "[", '"')):
+        if value.startswith(_JSON_STARTS):
             try:
                 return json.loads(value)
             except json.JSONDecodeError:
@@ -182,12 +411,15 @@ class ConfigManager:
 
     def _set_nested_value(self, config: Dict, keys: list, value: Any) -> None:
         """设置嵌套配置值"""
+        # 驻留各级键名，多个实例、多次加载写入的同名键共享同一个字符串对象
+        keys = [sys.intern(key) if type(key) is str else key for key in keys]
         for key in keys[:-1]:
-            if key not in config:
-                config[key] = {}
-            elif not isinstance(config[key], dict):
-                config[key] = {}
-            config = config[key]
+            # 一次取值同时判断“不存在”和“不是字典”，两种情况都替换为新字典；
+            # 先比较type，字典子类才走isinstance
+            node = config.get(key)
+            if type(node) is not dict and not isinstance(node, dict):
+                node = config[key] = {}
+            config = node
 
         config[keys[-1]] = value
 
@@ -205,17 +437,8 @@ class ConfigManager:
         Returns:
             配置值
         """
-        if self.auto_reload and self.config_path:
-            self.load()
-
-        # 分割嵌套键
-        keys = key.split(".")
-        value = self._config
-
-        try:
-            for k in keys:
-                value = value[k]
-        except (KeyError, TypeError):
+        found, value = self._lookup(key)
+        if not found:
             if default is not None:
                 return default
             raise ConfigError(f"配置键不存在: {key}")
@@ -238,6 +461,53 @@ class ConfigManager:
 
         return value
 
+    def _lookup(self, key: str) -> Tuple[bool, Any]:
+        """
+        查找配置值，不抛出异常
+
+        Returns:
+            (是否存在, 配置值)
+        """
+        if self.auto_reload and self.config_path:
+            self.load()
+
+        if self._lazy_raw is not None:
+            top = key.split(".", 1)[0]
+            if top not in self._lazy_loaded:
+                self._load_lazy_key(top)
+
+        flat = self._flat
+        if flat is None:
+            flat = self._rebuild_flat()
+
+        # 叶子键直接命中索引；子树键等未索引的情况按层查找
+        entry = flat.get(key)
+        if entry is not None:
+            # get()返回的子字典可能被调用方整体替换或删除，逐级确认父链仍然有效
+            node = self._config
+            for k, child in entry[0]:
+                if node.get(k) is not child:
+                    break
+                node = child
+            else:
+                value = node.get(entry[1], _MISSING)
+                if value is not _MISSING:
+                    return True, value
+
+        value = self._config
+        for k in key.split("."):
+            if type(value) is dict:
+                value = value.get(k, _MISSING)
+                if value is _MISSING:
+                    return False, None
+            else:
+                try:
+                    value = value[k]
+                except (KeyError, TypeError):
+                    return False, None
+
+        return True, value
+
     def set(self, key: str, value: Any) -> None:
         """
         设置配置值
@@ -247,31 +517,82 @@ class ConfigManager:
             value: 配置值
         """
         keys = key.split(".")
+        if self._lazy_raw is not None and keys[0] not in self._lazy_loaded:
+            self._load_lazy_key(keys[0])
         self._set_nested_value(self._config, keys, value)
+        self._flat = None
 
     def has(self, key: str) -> bool:
         """检查配置键是否存在"""
-        try:
-            self.get(key)
-            return True
-        except ConfigError:
-            return False
+        return self._lookup(key)[0]
 
     def update(self, config_dict: Dict[str, Any]) -> None:
         """更新配置"""
+        self._materialize()
         self._deep_update(self._config, config_dict)
+        self._flat = None
+
+    def _rebuild_flat(self) -> Dict[str, tuple]:
+        """
+        重建扁平索引
+
+        只收录叶子值，记录的是从根到所在字典的父链和键而不是值本身，
+        因此通过get()返回的子字典原地修改叶子值后索引仍然有效；
+        子树被整体替换或删除时父链校验失败，查找回退到逐层查找。
+        """
+        flat: Dict[str, tuple] = {}
+        if isinstance(self._config, dict):
+            stack = [("", (), self._config)]
+            while stack:
+                prefix, links, node = stack.pop()
+                for key, value in node.items():
+                    # 非字符串键或键中含点号时无法用点号路径表示，交给逐层查找
+                    if type(key) is not str or "." in key:
+                        continue
+                    # 驻留路径字符串，传入驻留字符串的查询可直接按身份命中
+                    path = sys.intern(prefix + key)
+                    if isinstance(value, dict):
+                        stack.append((path + ".", (*links, (key, value)), value))
+                    else:
+                        flat[path] = (links, key)
+        self._flat = flat
+        return flat
 
     def _deep_update(self, base: Dict, update: Dict) -> None:
         """深度更新字典"""
-        for key, value in update.items():
-            if key in base and isinstance(base[key], dict) and isinstance(value, dict):
-                self._deep_update(base[key], value)
-            else:
-                base[key] = value
+        # 显式栈代替递归
+        stack = [(base, update)]
+        while stack:
+            base_dict, update_dict = stack.pop()
+            for key, value in update_dict.items():
+                current = base_dict.get(key)
+                if isinstance(current, dict) and isinstance(value, dict):
+                    stack.append((current, value))
+                else:
+                    base_dict[key] = value
 
-    def to_dict(self) -> Dict[str, Any]:
-        """返回配置字典的副本"""
-        return self._config.copy()
+    @overload
+    def to_dict(self, copy: Literal[True] = ...) -> Dict[str, Any]: ...
+
+    @overload
+    def to_dict(self, copy: Literal[False]) -> Mapping[str, Any]: ...
+
+    def to_dict(self, copy: bool = True) -> Mapping[str, Any]:
+        """
+        返回配置字典
+
+        Args:
+            copy: 为True时返回配置字典的（浅）副本；为False时返回只读视图，
+                不复制任何数据，适合只读取配置的调用方。只读视图会反映之后
+                对配置的修改，需要修改返回值时请使用默认的副本
+
+        Returns:
+            配置字典副本或只读视图
+        """
+        self._materialize()
+        if copy:
+            return self._config.copy()
+        return MappingProxyType(self._config)
 
     def save(self, path: Optional[Union[str, Path]] = None) -> None:
         """保存配置到文件"""
@@ -280,35 +601,37 @@ class ConfigManager:
             raise ConfigError("未指定保存路径")
 
         suffix = save_path.suffix.lower()
+        self._materialize()
 
         try:
-            with open(save_path, "w", encoding="utf-8") as f:
-                if suffix == ".json":
-                    json.dump(self._config, f, indent=2, ensure_ascii=False)
-                elif suffix in [".yaml", ".yml"]:
-                    if not HAS_YAML:
-                        raise ConfigError("YAML支持未安装，请安装PyYAML")
-                    yaml.dump(
-                        self._config,
-                        f,
-                        default_flow_style=False,
-                        allow_unicode=True,
-                        indent=2,
-                    )
-                else:
-                    raise ConfigError(f"保存格式不支持: {suffix}")
+            # 先序列化为字节再一次写入，格式不支持或序列化失败时不会截断文件
+            if suffix == ".json":
+                payload = _dumps_json(self._config)
+            elif suffix in [".yaml", ".yml"]:
+                yaml = _get_yaml()
+                if yaml is None:
+                    raise ConfigError("YAML支持未安装，请安装PyYAML")
+                payload = _dumps_yaml(yaml, self._config)
+            else:
+                raise ConfigError(f"保存格式不支持: {suffix}")
+            with open(save_path, "wb") as f:
+                f.write(payload)
         except Exception as e:
             raise ConfigError(f"保存配置文件失败: {e}")
 
     def reload(self) -> None:
         """重新加载配置文件"""
         self._file_mtime = None
+        _parse_file.cache_clear()
+        self.refresh_env()
         self.load()
 
     def watch_file(self, callback: Optional[Callable] = None) -> None:
         """
         监听配置文件变化（需要安装watchdog）
 
+        所有实例共享同一个watchdog Observer，每个目录只注册一次监听。
+
         Args:
             callback: 文件变化时的回调函数
         """
@@ -318,40 +641,70 @@ class ConfigManager:
         try:
             from watchdog.observers import Observer
             from watchdog.events import FileSystemEventHandler
-
-            class ConfigFileHandler(FileSystemEventHandler):
-                def __init__(self, config_manager, callback_func):
-                    self.config_manager = config_manager
-                    self.callback_func = callback_func
-
-                def on_modified(self, event):
-                    if not event.is_directory and event.src_path == str(
-                        self.config_manager.config_path
-                    ):
-                        try:
-                            self.config_manager.reload()
-                            if self.callback_func:
-                                self.callback_func(self.config_manager)
-                        except Exception as e:
-                            self.config_manager._handle_reload_error(e)
-
-            observer = Observer()
-            handler = ConfigFileHandler(self, callback)
-            observer.schedule(handler, str(self.config_path.parent), recursive=False)
-            observer.start()
-
-            # 将observer存储以便后续清理
-            self._file_observer = observer
-
         except ImportError:
             raise ConfigError("文件监听需要安装watchdog: pip install watchdog")
 
+        global _watch_handler, _watch_observer
+
+        # 重复调用时替换原有回调
+        self.stop_watching()
+
+        file_path = str(self.config_path.absolute())
+        directory = os.path.dirname(file_path)
+
+        with _watch_lock:
+            if _watch_handler is None:
+
+                class ConfigFileHandler(FileSystemEventHandler):
+                    def on_modified(self, event):
+                        if not event.is_directory:
+                            _dispatch_file_event(event.src_path)
+
+                _watch_handler = ConfigFileHandler()
+
+            if _watch_observer is None:
+                _watch_observer = Observer()
+                _watch_observer.start()
+
+            entries = _watched.get(directory)
+            if entries is None:
+                _watch_schedules[directory] = _watch_observer.schedule(
+                    _watch_handler, directory, recursive=False
+                )
+                entries = _watched[directory] = []
+            entries.append((self, file_path, callback))
+
+        self._watch_dir = directory
+
     def stop_watching(self) -> None:
         """停止监听配置文件"""
-        if hasattr(self, "_file_observer"):
-            self._file_observer.stop()
-            self._file_observer.join()
-            delattr(self, "_file_observer")
+        global _watch_observer
+
+        directory = self._watch_dir
+        if directory is None:
+            return
+        self._watch_dir = None
+
+        observer = None
+        with _watch_lock:
+            entries = [e for e in _watched.get(directory, ()) if e[0] is not self]
+            if entries:
+                _watched[directory] = entries
+            else:
+                _watched.pop(directory, None)
+                watch = _watch_schedules.pop(directory, None)
+                if watch is not None and _watch_observer is not None:
+                    _watch_observer.unschedule(watch)
+
+            # 没有任何监听时停止共享的Observer
+            if not _watched and _watch_observer is not None:
+                observer = _watch_observer
+                _watch_observer = None
+
+        # 在锁外等待线程结束，避免与正在分发事件的线程互相等待
+        if observer is not None:
+            observer.stop()
+            observer.join()
 
     def _handle_reload_error(self, error: Exception) -> None:
         """处理重载错误"""
@@ -368,30 +721,40 @@ class ConfigManager:
         Returns:
             验证错误列表
         """
+        self._materialize()
         errors = []
 
-        def validate_nested(config_data, schema_data, path=""):
-            for key, expected_type in schema_data.items():
-                full_path = f"{path}.{key}" if path else key
+        # 显式栈代替递归，栈中保存各层schema的迭代器以保持原有的错误顺序；
+        # 路径用元组记录，只在出错时才拼接成字符串
+        stack = [(self._config, iter(schema.items()), ())]
+        while stack:
+            config_data, schema_items, path = stack[-1]
+            item = next(schema_items, None)
+            if item is None:
+                stack.pop()
+                continue
 
-                if key not in config_data:
-                    errors.append(f"缺少必需的配置项: {full_path}")
-                    continue
+            key, expected_type = item
+            key_path = path + (key,)
 
-                value = config_data[key]
+            if key not in config_data:
+                errors.append(f"缺少必需的配置项: {_join_path(key_path)}")
+                continue
+
+            value = config_data[key]
+
+            if isinstance(expected_type, dict):
+                if not isinstance(value, dict):
+                    errors.append(f"配置项 {_join_path(key_path)} 应该是字典类型")
+                else:
+                    stack.append((value, iter(expected_type.items()), key_path))
+            elif isinstance(expected_type, type):
+                if not isinstance(value, expected_type):
+                    errors.append(
+                        f"配置项 {_join_path(key_path)} "
+                        f"应该是 {expected_type.__name__} 类型"
+                    )
 
-                if isinstance(expected_type, dict):
-                    if not isinstance(value, dict):
-                        errors.append(f"配置项 {full_path} 应该是字典类型")
-                    else:
-                        validate_nested(value, expected_type, full_path)
-                elif isinstance(expected_type, type):
-                    if not isinstance(value, expected_type):
-                        errors.append(
-                            f"配置项 {full_path} 应该是 {expected_type.__name__} 类型"
-                        )
-
-        validate_nested(self._config, schema)
         return errors
 
     def merge_configs(self, *config_managers: "ConfigManager") -> "ConfigManager":
@@ -404,10 +767,13 @@ class ConfigManager:
         Returns:
             新的配置管理器
         """
-        merged_config = self._config.copy()
+        # 深拷贝后原地合并，避免修改参与合并的各个配置
+        self._materialize()
+        merged_config = deep_copy(self._config)
 
         for manager in config_managers:
-            merged_config = self._deep_update(merged_config, manager._config)
+            manager._materialize()
+            self._deep_update(merged_config, deep_copy(manager._config))
 
         return ConfigManager.from_dict(merged_config, self.env_prefix)
 
@@ -420,23 +786,20 @@ class ConfigManager:
             format: 导出格式 ('json', 'yaml')
         """
         export_path = Path(path)
+        self._materialize()
 
         try:
-            with open(export_path, "w", encoding="utf-8") as f:
-                if format == "json":
-                    json.dump(self._config, f, indent=2, ensure_ascii=False)
-                elif format == "yaml":
-                    if not HAS_YAML:
-                        raise ConfigError("YAML导出需要安装PyYAML")
-                    yaml.dump(
-                        self._config,
-                        f,
-                        default_flow_style=False,
-                        allow_unicode=True,
-                        indent=2,
-                    )
-                else:
-                    raise ConfigError(f"不支持的导出格式: {format}")
+            if format == "json":
+                payload = _dumps_json(self._config)
+            elif format == "yaml":
+                yaml = _get_yaml()
+                if yaml is None:
+                    raise ConfigError("YAML导出需要安装PyYAML")
+                payload = _dumps_yaml(yaml, self._config)
+            else:
+                raise ConfigError(f"不支持的导出格式: {format}")
+            with open(export_path, "wb") as f:
+                f.write(payload)
         except Exception as e:
             raise ConfigError(f"导出配置失败: {e}")
 
@@ -458,15 +821,11 @@ class ConfigManager:
         )
         backup_dir.mkdir(parents=True, exist_ok=True)
 
-        import time
-
         timestamp = int(time.time())
         backup_name = f"{self.config_path.stem}_{timestamp}{self.config_path.suffix}"
         backup_path = backup_dir / backup_name
 
         # 复制配置文件
-        import shutil
-
         shutil.copy2(self.config_path, backup_path)
 
         return backup_path
@@ -484,6 +843,32 @@ class ConfigManager:
         return self.has(key)
 
 
+# 文件监听状态，所有实例共享一个watchdog Observer
+_watch_lock = threading.Lock()
+_watch_observer: Any = None
+_watch_handler: Any = None
+# 目录 -> watchdog的监听句柄
+_watch_schedules: Dict[str, Any] = {}
+# 目录 -> [(配置管理器, 配置文件绝对路径, 回调)]
+_watched: Dict[str, List[Tuple[ConfigManager, str, Optional[Callable]]]] = {}
+
+
+def _dispatch_file_event(src_path: str) -> None:
+    """把文件修改事件分发给监听该文件的配置管理器"""
+    with _watch_lock:
+        entries = list(_watched.get(os.path.dirname(src_path), ()))
+
+    for manager, file_path, callback in entries:
+        if file_path != src_path:
+            continue
+        try:
+            manager.reload()
+            if callback:
+                callback(manager)
+        except Exception as e:
+            manager._handle_reload_error(e)
+
+
 # 全局配置实例
 _global_config: Optional[ConfigManager] = None
 
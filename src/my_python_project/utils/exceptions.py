@@ -5,14 +5,23 @@
 """
 
 import logging
+import math
+import random
 import sys
+import time
 import traceback
+from array import array
+from collections import deque
 from functools import wraps
-from typing import Any, Callable, Dict, Optional, Type, Union
+from types import TracebackType
+from typing import Any, Callable, Dict, List, Optional, Type, Union
 
 # 获取logger
 logger = logging.getLogger(__name__)
 
+# 熔断器计时使用单调时钟，不受系统时间调整影响
+_monotonic = time.monotonic
+
 
 # =============================================================================
 # 基础异常类
@@ -22,6 +31,8 @@ logger = logging.getLogger(__name__)
 class BaseError(Exception):
     """基础异常类"""
 
+    __slots__ = ("details", "error_code", "message")
+
     def __init__(
         self,
         message: str,
@@ -50,6 +61,16 @@ class BaseError(Exception):
             "details": self.details,
         }
 
+    def __reduce__(self):
+        """序列化时保留槽属性（Exception默认只保存args和__dict__）"""
+        state = {
+            "message": self.message,
+            "error_code": self.error_code,
+            "details": self.details,
+        }
+        state.update(self.__dict__)
+        return (self.__class__, self.args, state)
+
     def __str__(self) -> str:
         """字符串表示"""
         if self.details:
@@ -293,30 +314,68 @@ def handle_exceptions(
     """
 
     def decorator(func: Callable) -> Callable:
-        @wraps(func)
-        def wrapper(*args, **kwargs):
-            try:
-                return func(*args, **kwargs)
-            except exceptions as e:
-                if log_errors:
-                    logger.error(f"函数 {func.__name__} 发生异常: {e}", exc_info=True)
+        # 装饰时按参数选定包装函数，调用时不再判断log_errors/callback/reraise
+        if callback is None:
+            if log_errors and reraise:
+
+                def wrapper(*args, **kwargs):
+                    try:
+                        return func(*args, **kwargs)
+                    except exceptions as e:
+                        _log_handled_error(func, e)
+                        raise
+
+            elif log_errors:
+
+                def wrapper(*args, **kwargs):
+                    try:
+                        return func(*args, **kwargs)
+                    except exceptions as e:
+                        _log_handled_error(func, e)
+                        return default_return
+
+            elif reraise:
+                # 既不记录也不回调，异常原样抛出，无需包装try/except
+                def wrapper(*args, **kwargs):
+                    return func(*args, **kwargs)
+
+            else:
+
+                def wrapper(*args, **kwargs):
+                    try:
+                        return func(*args, **kwargs)
+                    except exceptions:
+                        return default_return
+
+        else:
+
+            def wrapper(*args, **kwargs):
+                try:
+                    return func(*args, **kwargs)
+                except exceptions as e:
+                    if log_errors:
+                        _log_handled_error(func, e)
 
-                if callback:
                     try:
                         callback(e, func, args, kwargs)
                     except Exception as cb_error:
                         logger.error(f"异常回调函数执行失败: {cb_error}")
 
-                if reraise:
-                    raise
+                    if reraise:
+                        raise
 
-                return default_return
+                    return default_return
 
-        return wrapper
+        return wraps(func)(wrapper)
 
     return decorator
 
 
+def _log_handled_error(func: Callable, error: Exception) -> None:
+    """记录handle_exceptions捕获的异常"""
+    logger.error(f"函数 {func.__name__} 发生异常: {error}", exc_info=True)
+
+
 def suppress_exceptions(
     exceptions: Union[Type[Exception], tuple] = Exception,
     log_errors: bool = True,
@@ -347,6 +406,7 @@ def retry_on_exception(
     backoff: float = 2.0,
     exceptions: Union[Type[Exception], tuple] = Exception,
     log_errors: bool = True,
+    jitter: float = 0.0,
 ) -> Callable:
     """
     异常重试装饰器
@@ -357,42 +417,40 @@ def retry_on_exception(
         backoff: 退避倍数
         exceptions: 要重试的异常类型
         log_errors: 是否记录错误日志
+        jitter: 每次延迟额外增加的随机时间上限（秒），避免多个客户端同时重试
 
     Returns:
         装饰器函数
     """
+    # 装饰时预先算好每次重试前的延迟
+    delays = tuple(delay * backoff**i for i in range(max_retries))
 
     def decorator(func: Callable) -> Callable:
         @wraps(func)
         def wrapper(*args, **kwargs):
-            last_exception = None
-            current_delay = delay
-
-            for attempt in range(max_retries + 1):
+            for attempt, current_delay in enumerate(delays):
                 try:
                     return func(*args, **kwargs)
                 except exceptions as e:
-                    last_exception = e
-                    if attempt < max_retries:
-                        if log_errors:
-                            logger.warning(
-                                f"函数 {func.__name__} 第 {attempt + 1} 次尝试失败: {e}, "
-                                f"{current_delay} 秒后重试"
-                            )
-
-                        import time
-
-                        time.sleep(current_delay)
-                        current_delay *= backoff
-                    else:
-                        if log_errors:
-                            logger.error(
-                                f"函数 {func.__name__} 重试 {max_retries} 次后仍然失败: {e}",
-                                exc_info=True,
-                            )
-                        raise last_exception
-
-            raise last_exception
+                    if jitter:
+                        current_delay += random.uniform(0, jitter)
+                    if log_errors:
+                        logger.warning(
+                            f"函数 {func.__name__} 第 {attempt + 1} 次尝试失败: {e}, "
+                            f"{current_delay} 秒后重试"
+                        )
+                    time.sleep(current_delay)
+
+            # 最后一次尝试，失败后不再等待
+            try:
+                return func(*args, **kwargs)
+            except exceptions as e:
+                if log_errors:
+                    logger.error(
+                        f"函数 {func.__name__} 重试 {max_retries} 次后仍然失败: {e}",
+                        exc_info=True,
+                    )
+                raise
 
         return wrapper
 
@@ -418,6 +476,8 @@ class ErrorHandler:
         self.error_counts: Dict[str, int] = {}
         self.error_callbacks: Dict[str, Callable] = {}
         self.error_patterns: Dict[str, Any] = {}  # 错误模式检测
+        # 错误类型名称 -> 关注该类型的模式名称列表
+        self._error_type_to_patterns: Dict[str, List[str]] = {}
         self.recovery_strategies: Dict[str, Callable] = {}  # 恢复策略
         self.circuit_breakers: Dict[str, Any] = {}  # 熔断器
 
@@ -444,7 +504,7 @@ class ErrorHandler:
         self.logger.error(
             f"处理错误: {error_type} - {error}",
             extra={"context": context or {}},
-            exc_info=True,
+            exc_info=error,
         )
 
         # 执行回调
@@ -515,8 +575,20 @@ class ErrorHandler:
             "error_types": error_types,
             "threshold": threshold,
             "time_window": time_window,
-            "occurrences": [],
+            "occurrences": deque(),
         }
+        self._rebuild_pattern_index()
+
+    def _rebuild_pattern_index(self) -> None:
+        """按模式添加顺序重建错误类型名称到模式名称的索引"""
+        index: Dict[str, List[str]] = {}
+        for pattern_name, pattern_config in self.error_patterns.items():
+            for et in pattern_config["error_types"]:
+                name = et.__name__ if hasattr(et, "__name__") else str(et)
+                names = index.setdefault(name, [])
+                if pattern_name not in names:
+                    names.append(pattern_name)
+        self._error_type_to_patterns = index
 
     def check_error_patterns(self, error: Exception) -> Optional[str]:
         """
@@ -528,29 +600,24 @@ class ErrorHandler:
         Returns:
             匹配的模式名称，如果有的话
         """
-        import time
-
         current_time = time.time()
         error_type = type(error).__name__
 
-        for pattern_name, pattern_config in self.error_patterns.items():
-            if any(
-                error_type == et.__name__ if hasattr(et, "__name__") else str(et)
-                for et in pattern_config["error_types"]
-            ):
-                # 清理过期的记录
-                pattern_config["occurrences"] = [
-                    t
-                    for t in pattern_config["occurrences"]
-                    if current_time - t <= pattern_config["time_window"]
-                ]
-
-                # 添加当前错误
-                pattern_config["occurrences"].append(current_time)
-
-                # 检查是否超过阈值
-                if len(pattern_config["occurrences"]) >= pattern_config["threshold"]:
-                    return pattern_name
+        for pattern_name in self._error_type_to_patterns.get(error_type, ()):
+            pattern_config = self.error_patterns[pattern_name]
+            occurrences = pattern_config["occurrences"]
+            time_window = pattern_config["time_window"]
+
+            # 清理过期的记录，时间戳按先后追加，过期的都在队首
+            while occurrences and current_time - occurrences[0] > time_window:
+                occurrences.popleft()
+
+            # 添加当前错误
+            occurrences.append(current_time)
+
+            # 检查是否超过阈值
+            if len(occurrences) >= pattern_config["threshold"]:
+                return pattern_name
 
         return None
 
@@ -583,6 +650,23 @@ class ErrorHandler:
 # =============================================================================
 
 
+# 熔断器状态，内部用小整数表示，比较比字符串更快
+_CLOSED, _OPEN, _HALF_OPEN = 0, 1, 2
+_STATE_NAMES = ("CLOSED", "OPEN", "HALF_OPEN")
+
+# 熔断器事件
+_SUCCESS, _FAILURE, _FAILURE_AT_THRESHOLD, _RESET_TIMEOUT = 0, 1, 2, 3
+
+# 状态转移表：_TRANSITIONS[事件][当前状态] -> 新状态
+_TRANSITIONS = (
+    # 列依次对应当前状态 CLOSED、OPEN、HALF_OPEN
+    (_CLOSED, _CLOSED, _CLOSED),  # 调用成功
+    (_CLOSED, _OPEN, _OPEN),  # 调用失败，未达到阈值
+    (_OPEN, _OPEN, _OPEN),  # 调用失败，达到阈值
+    (_CLOSED, _HALF_OPEN, _HALF_OPEN),  # 熔断超时，允许试探
+)
+
+
 class CircuitBreaker:
     """熔断器实现"""
 
@@ -591,6 +675,7 @@ class CircuitBreaker:
         failure_threshold: int = 5,
         timeout: int = 60,
         expected_exception: Type[Exception] = Exception,
+        window: Optional[float] = None,
     ):
         """
         初始化熔断器
@@ -599,13 +684,32 @@ class CircuitBreaker:
             failure_threshold: 失败阈值
             timeout: 超时时间（秒）
             expected_exception: 预期的异常类型
+            window: 滑动窗口长度（秒），设置后仅当窗口内失败次数达到阈值时熔断；
+                默认None表示按累计失败次数熔断
         """
         self.failure_threshold = failure_threshold
         self.timeout = timeout
         self.expected_exception = expected_exception
+        self.window = window
         self.failure_count = 0
         self.last_failure_time = None
-        self.state = "CLOSED"  # CLOSED, OPEN, HALF_OPEN
+        self._state = _CLOSED
+
+        # 滑动窗口模式下用定长环形缓冲区记录最近的失败时间戳，
+        # array('d')直接存放C double，不会随失败次数增长
+        self._failure_times: Optional[array] = None
+        self._failure_index = 0
+        if window is not None:
+            self._failure_times = array("d", [-math.inf]) * max(failure_threshold, 1)
+
+    @property
+    def state(self) -> str:
+        """熔断器状态名称：CLOSED、OPEN 或 HALF_OPEN"""
+        return _STATE_NAMES[self._state]
+
+    @state.setter
+    def state(self, name: str) -> None:
+        self._state = _STATE_NAMES.index(name)
 
     def call(self, func: Callable, *args, **kwargs):
         """
@@ -622,9 +726,27 @@ class CircuitBreaker:
         Raises:
             CircuitBreakerOpenError: 熔断器打开时
         """
-        if self.state == "OPEN":
+        # 绝大多数时候处于CLOSED（0），其余状态交给慢路径处理
+        if self._state:
+            return self._call_when_tripped(func, args, kwargs)
+
+        # except子句中的self.expected_exception只在抛出异常时才会求值，
+        # 成功路径上没有这次属性查找，因此无需预先绑定为闭包变量
+        try:
+            result = func(*args, **kwargs)
+        except self.expected_exception:
+            self._on_failure()
+            raise
+
+        # 内联_on_success：状态已经是CLOSED，只需清零失败计数
+        self.failure_count = 0
+        return result
+
+    def _call_when_tripped(self, func: Callable, args: tuple, kwargs: dict):
+        """熔断器处于OPEN或HALF_OPEN时的调用路径"""
+        if self._state == _OPEN:
             if self._should_attempt_reset():
-                self.state = "HALF_OPEN"
+                self._state = _TRANSITIONS[_RESET_TIMEOUT][_OPEN]
             else:
                 raise CircuitBreakerOpenError(
                     f"熔断器打开，失败次数: {self.failure_count}"
@@ -632,35 +754,52 @@ class CircuitBreaker:
 
         try:
             result = func(*args, **kwargs)
-            self._on_success()
-            return result
-        except self.expected_exception as e:
+        except self.expected_exception:
             self._on_failure()
-            raise e
+            raise
 
-    def _should_attempt_reset(self) -> bool:
-        """检查是否应该尝试重置"""
-        import time
+        self._on_success()
+        return result
 
+    def _should_attempt_reset(self, _now: Callable[[], float] = _monotonic) -> bool:
+        """检查是否应该尝试重置"""
         return (
             self.last_failure_time is not None
-            and time.time() - self.last_failure_time >= self.timeout
+            and _now() - self.last_failure_time >= self.timeout
         )
 
     def _on_success(self):
         """成功时的处理"""
         self.failure_count = 0
-        self.state = "CLOSED"
+        self._state = _TRANSITIONS[_SUCCESS][self._state]
 
-    def _on_failure(self):
-        """失败时的处理"""
-        import time
+        timestamps = self._failure_times
+        if timestamps is not None:
+            # 从半开状态恢复后，之前窗口内的失败不再计入
+            for i in range(len(timestamps)):
+                timestamps[i] = -math.inf
+            self._failure_index = 0
 
+    def _on_failure(self, _now: Callable[[], float] = _monotonic):
+        """失败时的处理"""
+        now = _now()
         self.failure_count += 1
-        self.last_failure_time = time.time()
+        self.last_failure_time = now
+
+        timestamps = self._failure_times
+        if timestamps is None:
+            at_threshold = self.failure_count >= self.failure_threshold
+        else:
+            # 覆盖最早的时间戳；写入后下一个槽位就是窗口内最早的一次失败
+            index = self._failure_index
+            timestamps[index] = now
+            index = (index + 1) % len(timestamps)
+            self._failure_index = index
+            at_threshold = now - timestamps[index] < self.window
 
-        if self.failure_count >= self.failure_threshold:
-            self.state = "OPEN"
+        # 半开状态下任何失败都会重新打开，由转移表决定
+        event = _FAILURE_AT_THRESHOLD if at_threshold else _FAILURE
+        self._state = _TRANSITIONS[event][self._state]
 
 
 class CircuitBreakerOpenError(BaseError):
@@ -673,6 +812,7 @@ def circuit_breaker(
     failure_threshold: int = 5,
     timeout: int = 60,
     expected_exception: Type[Exception] = Exception,
+    window: Optional[float] = None,
 ):
     """
     熔断器装饰器
@@ -681,17 +821,26 @@ def circuit_breaker(
         failure_threshold: 失败阈值
         timeout: 超时时间（秒）
         expected_exception: 预期的异常类型
+        window: 滑动窗口长度（秒），默认按累计失败次数熔断
 
     Returns:
         装饰器函数
     """
-    breaker = CircuitBreaker(failure_threshold, timeout, expected_exception)
+    breaker = CircuitBreaker(failure_threshold, timeout, expected_exception, window)
 
     def decorator(func: Callable) -> Callable:
-        @wraps(func)
-        def wrapper(*args, **kwargs):
-            return breaker.call(func, *args, **kwargs)
+        call = breaker.call
 
+        def wrapper(*args, **kwargs):
+            return call(func, *args, **kwargs)
+
+        # 只复制常用的元信息，不使用functools.wraps；
+        # 与wraps一样容忍缺少这些属性的可调用对象（如functools.partial）
+        wrapper.__name__ = getattr(func, "__name__", wrapper.__name__)
+        wrapper.__qualname__ = getattr(func, "__qualname__", wrapper.__qualname__)
+        wrapper.__doc__ = getattr(func, "__doc__", None)
+        wrapper.__module__ = getattr(func, "__module__", wrapper.__module__)
+        wrapper.__wrapped__ = func
         return wrapper
 
     return decorator
@@ -705,6 +854,8 @@ def circuit_breaker(
 class error_context:
     """错误上下文管理器"""
 
+    __slots__ = ("context", "error", "error_handler", "suppress")
+
     def __init__(
         self,
         error_handler: Optional[ErrorHandler] = None,
@@ -715,11 +866,11 @@ class error_context:
         初始化错误上下文管理器
 
         Args:
-            error_handler: 错误处理器
+            error_handler: 错误处理器，默认在出错时使用global_error_handler
             context: 上下文信息
             suppress: 是否抑制异常
         """
-        self.error_handler = error_handler or ErrorHandler()
+        self.error_handler = error_handler
         self.context = context or {}
         self.suppress = suppress
         self.error = None
@@ -730,7 +881,9 @@ class error_context:
     def __exit__(self, exc_type, exc_val, exc_tb):
         if exc_type is not None:
             self.error = exc_val
-            self.error_handler.handle_error(exc_val, self.context)
+            # 仅在出错时才解析处理器，未指定时复用全局实例而不是每次新建
+            handler = self.error_handler or global_error_handler
+            handler.handle_error(exc_val, self.context)
 
             if self.suppress:
                 return True
@@ -743,8 +896,19 @@ class error_context:
 # =============================================================================
 
 
+# 没有正在处理的异常时traceback.format_exc()的返回值
+_NO_ACTIVE_TRACEBACK = "NoneType: None\n"
+
+# format_exception结果的模板，复制已建好的字典比逐个插入键更快
+_ERROR_INFO_TEMPLATE: Dict[str, Any] = dict.fromkeys(
+    ("error_type", "error_message", "error_args")
+)
+
+
 def format_exception(
-    error: Exception, include_traceback: bool = True
+    error: Exception,
+    include_traceback: bool = True,
+    tb: Optional[TracebackType] = None,
 ) -> Dict[str, Any]:
     """
     格式化异常信息
@@ -752,23 +916,33 @@ def format_exception(
     Args:
         error: 异常对象
         include_traceback: 是否包含堆栈跟踪
+        tb: 堆栈跟踪对象，默认使用error.__traceback__
 
     Returns:
         格式化后的异常信息
     """
-    error_info = {
-        "error_type": type(error).__name__,
-        "error_message": str(error),
-        "error_args": error.args,
-    }
+    error_type = type(error)
+    error_info = _ERROR_INFO_TEMPLATE.copy()
+    error_info["error_type"] = error_type.__name__
+    error_info["error_message"] = str(error)
+    error_info["error_args"] = error.args
 
     # 如果是自定义异常，包含额外信息
     if isinstance(error, BaseError):
         error_info.update(error.to_dict())
 
-    # 包含堆栈跟踪
+    # 包含堆栈跟踪：优先直接格式化异常自带的堆栈，不再经过sys.exc_info()
     if include_traceback:
-        error_info["traceback"] = traceback.format_exc()
+        tb = tb or error.__traceback__
+        if tb is not None:
+            error_info["traceback"] = "".join(
+                traceback.format_exception(error_type, error, tb)
+            )
+        elif sys.exc_info()[0] is None:
+            # 没有正在处理的异常时不必走format_exc，结果相同
+            error_info["traceback"] = _NO_ACTIVE_TRACEBACK
+        else:
+            error_info["traceback"] = traceback.format_exc()
 
     return error_info
 
@@ -785,8 +959,11 @@ def get_exception_chain(error: Exception) -> list:
     """
     chain = []
     current = error
+    seen = set()
 
-    while current is not None:
+    # 记录已访问的异常，手动构造的循环链不会导致死循环
+    while current is not None and id(current) not in seen:
+        seen.add(id(current))
         chain.append(
             {
                 "type": type(current).__name__,
@@ -819,12 +996,10 @@ def setup_global_exception_handler(error_handler: Optional[ErrorHandler] = None)
             sys.__excepthook__(exc_type, exc_value, exc_traceback)
             return
 
+        # 直接传递堆栈对象，日志记录时才格式化，不再预先拼接成字符串
         handler.handle_error(
             exc_value,
-            {
-                "exc_type": exc_type.__name__,
-                "exc_traceback": "".join(traceback.format_tb(exc_traceback)),
-            },
+            {"exc_type": exc_type.__name__, "exc_traceback": exc_traceback},
         )
 
     sys.excepthook = handle_exception
@@ -859,7 +1034,31 @@ def safe_execute(
         return func(*args, **kwargs)
     except Exception as e:
         if log_errors:
-            logger.error(f"安全执行函数 {func.__name__} 失败: {e}", exc_info=True)
+            # 使用%格式化，日志级别被过滤时不构造消息
+            logger.error("安全执行函数 %s 失败: %s", func.__name__, e, exc_info=True)
+        return default_return
+
+
+def safe_execute_nolog(
+    func: Callable, *args, default_return: Any = None, **kwargs
+) -> Any:
+    """
+    安全执行函数，失败时不记录日志
+
+    与safe_execute(log_errors=False)等价，供频繁调用的场景使用。
+
+    Args:
+        func: 要执行的函数
+        *args: 位置参数
+        default_return: 默认返回值
+        **kwargs: 关键字参数
+
+    Returns:
+        函数结果或默认值
+    """
+    try:
+        return func(*args, **kwargs)
+    except Exception:
         return default_return
 
 
@@ -892,9 +1091,7 @@ def reraise_with_context(error: Exception, context: str) -> None:
         error: 原始异常
         context: 上下文信息
     """
-    new_message = f"{context}: {error}"
-    if isinstance(error, BaseError):
-        error.message = new_message
-        raise error
-    else:
-        raise type(error)(new_message) from error
+    # 以异常注释(PEP 678)追加上下文，多层调用时不会反复拼接消息，
+    # 原异常的类型、消息和堆栈保持不变，traceback输出时会自动显示注释
+    error.add_note(context)
+    raise error
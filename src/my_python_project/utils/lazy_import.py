@@ -8,7 +8,8 @@ import importlib
 import importlib.util
 import sys
 import warnings
-from typing import Any, Callable, Dict, Optional
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Mapping, Optional, Set, Tuple
 
 
 class LazyImport:
@@ -27,44 +28,74 @@ class LazyImport:
         self._module = None
         self._value = None
         self._imported = False
+        self._available: Optional[bool] = None
 
     def __getattr__(self, name: str) -> Any:
         """获取属性时触发导入"""
-        if not self._imported:
-            self._import()
-
-        if self.attribute:
-            return getattr(self._value, name)
-        else:
-            return getattr(self._module, name)
+        self._import()
+        # 导入后类已切换，按新类的规则取属性
+        return getattr(self, name)
 
     def __call__(self, *args, **kwargs) -> Any:
         """调用时触发导入"""
-        if not self._imported:
-            self._import()
-
-        if self.attribute:
-            return self._value(*args, **kwargs)
-        else:
-            return self._module(*args, **kwargs)
+        self._import()
+        return self(*args, **kwargs)
 
     def _import(self) -> None:
         """执行实际导入"""
         try:
-            self._module = importlib.import_module(self.module_name)
-            if self.attribute:
-                self._value = getattr(self._module, self.attribute)
-            self._imported = True
+            module = importlib.import_module(self.module_name)
         except ImportError as e:
             raise ImportError(f"无法导入 {self.module_name}: {e}")
+        self._loaded(module)
 
-    def is_available(self) -> bool:
-        """检查模块是否可用"""
-        try:
-            importlib.util.find_spec(self.module_name)
-            return True
-        except (ImportError, AttributeError, ValueError):
-            return False
+    def _loaded(self, module: Any) -> None:
+        """
+        记录导入结果，并把实例的类切换为导入后的转发类
+
+        切换后属性访问和调用直接转发给目标对象，不再检查是否已导入、
+        是否指定了属性（与importlib.util.LazyLoader的做法相同）。
+        """
+        self._module = module
+        if self.attribute:
+            self._value = getattr(module, self.attribute)
+            self.__class__ = _LoadedAttribute
+        else:
+            self.__class__ = _LoadedModule
+        self._imported = True
+
+    def is_available(self, refresh: bool = False) -> bool:
+        """
+        检查模块是否可用
+
+        结果会被缓存，安装或卸载模块后可传入refresh=True重新检查。
+        """
+        if self._available is None or refresh:
+            try:
+                self._available = importlib.util.find_spec(self.module_name) is not None
+            except (ImportError, AttributeError, ValueError):
+                self._available = False
+        return self._available
+
+
+class _LoadedModule(LazyImport):
+    """已导入模块的LazyImport，转发到模块"""
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._module, name)
+
+    def __call__(self, *args, **kwargs) -> Any:
+        return self._module(*args, **kwargs)
+
+
+class _LoadedAttribute(LazyImport):
+    """已导入属性的LazyImport，转发到属性值"""
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._value, name)
+
+    def __call__(self, *args, **kwargs) -> Any:
+        return self._value(*args, **kwargs)
 
 
 class LazyModule:
@@ -96,8 +127,17 @@ class LazyModule:
             raise ImportError(f"无法导入模块 {self.__name__}: {e}")
 
 
-# 全局延迟导入注册表
-_lazy_imports: Dict[str, LazyImport] = {}
+# 后台预加载模块时的最大线程数
+_PRELOAD_MAX_WORKERS = 8
+
+# 全局延迟导入注册表，键为 (模块名称, 属性名称)
+_lazy_imports: Dict[Tuple[str, Optional[str]], LazyImport] = {}
+
+# import_optional已发出过缺失警告的模块，键为 (模块名称, 包名)
+_warned_optional: Set[Tuple[str, Optional[str]]] = set()
+
+# conditional_import导入失败的模块及其异常，避免重复遍历sys.meta_path
+_missing_modules: Dict[str, ImportError] = {}
 
 
 def lazy_import(module_name: str, attribute: Optional[str] = None) -> LazyImport:
@@ -111,12 +151,22 @@ def lazy_import(module_name: str, attribute: Optional[str] = None) -> LazyImport
     Returns:
         延迟导入对象
     """
-    key = f"{module_name}.{attribute}" if attribute else module_name
+    key = (module_name, attribute)
+    lazy = _lazy_imports.get(key)
+    if lazy is None:
+        lazy = _lazy_imports[key] = LazyImport(module_name, attribute)
 
-    if key not in _lazy_imports:
-        _lazy_imports[key] = LazyImport(module_name, attribute)
+    # 模块已被其他地方导入时直接完成绑定，省去首次访问时的导入流程
+    if not lazy._imported:
+        module = sys.modules.get(module_name)
+        if module is not None:
+            try:
+                lazy._loaded(module)
+            except AttributeError:
+                # 属性不存在时保持延迟，访问时再报错
+                pass
 
-    return _lazy_imports[key]
+    return lazy
 
 
 def conditional_import(
@@ -125,6 +175,9 @@ def conditional_import(
     """
     条件导入，如果导入失败返回fallback
 
+    已导入的模块直接从sys.modules返回；导入失败的结果会被缓存，
+    之后同名调用不再重新查找，error_handler收到的是首次失败时的异常。
+
     Args:
         module_name: 模块名称
         fallback: 导入失败时的备用值
@@ -133,18 +186,28 @@ def conditional_import(
     Returns:
         导入的模块或fallback值
     """
-    try:
-        return importlib.import_module(module_name)
-    except ImportError as e:
-        if error_handler:
-            error_handler(e)
-        return fallback
+    module = sys.modules.get(module_name)
+    if module is not None:
+        return module
+
+    error = _missing_modules.get(module_name)
+    if error is None:
+        try:
+            return importlib.import_module(module_name)
+        except ImportError as e:
+            _missing_modules[module_name] = error = e
+
+    if error_handler:
+        error_handler(error)
+    return fallback
 
 
 def import_optional(module_name: str, package: Optional[str] = None) -> Optional[Any]:
     """
     可选导入，失败时返回None并发出警告
 
+    同一模块的缺失警告只发出一次，反复探测时不再重复构造警告。
+
     Args:
         module_name: 模块名称
         package: 包名
@@ -155,7 +218,10 @@ def import_optional(module_name: str, package: Optional[str] = None) -> Optional
     try:
         return importlib.import_module(module_name, package)
     except ImportError:
-        warnings.warn(f"可选模块 {module_name} 未安装", ImportWarning, stacklevel=2)
+        key = (module_name, package)
+        if key not in _warned_optional:
+            _warned_optional.add(key)
+            warnings.warn(f"可选模块 {module_name} 未安装", ImportWarning, stacklevel=2)
         return None
 
 
@@ -172,36 +238,56 @@ def preload_modules(module_names: list, background: bool = False) -> Dict[str, A
     """
     modules = {}
 
-    def load_module(name: str) -> None:
-        try:
-            modules[name] = importlib.import_module(name)
-        except ImportError as e:
-            warnings.warn(f"预加载模块 {name} 失败: {e}", stacklevel=2)
-
-    if background:
-        import threading
-
-        threads = []
-        for name in module_names:
-            thread = threading.Thread(target=load_module, args=(name,))
-            thread.start()
-            threads.append(thread)
-
-        for thread in threads:
-            thread.join()
+    if background and module_names:
+        from concurrent.futures import ThreadPoolExecutor
+
+        # 线程数有上限，多个模块的导入仍受导入锁限制，但读取文件可以重叠
+        with ThreadPoolExecutor(
+            max_workers=min(_PRELOAD_MAX_WORKERS, len(module_names))
+        ) as executor:
+            futures = {
+                name: executor.submit(importlib.import_module, name)
+                for name in module_names
+            }
+
+        for name, future in futures.items():
+            try:
+                modules[name] = future.result()
+            except ImportError as e:
+                warnings.warn(f"预加载模块 {name} 失败: {e}", stacklevel=2)
     else:
         for name in module_names:
-            load_module(name)
+            try:
+                modules[name] = importlib.import_module(name)
+            except ImportError as e:
+                warnings.warn(f"预加载模块 {name} 失败: {e}", stacklevel=2)
 
     return modules
 
 
-# 常用的延迟导入对象
-pandas = lazy_import("pandas")
-numpy = lazy_import("numpy")
-requests = lazy_import("requests")
-yaml_loader = lazy_import("yaml", "safe_load")
-redis_client = lazy_import("redis", "Redis")
+# 常用的延迟导入对象：名称 -> (模块名称, 属性名称)，只读
+_LAZY_SPECS: Mapping[str, Tuple[str, Optional[str]]] = MappingProxyType(
+    {
+        "pandas": ("pandas", None),
+        "numpy": ("numpy", None),
+        "requests": ("requests", None),
+        "yaml_loader": ("yaml", "safe_load"),
+        "redis_client": ("redis", "Redis"),
+    }
+)
+
+
+def __getattr__(name: str) -> Any:
+    """
+    首次访问常用延迟导入对象时才创建（PEP 562）
+
+    创建后写入模块全局变量，之后的访问不再经过这里。
+    """
+    spec = _LAZY_SPECS.get(name)
+    if spec is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = globals()[name] = lazy_import(*spec)
+    return value
 
 
 class OptionalDependency:
@@ -210,6 +296,8 @@ class OptionalDependency:
     def __init__(self) -> None:
         self._available: Dict[str, bool] = {}
         self._modules: Dict[str, Any] = {}
+        # 依赖名称 -> 模块名称，模块在首次使用时才导入
+        self._specs: Dict[str, str] = {}
 
     def register(
         self, name: str, module_name: str, install_hint: Optional[str] = None
@@ -217,37 +305,51 @@ class OptionalDependency:
         """
         注册可选依赖
 
+        只通过find_spec检查模块能否找到，不执行模块代码。
+
         Args:
             name: 依赖名称
             module_name: 模块名称
             install_hint: 安装提示
         """
+        self._specs[name] = module_name
+        self._modules.pop(name, None)
         try:
-            module = importlib.import_module(module_name)
-            self._available[name] = True
-            self._modules[name] = module
-        except ImportError:
-            self._available[name] = False
-            if install_hint:
-                warnings.warn(
-                    f"可选依赖 {name} 未安装。安装命令: {install_hint}",
-                    ImportWarning,
-                    stacklevel=2,
-                )
+            available = importlib.util.find_spec(module_name) is not None
+        except (ImportError, AttributeError, ValueError):
+            available = False
+
+        self._available[name] = available
+        if not available and install_hint:
+            warnings.warn(
+                f"可选依赖 {name} 未安装。安装命令: {install_hint}",
+                ImportWarning,
+                stacklevel=2,
+            )
 
     def is_available(self, name: str) -> bool:
         """检查依赖是否可用"""
         return self._available.get(name, False)
 
     def get_module(self, name: str) -> Optional[Any]:
-        """获取模块"""
-        return self._modules.get(name)
+        """获取模块，首次获取时导入"""
+        module = self._modules.get(name)
+        if module is None and self._available.get(name):
+            try:
+                module = importlib.import_module(self._specs[name])
+            except ImportError:
+                # 能找到但导入失败（如依赖缺失），视为不可用
+                self._available[name] = False
+                return None
+            self._modules[name] = module
+        return module
 
     def require(self, name: str) -> Any:
         """要求依赖必须可用"""
-        if not self.is_available(name):
+        module = self.get_module(name) if self.is_available(name) else None
+        if module is None:
             raise ImportError(f"必需的依赖 {name} 不可用")
-        return self._modules[name]
+        return module
 
 
 # 全局可选依赖管理器
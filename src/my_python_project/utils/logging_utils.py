@@ -3,19 +3,99 @@
 提供灵活的日志配置、结构化日志、异步日志和性能监控功能。
 """
 
+import atexit
 import json
 import logging
 import logging.config
 import os
+import queue
 import sys
 import threading
 import time
 import traceback
 from contextlib import contextmanager
 from datetime import datetime
-from functools import wraps
+from functools import lru_cache, wraps
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional, Union
+from typing import Any, Callable, Dict, Iterator, List, Optional, Union
+
+# 项目默认日志选项
+_DEFAULT_ENABLE_FILE_LOGGING = True
+_DEFAULT_ENABLE_ROTATION = True
+_DEFAULT_LOG_FORMAT = "standard"
+
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+try:
+    import msgpack
+
+    HAS_MSGPACK = True
+except ImportError:
+    HAS_MSGPACK = False
+
+# LogRecord的标准属性及JsonFormatter已输出的字段，不作为额外字段输出
+_STANDARD_RECORD_KEYS = frozenset(
+    {
+        "name",
+        "msg",
+        "args",
+        "levelname",
+        "levelno",
+        "pathname",
+        "filename",
+        "module",
+        "exc_info",
+        "exc_text",
+        "stack_info",
+        "lineno",
+        "funcName",
+        "created",
+        "msecs",
+        "relativeCreated",
+        "thread",
+        "threadName",
+        "processName",
+        "process",
+        "taskName",
+        "getMessage",
+        # JsonFormatter自身输出的字段
+        "timestamp",
+        "level",
+        "logger",
+        "message",
+        "function",
+        "line",
+        "exception",
+    }
+)
+
+
+def _dumps_log_json(data: Dict[str, Any]) -> str:
+    """序列化日志数据，优先使用orjson
+
+    日期、dataclass和内置类型的子类与标准库一样交给default=str处理。
+    orjson输出不含分隔空格，NaN/Infinity写作null，普通Enum成员记录为其值。
+    """
+    if HAS_ORJSON:
+        try:
+            return orjson.dumps(
+                data,
+                default=str,
+                option=orjson.OPT_NON_STR_KEYS
+                | orjson.OPT_PASSTHROUGH_DATETIME
+                | orjson.OPT_PASSTHROUGH_DATACLASS
+                | orjson.OPT_PASSTHROUGH_SUBCLASS,
+            ).decode("utf-8")
+        except orjson.JSONEncodeError:
+            # 如超过64位的整数，交给标准库处理
+            pass
+    return json.dumps(data, ensure_ascii=False, default=str)
 
 
 class JsonFormatter(logging.Formatter):
@@ -29,6 +109,8 @@ class JsonFormatter(logging.Formatter):
         """
         super().__init__()
         self.include_extra = include_extra
+        # 最近一次格式化的整秒及其时间戳文本，同一秒内的记录只需拼接微秒
+        self._second_cache = (None, "")
 
     def format(self, record: logging.LogRecord) -> str:
         """格式化日志记录为JSON。
@@ -39,8 +121,19 @@ class JsonFormatter(logging.Formatter):
         Returns:
             格式化后的JSON字符串
         """
+        return _dumps_log_json(self._build_log_data(record))
+
+    def _build_log_data(self, record: logging.LogRecord) -> Dict[str, Any]:
+        """把日志记录整理为可序列化的字典。
+
+        Args:
+            record: 日志记录
+
+        Returns:
+            日志数据字典
+        """
         log_data = {
-            "timestamp": datetime.fromtimestamp(record.created).isoformat(),
+            "timestamp": self._format_timestamp(record.created),
             "level": record.levelname,
             "logger": record.name,
             "message": record.getMessage(),
@@ -59,36 +152,219 @@ class JsonFormatter(logging.Formatter):
 
         # 添加额外字段
         if self.include_extra:
-            for key, value in record.__dict__.items():
-                if key not in log_data and not key.startswith("_"):
-                    # 过滤标准字段
-                    if key not in [
-                        "name",
-                        "msg",
-                        "args",
-                        "levelname",
-                        "levelno",
-                        "pathname",
-                        "filename",
-                        "module",
-                        "exc_info",
-                        "exc_text",
-                        "stack_info",
-                        "lineno",
-                        "funcName",
-                        "created",
-                        "msecs",
-                        "relativeCreated",
-                        "thread",
-                        "threadName",
-                        "processName",
-                        "process",
-                        "getMessage",
-                    ]:
-                        log_data["extra"] = log_data.get("extra", {})
-                        log_data["extra"][key] = value
-
-        return json.dumps(log_data, ensure_ascii=False, default=str)
+            extra = {
+                key: value
+                for key, value in record.__dict__.items()
+                if key not in _STANDARD_RECORD_KEYS and not key.startswith("_")
+            }
+            if extra:
+                log_data["extra"] = extra
+
+        return log_data
+
+    def _format_timestamp(self, created: float) -> str:
+        """格式化时间戳，结果与datetime.fromtimestamp(created).isoformat()一致。
+
+        Args:
+            created: 日志记录的创建时间
+
+        Returns:
+            ISO格式的本地时间
+        """
+        # 与datetime.fromtimestamp相同，微秒按四舍六入五成双取整
+        second = int(created)
+        microsecond = round((created - second) * 1e6)
+        if microsecond >= 1000000:
+            second += 1
+            microsecond -= 1000000
+
+        cached_second, prefix = self._second_cache
+        if second != cached_second:
+            prefix = datetime.fromtimestamp(second).isoformat()
+            self._second_cache = (second, prefix)
+
+        if microsecond:
+            return f"{prefix}.{microsecond:06d}"
+        return prefix
+
+
+class MsgPackFormatter(JsonFormatter):
+    """MessagePack格式的日志格式化器。
+
+    字段与JsonFormatter相同，输出为bytes，需配合MsgPackFileHandler使用。
+    msgpack记录自带长度信息，可直接首尾相接写入文件。
+    """
+
+    def __init__(self, include_extra: bool = True):
+        """初始化MessagePack格式化器。
+
+        Args:
+            include_extra: 是否包含额外字段
+        """
+        if not HAS_MSGPACK:
+            raise ImportError("需要安装msgpack: pip install msgpack")
+        super().__init__(include_extra)
+
+    def format(self, record: logging.LogRecord) -> bytes:  # type: ignore[override]
+        """格式化日志记录为MessagePack。
+
+        Args:
+            record: 日志记录
+
+        Returns:
+            格式化后的字节串
+        """
+        return msgpack.packb(
+            self._build_log_data(record), use_bin_type=True, default=str
+        )
+
+
+class BufferedRotatingFileHandler(RotatingFileHandler):
+    """带写缓冲和定时刷新的轮转文件handler。
+
+    记录先写入大块缓冲区，由后台线程按固定间隔刷新到文件，
+    把每条记录一次write系统调用合并为少量大块写入。
+    flush_interval为None时每条记录写入后立即刷新。
+    """
+
+    def __init__(
+        self,
+        filename: Union[str, Path],
+        maxBytes: int = 0,
+        backupCount: int = 0,
+        encoding: str = "utf-8",
+        flush_interval: Optional[float] = None,
+        buffer_size: int = 1 << 20,
+    ):
+        """初始化缓冲文件handler。
+
+        Args:
+            filename: 日志文件路径
+            maxBytes: 单文件最大字节数，0表示不轮转
+            backupCount: 备份文件数量
+            encoding: 文本编码
+            flush_interval: 刷新间隔（秒），None表示每条记录立即刷新
+            buffer_size: 写缓冲区大小（字节）
+        """
+        # 文件在首次写入时以二进制模式打开
+        super().__init__(
+            filename,
+            maxBytes=maxBytes,
+            backupCount=backupCount,
+            encoding=encoding,
+            delay=True,
+        )
+        self.mode = "ab"
+        self.flush_interval = flush_interval
+        self.buffer_size = buffer_size
+        # 当前文件大小；文本流的tell()会强制刷新缓冲，因此自行累计
+        self._size = 0
+        self._flusher: Optional[threading.Thread] = None
+        self._stop_flusher = threading.Event()
+
+    def _open(self):
+        stream = open(self.baseFilename, "ab", buffering=self.buffer_size)
+        self._size = os.fstat(stream.fileno()).st_size
+        return stream
+
+    def _encode(self, record: logging.LogRecord) -> bytes:
+        """把日志记录格式化为要写入的字节。"""
+        return (self.format(record) + self.terminator).encode(self.encoding)
+
+    def _start_flusher(self) -> None:
+        """启动后台定时刷新线程。"""
+        self._flusher = threading.Thread(
+            target=self._flush_periodically, name="log-flusher", daemon=True
+        )
+        self._flusher.start()
+
+    def _flush_periodically(self) -> None:
+        while not self._stop_flusher.wait(self.flush_interval):
+            # logging.shutdown()持有handler锁调用close()并等待本线程结束，
+            # 这里不能阻塞在锁上；锁被占用时跳过本次刷新
+            if not self.lock.acquire(blocking=False):
+                continue
+            try:
+                self.flush()
+            finally:
+                self.lock.release()
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """写入一条日志记录。
+
+        Args:
+            record: 日志记录
+        """
+        try:
+            data = self._encode(record)
+            if self.stream is None:
+                self.stream = self._open()
+                if self.flush_interval is not None and self._flusher is None:
+                    self._start_flusher()
+            if self.maxBytes > 0 and self._size:
+                if self._size + len(data) >= self.maxBytes:
+                    self.doRollover()
+                    self.stream = self._open()
+            self.stream.write(data)
+            self._size += len(data)
+            if self.flush_interval is None:
+                self.flush()
+        except Exception:
+            self.handleError(record)
+
+    def close(self) -> None:
+        """停止刷新线程并写出缓冲区中剩余的记录。"""
+        self._stop_flusher.set()
+        flusher = self._flusher
+        if flusher is not None and flusher is not threading.current_thread():
+            flusher.join()
+        super().close()
+
+
+class MsgPackFileHandler(BufferedRotatingFileHandler):
+    """以二进制追加方式写入MessagePack记录的轮转文件handler。"""
+
+    def __init__(
+        self,
+        filename: Union[str, Path],
+        maxBytes: int = 0,
+        backupCount: int = 0,
+        flush_interval: Optional[float] = None,
+    ):
+        """初始化MessagePack文件handler。
+
+        Args:
+            filename: 日志文件路径
+            maxBytes: 单文件最大字节数，0表示不轮转
+            backupCount: 备份文件数量
+            flush_interval: 刷新间隔（秒），None表示每条记录立即刷新
+        """
+        super().__init__(
+            filename,
+            maxBytes=maxBytes,
+            backupCount=backupCount,
+            flush_interval=flush_interval,
+        )
+
+    def _encode(self, record: logging.LogRecord) -> bytes:
+        # msgpack记录自带长度信息，不追加换行符
+        return self.format(record)
+
+
+def read_msgpack_log(log_file: Union[str, Path]) -> Iterator[Dict[str, Any]]:
+    """逐条读取MsgPackFileHandler写入的日志记录。
+
+    Args:
+        log_file: 日志文件路径
+
+    Yields:
+        日志数据字典
+    """
+    if not HAS_MSGPACK:
+        raise ImportError("需要安装msgpack: pip install msgpack")
+
+    with open(log_file, "rb") as f:
+        yield from msgpack.Unpacker(f, raw=False)
 
 
 class PerformanceFilter(logging.Filter):
@@ -112,30 +388,75 @@ class PerformanceFilter(logging.Filter):
         Returns:
             是否应该记录该日志
         """
-        # 如果记录包含duration字段，检查是否超过最小时长
-        if hasattr(record, "duration"):
-            return record.duration >= self.min_duration
-        return True
+        # 如果记录包含duration字段，检查是否超过最小时长；
+        # 不含该字段时默认值等于阈值，比较结果为True，无需hasattr
+        min_duration = self.min_duration
+        return getattr(record, "duration", min_duration) >= min_duration
+
+
+class LocalQueueHandler(QueueHandler):
+    """进程内队列handler。
+
+    队列只在本进程内传递，记录无需序列化，因此跳过QueueHandler.prepare
+    中的完整格式化和复制，调用线程只合并消息参数后入队。
+    """
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """将日志记录放入队列。
+
+        Args:
+            record: 日志记录
+        """
+        try:
+            # 在调用线程合并参数，之后参数对象被修改也不影响记录的消息
+            record.msg = record.getMessage()
+            record.args = None
+            self.enqueue(record)
+        except Exception:
+            self.handleError(record)
+
+
+# 各日志记录器的后台队列监听器，键为日志记录器名称
+_queue_listeners: Dict[Optional[str], QueueListener] = {}
+_queue_listeners_lock = threading.Lock()
+
+
+def _stop_queue_listener(name: Optional[str]) -> None:
+    """停止指定日志记录器的队列监听器并关闭其handlers。"""
+    with _queue_listeners_lock:
+        listener = _queue_listeners.pop(name, None)
+    if listener is not None:
+        listener.stop()
+        for handler in listener.handlers:
+            handler.close()
+
+
+@atexit.register
+def _stop_all_queue_listeners() -> None:
+    """退出时停止所有队列监听器，确保队列中的日志写出。"""
+    for name in list(_queue_listeners):
+        _stop_queue_listener(name)
 
 
 class LoggerManager:
-    """日志管理器，提供集中的日志配置和管理。"""
+    """日志管理器，提供集中的日志配置和管理。
+
+    单例在模块导入时创建（导入过程由导入锁串行化），
+    之后LoggerManager()和get_logger_manager()都直接返回该实例，无需加锁。
+    """
 
-    _instance = None
-    _lock = threading.Lock()
+    _instance: Optional["LoggerManager"] = None
+
+    loggers: Dict[str, logging.Logger]
+    config: Dict[str, Any]
 
     def __new__(cls):
-        if cls._instance is None:
-            with cls._lock:
-                if cls._instance is None:
-                    cls._instance = super().__new__(cls)
-        return cls._instance
-
-    def __init__(self):
-        if not hasattr(self, "initialized"):
-            self.loggers: Dict[str, logging.Logger] = {}
-            self.config: Dict[str, Any] = {}
-            self.initialized = True
+        instance = cls._instance
+        if instance is None:
+            instance = cls._instance = super().__new__(cls)
+            instance.loggers = {}
+            instance.config = {}
+        return instance
 
     def setup_from_config(self, config_path: Union[str, Path]) -> None:
         """从配置文件设置日志。
@@ -173,6 +494,46 @@ class LoggerManager:
         return self.loggers[name]
 
 
+# 模块级日志管理器实例
+_logger_manager = LoggerManager()
+
+
+def get_logger_manager() -> LoggerManager:
+    """获取全局日志管理器。
+
+    Returns:
+        日志管理器实例
+    """
+    return _logger_manager
+
+
+@lru_cache(maxsize=32)
+def _make_formatter(
+    log_format: str, date_format: str = "%Y-%m-%d %H:%M:%S"
+) -> logging.Formatter:
+    """按格式创建格式化器，相同参数的handlers共享同一个实例。
+
+    Args:
+        log_format: 日志格式（"json"、"msgpack"、"standard"、"custom"或格式字符串）
+        date_format: 日期格式
+
+    Returns:
+        格式化器
+    """
+    if log_format == "json":
+        return JsonFormatter()
+    if log_format == "msgpack":
+        return MsgPackFormatter()
+
+    if log_format == "standard":
+        format_string = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+    elif log_format == "custom":
+        format_string = "[%(asctime)s] %(name)s.%(funcName)s:%(lineno)d - %(levelname)s - %(message)s"
+    else:
+        format_string = log_format
+    return logging.Formatter(format_string, date_format)
+
+
 def setup_advanced_logger(
     name: Optional[str] = None,
     level: Union[str, int] = logging.INFO,
@@ -181,10 +542,12 @@ def setup_advanced_logger(
     date_format: str = "%Y-%m-%d %H:%M:%S",
     max_bytes: int = 10 * 1024 * 1024,
     backup_count: int = 5,
-    enable_rotation: bool = "yes" == "yes",
+    enable_rotation: bool = _DEFAULT_ENABLE_ROTATION,
     json_format: bool = False,
     include_console: bool = True,
     performance_threshold: float = 0.0,
+    use_queue: bool = False,
+    flush_interval_ms: Optional[int] = None,
 ) -> logging.Logger:
     """设置高级日志记录器。
 
@@ -192,7 +555,8 @@ def setup_advanced_logger(
         name: 日志记录器名称
         level: 日志级别
         log_file: 日志文件路径
-        log_format: 日志格式
+        log_format: 日志格式，"msgpack"时文件以MessagePack二进制格式写入，
+            控制台仍输出JSON
         date_format: 日期格式
         max_bytes: 单文件最大字节数
         backup_count: 备份文件数量
@@ -200,6 +564,10 @@ def setup_advanced_logger(
         json_format: 是否使用JSON格式
         include_console: 是否包含控制台输出
         performance_threshold: 性能监控阈值
+        use_queue: 是否通过队列由后台线程完成格式化和写入，
+            调用线程只负责入队；日志会异步写出
+        flush_interval_ms: 文件日志的刷新间隔（毫秒），设置后记录先写入缓冲区，
+            由后台线程定时刷新；默认每条记录立即写入文件
 
     Returns:
         配置好的日志记录器
@@ -214,18 +582,15 @@ def setup_advanced_logger(
 
     # 清除现有handlers
     logger.handlers.clear()
+    _stop_queue_listener(name)
+    handlers: List[logging.Handler] = []
 
     # 选择格式化器
-    if json_format or log_format == "json":
-        formatter = JsonFormatter()
+    use_msgpack = log_format == "msgpack"
+    if json_format or log_format == "json" or use_msgpack:
+        formatter = _make_formatter("json")
     else:
-        if log_format == "standard":
-            format_string = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-        elif log_format == "custom":
-            format_string = "[%(asctime)s] %(name)s.%(funcName)s:%(lineno)d - %(levelname)s - %(message)s"
-        else:
-            format_string = log_format
-        formatter = logging.Formatter(format_string, date_format)
+        formatter = _make_formatter(log_format, date_format)
 
     # 添加控制台handler
     if include_console:
@@ -237,16 +602,31 @@ def setup_advanced_logger(
         if performance_threshold > 0:
             console_handler.addFilter(PerformanceFilter(performance_threshold))
 
-        logger.addHandler(console_handler)
+        handlers.append(console_handler)
 
     # 添加文件handler
     if log_file:
         log_path = Path(log_file)
         log_path.parent.mkdir(parents=True, exist_ok=True)
 
-        if enable_rotation:
-            from logging.handlers import RotatingFileHandler
-
+        flush_interval = (
+            flush_interval_ms / 1000 if flush_interval_ms is not None else None
+        )
+        if use_msgpack:
+            file_handler = MsgPackFileHandler(
+                log_path,
+                maxBytes=max_bytes if enable_rotation else 0,
+                backupCount=backup_count,
+                flush_interval=flush_interval,
+            )
+        elif flush_interval is not None:
+            file_handler = BufferedRotatingFileHandler(
+                log_path,
+                maxBytes=max_bytes if enable_rotation else 0,
+                backupCount=backup_count,
+                flush_interval=flush_interval,
+            )
+        elif enable_rotation:
             file_handler = RotatingFileHandler(
                 log_path, maxBytes=max_bytes, backupCount=backup_count, encoding="utf-8"
             )
@@ -254,13 +634,27 @@ def setup_advanced_logger(
             file_handler = logging.FileHandler(log_path, encoding="utf-8")
 
         file_handler.setLevel(level)
-        file_handler.setFormatter(formatter)
+        file_handler.setFormatter(
+            _make_formatter("msgpack") if use_msgpack else formatter
+        )
 
         # 添加性能过滤器
         if performance_threshold > 0:
             file_handler.addFilter(PerformanceFilter(performance_threshold))
 
-        logger.addHandler(file_handler)
+        handlers.append(file_handler)
+
+    if use_queue and handlers:
+        # 真正的handlers由后台监听线程持有，SimpleQueue的put/get无需额外加锁
+        log_queue: queue.SimpleQueue = queue.SimpleQueue()
+        listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+        with _queue_listeners_lock:
+            _queue_listeners[name] = listener
+        listener.start()
+        logger.addHandler(LocalQueueHandler(log_queue))
+    else:
+        for handler in handlers:
+            logger.addHandler(handler)
 
     return logger
 
@@ -294,7 +688,7 @@ def get_project_logger(
         if log_file is not None:
             # 用户指定了自定义路径
             final_log_file = log_file
-        elif "yes" == "yes":
+        elif _DEFAULT_ENABLE_FILE_LOGGING:
             # 使用默认路径
             final_log_file = "logs/my_python_project.log"
         else:
@@ -305,7 +699,7 @@ def get_project_logger(
             name=logger_name,
             level="INFO",
             log_file=final_log_file,
-            json_format="standard" == "json",
+            log_format=_DEFAULT_LOG_FORMAT,
         )
 
     return logger
@@ -331,40 +725,49 @@ def log_performance(
             if logger is None:
                 logger = get_project_logger(func.__module__)
 
-            start_time = time.time()
             func_name = func.__qualname__
+            # 级别未启用时跳过参数repr和日志构造，只保留计时
+            enabled = logger.isEnabledFor(level)
+            start_time = time.perf_counter_ns()
 
             try:
                 # 记录函数开始
-                if include_args:
-                    args_repr = [repr(a) for a in args[:3]]  # 限制参数数量
-                    kwargs_repr = [f"{k}={v!r}" for k, v in list(kwargs.items())[:3]]
-                    signature = ", ".join(args_repr + kwargs_repr)
-                    logger.log(level, f"开始执行 {func_name}({signature})")
-                else:
-                    logger.log(level, f"开始执行 {func_name}")
+                if enabled:
+                    if include_args:
+                        args_repr = [repr(a) for a in args[:3]]  # 限制参数数量
+                        kwargs_repr = [
+                            f"{k}={v!r}" for k, v in list(kwargs.items())[:3]
+                        ]
+                        signature = ", ".join(args_repr + kwargs_repr)
+                        logger.log(level, "开始执行 %s(%s)", func_name, signature)
+                    else:
+                        logger.log(level, "开始执行 %s", func_name)
 
                 # 执行函数
                 result = func(*args, **kwargs)
 
                 # 记录性能数据
-                duration = time.time() - start_time
-                logger.log(
-                    level,
-                    f"{func_name} 执行完成",
-                    extra={
-                        "duration": duration,
-                        "function": func_name,
-                        "status": "success",
-                    },
-                )
+                if enabled:
+                    duration = (time.perf_counter_ns() - start_time) * 1e-9
+                    logger.log(
+                        level,
+                        "%s 执行完成",
+                        func_name,
+                        extra={
+                            "duration": duration,
+                            "function": func_name,
+                            "status": "success",
+                        },
+                    )
 
                 return result
 
             except Exception as e:
-                duration = time.time() - start_time
+                duration = (time.perf_counter_ns() - start_time) * 1e-9
                 logger.error(
-                    f"{func_name} 执行出错: {str(e)}",
+                    "%s 执行出错: %s",
+                    func_name,
+                    e,
                     extra={
                         "duration": duration,
                         "function": func_name,
@@ -390,20 +793,23 @@ def log_context(logger: logging.Logger, context_name: str, level: int = logging.
         level: 日志级别
     """
     start_time = time.time()
-    logger.log(level, f"进入上下文: {context_name}")
+    logger.log(level, "进入上下文: %s", context_name)
 
     try:
         yield
         duration = time.time() - start_time
         logger.log(
             level,
-            f"退出上下文: {context_name}",
+            "退出上下文: %s",
+            context_name,
             extra={"duration": duration, "context": context_name, "status": "success"},
         )
     except Exception as e:
         duration = time.time() - start_time
         logger.error(
-            f"上下文异常: {context_name} - {str(e)}",
+            "上下文异常: %s - %s",
+            context_name,
+            e,
             extra={
                 "duration": duration,
                 "context": context_name,
@@ -438,27 +844,30 @@ def log_function_call(
                 logger = get_project_logger(func.__module__)
 
             func_name = func.__qualname__
+            # 级别未启用时不构造参数和返回值的repr
+            enabled = logger.isEnabledFor(level)
 
             # 记录函数调用
-            if log_args:
-                args_repr = [repr(a) for a in args[:3]]
-                kwargs_repr = [f"{k}={v!r}" for k, v in list(kwargs.items())[:3]]
-                signature = ", ".join(args_repr + kwargs_repr)
-                logger.log(level, f"调用函数 {func_name}({signature})")
-            else:
-                logger.log(level, f"调用函数 {func_name}")
+            if enabled:
+                if log_args:
+                    args_repr = [repr(a) for a in args[:3]]
+                    kwargs_repr = [f"{k}={v!r}" for k, v in list(kwargs.items())[:3]]
+                    signature = ", ".join(args_repr + kwargs_repr)
+                    logger.log(level, "调用函数 %s(%s)", func_name, signature)
+                else:
+                    logger.log(level, "调用函数 %s", func_name)
 
             try:
                 result = func(*args, **kwargs)
 
-                if log_result:
+                if log_result and enabled:
                     result_repr = repr(result)[:100]  # 限制长度
-                    logger.log(level, f"{func_name} 返回: {result_repr}")
+                    logger.log(level, "%s 返回: %s", func_name, result_repr)
 
                 return result
 
             except Exception as e:
-                logger.exception(f"函数 {func_name} 执行出错: {str(e)}")
+                logger.exception("函数 %s 执行出错: %s", func_name, e)
                 raise
 
         return wrapper
@@ -491,10 +900,11 @@ def configure_project_logging(
     log_dir: Union[str, Path] = "logs",
     log_level: Union[str, int] = "INFO",
     log_format: str = "standard",
-    enable_file_logging: bool = "yes" == "yes",
-    enable_rotation: bool = "yes" == "yes",
+    enable_file_logging: bool = _DEFAULT_ENABLE_FILE_LOGGING,
+    enable_rotation: bool = _DEFAULT_ENABLE_ROTATION,
     console_output: bool = True,
     custom_log_files: Optional[Dict[str, Union[str, Path]]] = None,
+    performance_log_format: str = "json",
 ) -> Dict[str, logging.Logger]:
     """配置项目日志系统，支持用户自定义路径。
 
@@ -506,6 +916,8 @@ def configure_project_logging(
         enable_rotation: 是否启用日志轮转
         console_output: 是否输出到控制台
         custom_log_files: 自定义日志文件映射 {"logger_name": "file_path"}
+        performance_log_format: 性能日志格式，"json"（默认）或"msgpack"；
+            msgpack格式写入my_python_project_performance.msgpack
 
     Returns:
         配置好的日志记录器字典
@@ -568,12 +980,16 @@ def configure_project_logging(
 
     # 性能日志记录器
     if enable_file_logging:
-        performance_log_file = log_dir / f"my_python_project_performance.log"
+        if performance_log_format not in ("json", "msgpack"):
+            raise ValueError(f"不支持的性能日志格式: {performance_log_format}")
+        # 二进制记录使用单独的扩展名，不与JSON行格式的日志文件混写
+        suffix = "msgpack" if performance_log_format == "msgpack" else "log"
+        performance_log_file = log_dir / f"my_python_project_performance.{suffix}"
         loggers["performance"] = setup_advanced_logger(
             name="my_python_project.performance",
             level="INFO",
             log_file=performance_log_file,
-            log_format="json",  # 性能日志强制使用JSON格式
+            log_format=performance_log_format,  # 性能日志使用结构化格式
             enable_rotation=enable_rotation,
             include_console=False,
             performance_threshold=0.1,  # 只记录超过0.1秒的操作
@@ -650,7 +1066,7 @@ def get_configured_logger(
 
         # 确保日志文件目录存在
         log_file.parent.mkdir(parents=True, exist_ok=True)
-    elif "yes" == "yes":
+    elif _DEFAULT_ENABLE_FILE_LOGGING:
         # 如果没有指定文件但启用了文件日志，使用默认路径
         log_file = Path("logs") / f"{name.replace('.', '_')}.log"
         log_file.parent.mkdir(parents=True, exist_ok=True)
@@ -757,7 +1173,7 @@ def setup_logging_with_path_manager(
     # 设置默认参数
     logger_kwargs.setdefault("level", "INFO")
     logger_kwargs.setdefault("log_format", "standard")
-    logger_kwargs.setdefault("enable_rotation", "yes" == "yes")
+    logger_kwargs.setdefault("enable_rotation", _DEFAULT_ENABLE_ROTATION)
 
     return setup_advanced_logger(
         name=f"my_python_project.{module_name}", log_file=log_path, **logger_kwargs
@@ -813,7 +1229,7 @@ def configure_project_logging_with_paths(
         # 设置默认值
         merged_config.setdefault("level", "INFO")
         merged_config.setdefault("log_format", "standard")
-        merged_config.setdefault("enable_rotation", "yes" == "yes")
+        merged_config.setdefault("enable_rotation", _DEFAULT_ENABLE_ROTATION)
 
         # 创建日志记录器
         full_logger_name = f"my_python_project.{logger_name}"
@@ -911,9 +1327,8 @@ def load_logging_config_from_file(
         # 自动查找配置文件
         config_dir = Path("config")
 
-        # 优先查找基于cookiecutter配置的文件
-        preferred_format = "standard"
-        if preferred_format == "json":
+        # 优先查找与默认日志格式对应的配置文件
+        if _DEFAULT_LOG_FORMAT == "json":
             config_file = config_dir / "logging_config.json"
         else:
             config_file = config_dir / "logging_config.yaml"
@@ -1015,8 +1430,8 @@ def init_project_logging(
         # 设置默认值
         default_config.setdefault("log_level", "INFO")
         default_config.setdefault("log_format", "standard")
-        default_config.setdefault("enable_file_logging", "yes" == "yes")
-        default_config.setdefault("enable_rotation", "yes" == "yes")
+        default_config.setdefault("enable_file_logging", _DEFAULT_ENABLE_FILE_LOGGING)
+        default_config.setdefault("enable_rotation", _DEFAULT_ENABLE_ROTATION)
 
         # 配置默认日志系统
         configure_project_logging(**default_config)
@@ -1037,9 +1452,9 @@ def get_effective_logging_config() -> Dict[str, Any]:
         "formatters": {},
         "project_settings": {
             "default_level": "INFO",
-            "default_format": "standard",
-            "file_logging_enabled": "yes" == "yes",
-            "log_rotation_enabled": "yes" == "yes",
+            "default_format": _DEFAULT_LOG_FORMAT,
+            "file_logging_enabled": _DEFAULT_ENABLE_FILE_LOGGING,
+            "log_rotation_enabled": _DEFAULT_ENABLE_ROTATION,
         },
     }
 
@@ -5,8 +5,9 @@
 import time
 import tempfile
 import threading
+from enum import StrEnum
 from pathlib import Path
-from unittest.mock import Mock, patch
+from unittest.mock import MagicMock, Mock, call, patch
 
 import pytest
 
@@ -14,6 +15,7 @@ from my_python_project.utils.cache import (
     MemoryCache,
     FileCache,
     MultiLevelCache,
+    RedisCache,
     CacheManager,
     cache_result,
     timed_cache,
@@ -24,6 +26,12 @@ from my_python_project.utils.cache import (
 from my_python_project.utils.exceptions import CacheError
 
 
+class Color(StrEnum):
+    """用于验证str子类序列化的枚举"""
+
+    RED = "red"
+
+
 class TestMemoryCache:
     """内存缓存测试"""
 
@@ -138,6 +146,21 @@ class TestMemoryCache:
         assert "keys" in stats
         assert len(stats["keys"]) == 2
 
+    def test_hit_ratio(self):
+        """测试命中率统计"""
+        cache = MemoryCache(max_size=10)
+        cache.set("key1", "value1")
+
+        cache.get("key1")
+        cache.get("key1")
+        cache.get("key1")
+        cache.get("missing")
+
+        stats = cache.stats()
+        assert stats["hits"] == 3
+        assert stats["misses"] == 1
+        assert stats["hit_ratio"] == 0.75
+
     def test_thread_safety(self):
         """测试线程安全"""
         cache = MemoryCache()
@@ -198,6 +221,69 @@ class TestFileCache:
             time.sleep(1.1)
             assert cache.get("temp_key") is None
 
+    def test_exists_and_keys_skip_expired(self):
+        """测试exists和keys只根据文件头部判断过期"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            cache = FileCache(temp_dir)
+
+            cache.set("live_key", "value")
+            cache.set("temp_key", "value", ttl=1)
+            assert cache.exists("temp_key") is True
+            assert sorted(cache.keys()) == ["live_key", "temp_key"]
+
+            time.sleep(1.1)
+            assert cache.exists("temp_key") is False
+            assert cache.exists("live_key") is True
+            assert cache.keys() == ["live_key"]
+
+    def test_keys_returns_original_keys(self):
+        """测试keys返回原始键而非文件名摘要"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            FileCache(temp_dir).set("user:1/profile", "value")
+
+            # 新实例从文件头部恢复键
+            cache = FileCache(temp_dir)
+            assert cache.keys() == ["user:1/profile"]
+
+            cache.delete("user:1/profile")
+            assert cache.keys() == []
+
+    def test_keys_sees_other_instance_changes(self):
+        """测试keys能感知共享同一目录的其他实例的写入、替换和清空"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            cache_a = FileCache(temp_dir)
+            cache_b = FileCache(temp_dir)
+
+            cache_a.set("k1", "value")
+            assert cache_a.keys() == ["k1"]
+
+            cache_b.set("k2", "value")
+            assert sorted(cache_a.keys()) == ["k1", "k2"]
+
+            # 其他实例用更短的TTL覆盖已索引的键
+            cache_b.set("k1", "value", ttl=1)
+            time.sleep(1.1)
+            assert cache_a.keys() == ["k2"]
+
+            cache_b.clear()
+            assert cache_a.keys() == []
+
+    def test_keys_sees_in_place_rewrite(self):
+        """测试缓存文件被原地重写（inode不变）后keys重新读取头部"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            cache = FileCache(Path(temp_dir) / "a")
+            cache.set("k1", "value")
+            assert cache.keys() == ["k1"]
+
+            # 同一个键带TTL的文件内容原地写入，保持inode不变
+            other = FileCache(Path(temp_dir) / "b")
+            other.set("k1", "value", ttl=1)
+            cache_file = cache._get_cache_file("k1")
+            cache_file.write_bytes(other._get_cache_file("k1").read_bytes())
+
+            time.sleep(1.1)
+            assert cache.keys() == []
+
     def test_persistence(self):
         """测试持久化"""
         with tempfile.TemporaryDirectory() as temp_dir:
@@ -248,6 +334,37 @@ class TestFileCache:
             cache.set("json_key", data)
             assert cache.get("json_key") == data
 
+    def test_bytes_and_str_values(self):
+        """测试bytes/str值绕过pickle后仍能正确读取"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            cache = FileCache(temp_dir)
+
+            cache.set("bytes_key", b"\x00\x80raw")
+            cache.set("str_key", "文本内容")
+            assert cache.get("bytes_key") == b"\x00\x80raw"
+            assert cache.get("str_key") == "文本内容"
+
+    def test_str_and_bytes_subclasses_keep_type(self):
+        """测试str/bytes子类和bytearray不走快速路径，读取后类型不变"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            cache = FileCache(temp_dir)
+
+            cache.set("enum_key", Color.RED)
+            cache.set("bytearray_key", bytearray(b"raw"))
+            assert cache.get("enum_key") is Color.RED
+            assert type(cache.get("bytearray_key")) is bytearray
+
+    @pytest.mark.parametrize("serializer", ["msgpack", "orjson"])
+    def test_binary_serializers(self, serializer):
+        """测试msgpack/orjson序列化器"""
+        pytest.importorskip(serializer)
+        with tempfile.TemporaryDirectory() as temp_dir:
+            cache = FileCache(temp_dir, serializer=serializer)
+
+            data = {"key": "value", "number": 42, "list": [1, 2, 3]}
+            cache.set("binary_key", data)
+            assert cache.get("binary_key") == data
+
     def test_corrupted_cache_file(self):
         """测试损坏的缓存文件"""
         with tempfile.TemporaryDirectory() as temp_dir:
@@ -262,6 +379,72 @@ class TestFileCache:
             # 尝试读取应该不会崩溃
             assert cache.get("corrupted") is None
 
+    def test_expired_cleanup_keeps_replaced_file(self):
+        """测试清理过期文件时不会删除其他实例刚替换写入的新文件"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            reader = FileCache(temp_dir)
+            writer = FileCache(temp_dir)
+            writer.set("key", "old")
+
+            def expire_and_replace(expires_at):
+                # 模拟读取过期文件后、删除前另一个实例写入了新值
+                writer.set("key", "new")
+                return True
+
+            with patch.object(reader, "_is_expired", side_effect=expire_and_replace):
+                assert reader.get("key") is None
+
+            assert writer.get("key") == "new"
+
+
+class TestRedisCache:
+    """Redis缓存测试（使用模拟客户端）"""
+
+    def test_get_many_uses_mget(self):
+        """测试批量获取一次MGET完成，缺失的键映射为None"""
+        client = Mock()
+        cache = RedisCache(client, key_prefix="app:")
+        client.mget.return_value = [cache._serialize({"id": 1}), None]
+
+        result = cache.get_many(["user", "missing"])
+
+        client.mget.assert_called_once_with(["app:user", "app:missing"])
+        assert result == {"user": {"id": 1}, "missing": None}
+        assert cache.get_many([]) == {}
+        client.mget.assert_called_once()
+
+    def test_set_many_uses_pipeline(self):
+        """测试批量设置通过pipeline提交，每个键都带上TTL"""
+        client = MagicMock()
+        pipe = client.pipeline.return_value.__enter__.return_value
+        cache = RedisCache(client, key_prefix="app:", default_ttl=60)
+
+        cache.set_many({"a": "x", "b": [1, 2]}, ttl=10)
+
+        assert pipe.setex.call_args_list == [
+            call("app:a", 10, cache._serialize("x")),
+            call("app:b", 10, cache._serialize([1, 2])),
+        ]
+        pipe.set.assert_not_called()
+        pipe.execute.assert_called_once()
+
+        # 未指定ttl时使用默认TTL
+        pipe.reset_mock()
+        cache.set_many({"c": 3})
+        pipe.setex.assert_called_once_with("app:c", 60, cache._serialize(3))
+
+    def test_set_many_without_ttl(self):
+        """测试没有TTL时批量设置使用SET"""
+        client = MagicMock()
+        pipe = client.pipeline.return_value.__enter__.return_value
+        cache = RedisCache(client)
+
+        cache.set_many({"a": 1})
+
+        pipe.set.assert_called_once_with("a", cache._serialize(1))
+        pipe.setex.assert_not_called()
+        pipe.execute.assert_called_once()
+
 
 class TestMultiLevelCache:
     """多层缓存测试"""
@@ -303,6 +486,38 @@ class TestMultiLevelCache:
         # 值应该被回写到第一层
         assert cache1.get("key1") == "value1"
 
+    def test_async_writeback(self):
+        """测试后台回写"""
+        cache1 = MemoryCache()
+        cache2 = MemoryCache()
+        multi_cache = MultiLevelCache([cache1, cache2], async_writeback=True)
+
+        multi_cache.set("key1", "value1")
+        assert cache1.get("key1") == "value1"  # 第一层同步写入
+
+        cache2.set("key2", "value2")
+        assert multi_cache.get("key2") == "value2"
+
+        multi_cache.close()
+        assert cache2.get("key1") == "value1"
+        assert cache1.get("key2") == "value2"  # 已回写
+
+    def test_get_many_and_set_many(self):
+        """测试批量读写及回写"""
+        cache1 = MemoryCache()
+        cache2 = MemoryCache()
+        multi_cache = MultiLevelCache([cache1, cache2])
+
+        multi_cache.set_many({"key1": "value1", "key2": "value2"})
+        assert cache2.get("key2") == "value2"
+
+        cache1.clear()
+        cache2.set("key3", "value3")
+
+        result = multi_cache.get_many(["key1", "key3", "missing"])
+        assert result == {"key1": "value1", "key3": "value3", "missing": None}
+        assert cache1.get("key3") == "value3"  # 已回写
+
     def test_cache_failure_resilience(self):
         """测试缓存故障恢复能力"""
         good_cache = MemoryCache()
@@ -494,6 +709,23 @@ class TestGlobalCacheManager:
         assert get_cache_manager() is manager
         assert manager.default_backend is custom_cache
 
+    def test_cache_result_follows_global_manager(self):
+        """测试装饰器跟随替换后的全局管理器并记录统计"""
+
+        @cache_result(ttl=60)
+        def double(x):
+            return x * 2
+
+        manager = init_cache_manager(MemoryCache())
+        assert double(3) == 6
+        assert double(3) == 6
+
+        stats = manager.stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["sets"] == 1
+        assert len(manager.default_backend.keys()) == 1
+
     def test_get_global_cache_manager(self):
         """测试获取全局缓存管理器"""
         # 确保有全局管理器
@@ -6,6 +6,7 @@ import tempfile
 import pytest
 from pathlib import Path
 from datetime import datetime, timedelta
+from decimal import Decimal
 from unittest.mock import patch, mock_open
 
 from my_python_project.utils.common import (
@@ -27,13 +28,16 @@ from my_python_project.utils.common import (
     save_pickle,
     get_file_size,
     list_files,
+    safe_write_file,
     # 数据工具
+    deep_copy,
     deep_merge,
     flatten_dict,
     chunk_list,
     calculate_md5,
     calculate_sha256,
     get_date_range,
+    safe_decimal,
     # 验证工具
     is_valid_email,
     is_valid_url,
@@ -45,6 +49,13 @@ from my_python_project.utils.common import (
 )
 
 
+class CustomDeepCopy:
+    """自定义__deepcopy__的可pickle对象"""
+
+    def __deepcopy__(self, memo):
+        return "custom copy"
+
+
 class TestTimeUtils:
     """时间工具测试"""
 
@@ -236,6 +247,30 @@ class TestFileUtils:
             files = list_files(temp_path, "*", recursive=False)
             assert len(files) == 3  # 2个文件 + 1个目录
 
+    def test_safe_write_file(self):
+        """测试安全写入文件及备份"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            file_path = Path(temp_dir) / "sub" / "data.txt"
+            backup_path = file_path.with_suffix(".txt.bak")
+
+            safe_write_file(file_path, "first")
+            assert file_path.read_text(encoding="utf-8") == "first"
+            assert not backup_path.exists()
+
+            safe_write_file(file_path, "second")
+            assert file_path.read_text(encoding="utf-8") == "second"
+            assert backup_path.read_text(encoding="utf-8") == "first"
+
+            safe_write_file(file_path, "third", backup=False)
+            assert file_path.read_text(encoding="utf-8") == "third"
+            assert backup_path.read_text(encoding="utf-8") == "first"
+
+            # 不应残留临时文件
+            assert sorted(p.name for p in file_path.parent.iterdir()) == [
+                "data.txt",
+                "data.txt.bak",
+            ]
+
 
 class TestDataUtils:
     """数据工具测试"""
@@ -252,6 +287,16 @@ class TestDataUtils:
         # 确保原字典未被修改
         assert dict1 == {"a": 1, "b": {"c": 2, "d": 3}}
 
+    def test_deep_copy(self):
+        """测试深度拷贝内置容器，嵌套对象的__deepcopy__仍会被调用"""
+        shared = [1, 2]
+        data = {"a": shared, "b": shared, "c": ("x", {"d": None})}
+        result = deep_copy(data)
+        assert result == data
+        assert result["a"] is not shared
+        assert result["a"] is result["b"]
+        assert deep_copy({"x": [CustomDeepCopy()]}) == {"x": ["custom copy"]}
+
     def test_flatten_dict(self):
         """测试字典扁平化"""
         nested = {"a": 1, "b": {"c": 2, "d": {"e": 3}}}
@@ -299,6 +344,11 @@ class TestDataUtils:
         result_bytes = calculate_md5(text.encode("utf-8"))
         assert result == result_bytes
 
+        # 缓冲区对象输入
+        buffer = bytearray(b"xxhello worldxx")
+        assert calculate_md5(buffer[2:-2]) == result
+        assert calculate_md5(memoryview(buffer)[2:-2]) == result
+
     def test_calculate_sha256(self):
         """测试SHA256计算"""
         text = "hello world"
@@ -332,6 +382,41 @@ class TestDataUtils:
         result = get_date_range(start_dt, end_dt)
         assert result == ["2023-01-01", "2023-01-02", "2023-01-03"]
 
+    def test_get_date_range_numpy_matches_fallback(self):
+        """测试NumPy路径与纯Python路径结果一致"""
+        pytest.importorskip("numpy")
+
+        cases = [
+            ("2023-12-25", "2024-03-05"),
+            ("2023-01-05", "2023-01-01"),
+            (datetime(2023, 1, 1, 12), datetime(2023, 1, 3, 6)),
+        ]
+        for start, end in cases:
+            result = get_date_range(start, end)
+            with patch("my_python_project.utils.common._get_numpy", return_value=None):
+                expected = get_date_range(start, end)
+            assert result == expected
+
+    def test_get_date_range_skips_numpy_import(self):
+        """测试用不上NumPy路径时不导入NumPy"""
+        with patch("my_python_project.utils.common._get_numpy") as get_numpy:
+            get_date_range("2023/01/01", "2023/01/02", date_format="%Y/%m/%d")
+            get_date_range(datetime(2023, 1, 1, 12), datetime(2023, 1, 2, 12))
+        get_numpy.assert_not_called()
+
+    def test_safe_decimal(self):
+        """测试安全转换为Decimal"""
+        assert safe_decimal(5) == Decimal("5")
+        assert safe_decimal(1.1) == Decimal("1.1")
+        assert safe_decimal("2.50") == Decimal("2.50")
+
+        value = Decimal("3.14")
+        assert safe_decimal(value) is value
+
+        # 无法转换时返回默认值
+        assert safe_decimal("abc") == Decimal("0")
+        assert safe_decimal(None, Decimal("1")) == Decimal("1")
+
 
 class TestValidationUtils:
     """验证工具测试"""
@@ -2,6 +2,7 @@
 配置管理系统测试
 """
 
+import datetime
 import json
 import os
 import tempfile
@@ -56,6 +57,57 @@ class TestConfigManager:
         config.set("nested.key", "nested_value")
         assert config.get("nested.key") == "nested_value"
 
+    def test_get_after_mutation(self):
+        """测试修改配置后get返回最新值"""
+        config = ConfigManager.from_dict({"db": {"host": "localhost", "port": 5432}})
+        assert config.get("db.host") == "localhost"
+
+        config.set("db.host", "remote")
+        assert config.get("db.host") == "remote"
+
+        config.update({"db": {"port": 6543}})
+        assert config.get("db.port") == 6543
+
+        # 通过返回的子字典原地修改
+        config.get("db")["host"] = "inplace"
+        assert config.get("db.host") == "inplace"
+
+        # 叶子替换为子树
+        config.set("db.host", {"primary": "p1"})
+        assert config.get("db.host.primary") == "p1"
+
+    def test_get_after_subtree_replaced_or_deleted(self):
+        """测试通过返回的子字典替换或删除子树后get/has不使用过期索引"""
+        config = ConfigManager.from_dict({"a": {"b": {"c": 1}}})
+        assert config.get("a.b.c") == 1
+
+        subtree = config.get("a")
+        subtree["b"] = {"c": 2}
+        assert config.get("a.b.c") == 2
+
+        del subtree["b"]
+        assert config.has("a.b.c") is False
+        assert config.get("a.b.c", default=0) == 0
+
+        # 顶层子树通过to_dict副本整体替换不影响原配置
+        config.set("x.y", 1)
+        config.to_dict()["x"] = {"y": 2}
+        assert config.get("x.y") == 1
+
+    def test_merge_configs(self):
+        """测试合并多个配置管理器"""
+        base = ConfigManager.from_dict({"db": {"host": "localhost", "port": 5432}})
+        override = ConfigManager.from_dict({"db": {"host": "remote"}, "debug": True})
+
+        merged = base.merge_configs(override)
+
+        assert merged.get("db.host") == "remote"
+        assert merged.get("db.port") == 5432
+        assert merged.get("debug") is True
+        # 原配置不受影响
+        assert base.get("db.host") == "localhost"
+        assert not base.has("debug")
+
     def test_get_with_default(self):
         """测试获取配置时使用默认值"""
         config = ConfigManager()
@@ -95,6 +147,14 @@ class TestConfigManager:
         config.set("existing", "value")
         assert config.has("existing")
 
+        # 中间节点不是字典、值为None以及子树键
+        config.set("nested.items", [1, 2])
+        config.set("nested.empty", None)
+        assert config.has("nested")
+        assert config.has("nested.empty")
+        assert not config.has("nested.items.first")
+        assert not config.has("existing.child")
+
     def test_update_config(self):
         """测试更新配置"""
         config = ConfigManager()
@@ -118,6 +178,14 @@ class TestConfigManager:
         assert config_dict["key1"] == "value1"
         assert config_dict["key2"] == "value2"
 
+        # 只读视图不复制数据，且反映之后的修改
+        view = config.to_dict(copy=False)
+        assert view == config_dict
+        with pytest.raises(TypeError):
+            view["key1"] = "changed"
+        config.set("key3", "value3")
+        assert view["key3"] == "value3"
+
     def test_dict_like_access(self):
         """测试字典风格的访问"""
         config = ConfigManager()
@@ -141,6 +209,19 @@ class TestConfigManager:
             assert config.get("key1") == "env_value1"
             assert config.get("key2.nested") == "env_nested_value"
 
+    def test_refresh_env(self):
+        """测试构造后修改环境变量需调用refresh_env才生效"""
+        with patch.dict(os.environ, {"TEST_KEY1": "before"}):
+            config = ConfigManager(env_prefix="TEST_")
+            os.environ["TEST_KEY1"] = "after"
+
+            config._apply_env_overrides()
+            assert config.get("key1") == "before"
+
+            config.refresh_env()
+            config._apply_env_overrides()
+            assert config.get("key1") == "after"
+
     def test_env_type_conversion(self):
         """测试环境变量类型转换"""
         with patch.dict(
@@ -177,6 +258,107 @@ class TestConfigManager:
         finally:
             os.unlink(temp_file)
 
+    def test_load_same_file_is_isolated(self):
+        """测试多个实例加载同一文件时互不影响"""
+        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
+            json.dump({"db": {"host": "localhost"}}, f)
+            temp_file = f.name
+
+        try:
+            config1 = ConfigManager(temp_file)
+            config2 = ConfigManager(temp_file)
+            config1.set("db.host", "changed")
+
+            assert config2.get("db.host") == "localhost"
+            assert ConfigManager(temp_file).get("db.host") == "localhost"
+
+            # 文件修改后重新解析
+            with open(temp_file, "w") as f:
+                json.dump({"db": {"host": "remote", "port": 5432}}, f)
+            config2.reload()
+            assert config2.get("db.port") == 5432
+        finally:
+            os.unlink(temp_file)
+
+    def test_load_json_file_lazy(self):
+        """测试按需解析JSON文件"""
+        pytest.importorskip("ijson")
+        test_data = {"key1": "value1", "key2": {"nested": 1.5}, "key3": [1, 2]}
+
+        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
+            json.dump(test_data, f)
+            temp_file = f.name
+
+        try:
+            with patch.dict(os.environ, {"TEST_KEY3": "env", "TEST_EXTRA": "x"}):
+                config = ConfigManager(temp_file, env_prefix="TEST_", lazy=True)
+
+            assert config._config == {}
+            assert config.get("key2.nested") == 1.5
+            assert config._config == {"key2": {"nested": 1.5}}
+            assert config.get("key3") == "env"
+            assert config.get("missing", "default") == "default"
+
+            config.set("key1", "changed")
+            assert config.to_dict() == {
+                "key1": "changed",
+                "key2": {"nested": 1.5},
+                "key3": "env",
+                "extra": "x",
+            }
+        finally:
+            os.unlink(temp_file)
+
+    def test_watch_file_shares_observer(self):
+        """测试多个实例共享同一个文件监听Observer"""
+        pytest.importorskip("watchdog")
+        from my_python_project.utils import config_manager as cm
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            paths = [Path(temp_dir) / name for name in ("a.json", "b.json")]
+            for path in paths:
+                path.write_text(json.dumps({"value": 1}))
+
+            first, second = (ConfigManager(path) for path in paths)
+            # 在开始监听前修改文件，避免真实的文件事件干扰断言
+            paths[0].write_text(json.dumps({"value": 2}))
+            changed = []
+            first.watch_file(changed.append)
+            second.watch_file(changed.append)
+            try:
+                observer = cm._watch_observer
+                assert observer is not None
+                assert len(cm._watch_schedules) == 1
+
+                cm._dispatch_file_event(str(paths[0].absolute()))
+                assert changed == [first]
+                assert first.get("value") == 2
+
+                first.stop_watching()
+                assert cm._watch_observer is observer
+            finally:
+                first.stop_watching()
+                second.stop_watching()
+
+            assert cm._watch_observer is None
+            assert cm._watched == {}
+
+    def test_create_backup(self):
+        """测试备份配置文件保留内容、权限和修改时间"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            config_file = Path(temp_dir) / "config.json"
+            config_file.write_text(json.dumps({"key": "x" * 100000}))
+            os.chmod(config_file, 0o640)
+            os.utime(config_file, (1_000_000, 2_000_000))
+
+            backup_path = ConfigManager(config_file).create_backup()
+
+            assert backup_path.parent == Path(temp_dir) / "backups"
+            assert backup_path.read_bytes() == config_file.read_bytes()
+            backup_stat = backup_path.stat()
+            assert backup_stat.st_mode & 0o777 == 0o640
+            assert backup_stat.st_mtime == 2_000_000
+
     def test_load_nonexistent_file(self):
         """测试加载不存在的文件"""
         with pytest.raises(ConfigError, match="配置文件不存在"):
@@ -217,6 +399,43 @@ class TestConfigManager:
         finally:
             os.unlink(temp_file)
 
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_save_json_rejects_date_with_either_backend(self, use_orjson):
+        """测试是否安装orjson时保存包含date的配置行为一致，且不截断原文件"""
+        if use_orjson:
+            pytest.importorskip("orjson")
+        config = ConfigManager.from_dict({"released": datetime.date(2024, 1, 2)})
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            save_path = Path(temp_dir) / "config.json"
+            save_path.write_text("{}")
+            with (
+                patch("my_python_project.utils.config_manager.HAS_ORJSON", use_orjson),
+                pytest.raises(ConfigError, match="not JSON serializable"),
+            ):
+                config.save(save_path)
+            assert save_path.read_text() == "{}"
+
+    def test_save_and_export_yaml(self):
+        """测试以UTF-8字节保存和导出YAML，不支持的格式不创建文件"""
+        pytest.importorskip("yaml")
+        config = ConfigManager.from_dict({"name": "中文", "db": {"ports": [1, 2]}})
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            save_path = Path(temp_dir) / "config.yaml"
+            export_path = Path(temp_dir) / "export.yml"
+            config.save(save_path)
+            config.export_config(export_path, format="yaml")
+
+            assert "name: 中文" in save_path.read_text(encoding="utf-8")
+            assert export_path.read_bytes() == save_path.read_bytes()
+            assert ConfigManager(save_path).to_dict() == config.to_dict()
+
+            bad_path = Path(temp_dir) / "config.txt"
+            with pytest.raises(ConfigError, match="保存格式不支持"):
+                config.save(bad_path)
+            assert not bad_path.exists()
+
 
 class TestGlobalConfig:
     """全局配置测试"""
@@ -293,6 +512,27 @@ class TestConfigTypes:
         assert config.get("level1.level2.key2") == "keep_value"
         assert config.get("level1.level2.key3") == "added_value"
 
+    def test_validate_config(self):
+        """测试按schema验证配置"""
+        config = ConfigManager.from_dict(
+            {
+                "database": {"host": "localhost", "port": "5432", "pool": 5},
+                "debug": True,
+            }
+        )
+        schema = {
+            "database": {"host": str, "port": int, "options": {"timeout": int}},
+            "debug": bool,
+            "cache": {"ttl": int},
+        }
+
+        assert config.validate_config(schema) == [
+            "配置项 database.port 应该是 int 类型",
+            "缺少必需的配置项: database.options",
+            "缺少必需的配置项: cache",
+        ]
+        assert config.validate_config({"database": {"host": str}}) == []
+
     def test_config_with_special_characters(self):
         """测试包含特殊字符的配置"""
         config = ConfigManager()
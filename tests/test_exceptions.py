@@ -23,8 +23,12 @@ from my_python_project.utils.exceptions import (
     ErrorHandler,
     CircuitBreaker,
     CircuitBreakerOpenError,
+    circuit_breaker,
     error_context,
     safe_execute,
+    safe_execute_nolog,
+    global_error_handler,
+    reraise_with_context,
     # 异常格式化
     format_exception,
     get_exception_chain,
@@ -52,6 +56,21 @@ class TestBaseExceptions:
         }
         assert error_dict == expected
 
+    def test_to_dict_independent_and_pickle(self):
+        """测试to_dict每次返回新字典以及序列化保留属性"""
+        import pickle
+
+        error = ValidationError("Invalid", error_code="V_001", details={"field": "a"})
+        error.to_dict()["extra"] = "added by caller"
+        assert "extra" not in error.to_dict()
+
+        error.message = "Changed"
+        assert error.to_dict()["message"] == "Changed"
+
+        restored = pickle.loads(pickle.dumps(error))
+        assert type(restored) is ValidationError
+        assert restored.to_dict() == error.to_dict()
+
     def test_specific_exceptions(self):
         """测试特定异常类型"""
         # ConfigError
@@ -123,6 +142,35 @@ class TestExceptionDecorators:
         test_function()
         assert callback_called
 
+    def test_handle_exceptions_logging_variants(self):
+        """测试各参数组合下的日志记录与返回值"""
+
+        def failing_function():
+            raise ValueError("Always fails")
+
+        with patch("my_python_project.utils.exceptions.logger") as mock_logger:
+            with pytest.raises(ValueError):
+                handle_exceptions(ValueError)(failing_function)()
+            assert mock_logger.error.call_count == 1
+
+            swallow = handle_exceptions(ValueError, default_return=-1, reraise=False)
+            assert swallow(failing_function)() == -1
+            assert mock_logger.error.call_count == 2
+
+            silent = handle_exceptions(
+                ValueError, default_return=-1, log_errors=False, reraise=False
+            )
+            assert silent(failing_function)() == -1
+            assert mock_logger.error.call_count == 2
+
+        # 未列出的异常类型不会被捕获
+        with pytest.raises(ValueError):
+            handle_exceptions(KeyError, reraise=False)(failing_function)()
+
+        wrapped = handle_exceptions(ValueError)(failing_function)
+        assert wrapped.__name__ == "failing_function"
+        assert wrapped.__wrapped__ is failing_function
+
     def test_suppress_exceptions(self):
         """测试异常抑制装饰器"""
 
@@ -162,6 +210,36 @@ class TestExceptionDecorators:
         with pytest.raises(ValueError, match="Always fails"):
             always_failing()
 
+    def test_retry_backoff_schedule(self):
+        """测试重试延迟按退避倍数递增，最后一次失败后不再等待"""
+        calls = 0
+
+        @retry_on_exception(max_retries=3, delay=0.5, backoff=2.0, log_errors=False)
+        def always_failing():
+            nonlocal calls
+            calls += 1
+            raise ValueError("Always fails")
+
+        with patch("my_python_project.utils.exceptions.time.sleep") as mock_sleep:
+            with pytest.raises(ValueError):
+                always_failing()
+
+        assert calls == 4
+        assert [c.args[0] for c in mock_sleep.call_args_list] == [0.5, 1.0, 2.0]
+
+    def test_retry_jitter(self):
+        """测试重试延迟加入随机抖动"""
+
+        @retry_on_exception(max_retries=1, delay=1.0, log_errors=False, jitter=0.5)
+        def always_failing():
+            raise ValueError("Always fails")
+
+        with patch("my_python_project.utils.exceptions.time.sleep") as mock_sleep:
+            with pytest.raises(ValueError):
+                always_failing()
+
+        assert 1.0 <= mock_sleep.call_args.args[0] <= 1.5
+
 
 class TestErrorHandler:
     """错误处理器测试"""
@@ -250,6 +328,22 @@ class TestErrorHandler:
         result = handler.check_error_patterns(error)
         assert result == "frequent_value_errors"
 
+    def test_error_patterns_dispatch_and_window(self):
+        """测试错误模式只匹配登记的类型，并淘汰时间窗口外的记录"""
+        handler = ErrorHandler()
+        handler.add_error_pattern("value", (ValueError,), threshold=2, time_window=10)
+        handler.add_error_pattern("by_name", ("KeyError",), threshold=1)
+
+        assert handler.check_error_patterns(TypeError("x")) is None
+        assert handler.check_error_patterns(KeyError("x")) == "by_name"
+
+        with patch("time.time", return_value=1000.0):
+            assert handler.check_error_patterns(ValueError("x")) is None
+        with patch("time.time", return_value=1011.0):
+            assert handler.check_error_patterns(ValueError("x")) is None
+        with patch("time.time", return_value=1012.0):
+            assert handler.check_error_patterns(ValueError("x")) == "value"
+
 
 class TestCircuitBreaker:
     """熔断器测试"""
@@ -315,6 +409,67 @@ class TestCircuitBreaker:
         assert result == "success"
         assert breaker.state == "CLOSED"
 
+    def test_circuit_breaker_sliding_window(self):
+        """测试滑动窗口内失败次数达到阈值才熔断"""
+        breaker = CircuitBreaker(failure_threshold=2, timeout=60, window=10)
+
+        # 两次失败间隔超过窗口，不熔断
+        breaker._on_failure(_now=lambda: 0.0)
+        breaker._on_failure(_now=lambda: 20.0)
+        assert breaker.state == "CLOSED"
+
+        # 窗口内第二次失败，触发熔断
+        breaker._on_failure(_now=lambda: 25.0)
+        assert breaker.state == "OPEN"
+
+        # 半开后成功恢复，窗口内旧的失败不再计入
+        breaker.state = "HALF_OPEN"
+        breaker._on_success()
+        breaker._on_failure(_now=lambda: 26.0)
+        assert breaker.state == "CLOSED"
+
+    def test_circuit_breaker_half_open_failure(self):
+        """测试半开状态下失败会重新打开熔断器"""
+        breaker = CircuitBreaker(failure_threshold=3, timeout=60)
+
+        breaker.state = "HALF_OPEN"
+        with pytest.raises(ValueError):
+            breaker.call(lambda: int("x"))
+        assert breaker.state == "OPEN"
+        assert breaker.failure_count == 1
+
+    def test_circuit_breaker_decorator(self):
+        """测试熔断器装饰器保留函数元信息并在失败后熔断"""
+
+        @circuit_breaker(failure_threshold=1, timeout=60)
+        def failing_function():
+            """Docstring"""
+            raise ValueError("Fails")
+
+        assert failing_function.__name__ == "failing_function"
+        assert failing_function.__doc__ == "Docstring"
+        assert failing_function.__wrapped__.__name__ == "failing_function"
+
+        with pytest.raises(ValueError):
+            failing_function()
+        with pytest.raises(CircuitBreakerOpenError):
+            failing_function()
+
+    def test_circuit_breaker_state_assignment(self):
+        """测试按名称读写熔断器状态"""
+        breaker = CircuitBreaker(failure_threshold=1, timeout=60)
+
+        breaker.state = "OPEN"
+        assert breaker.state == "OPEN"
+        with pytest.raises(CircuitBreakerOpenError):
+            breaker.call(lambda: "success")
+
+        breaker.state = "CLOSED"
+        assert breaker.call(lambda: "success") == "success"
+
+        with pytest.raises(ValueError):
+            breaker.state = "UNKNOWN"
+
 
 class TestContextManager:
     """上下文管理器测试"""
@@ -341,10 +496,54 @@ class TestContextManager:
             with error_context(handler, suppress=False):
                 raise ValueError("Test error")
 
+    def test_error_context_default_handler(self):
+        """测试未指定处理器时使用全局处理器"""
+        ctx = error_context()
+        assert ctx.error_handler is None
+        assert not hasattr(ctx, "__dict__")
+
+        with patch.object(global_error_handler, "handle_error") as mock_handle:
+            with error_context(context={"op": "test"}, suppress=True) as ctx:
+                raise KeyError("missing")
+
+        mock_handle.assert_called_once_with(ctx.error, {"op": "test"})
+
 
 class TestUtilityFunctions:
     """工具函数测试"""
 
+    def test_reraise_with_context(self):
+        """测试重新抛出异常时追加上下文注释"""
+        error = ConfigError("配置缺失")
+
+        for context in ("加载配置", "启动服务"):
+            with pytest.raises(ConfigError) as exc_info:
+                reraise_with_context(error, context)
+            assert exc_info.value is error
+
+        assert error.message == "配置缺失"
+        assert error.__notes__ == ["加载配置", "启动服务"]
+
+        with pytest.raises(ValueError) as exc_info:
+            reraise_with_context(ValueError("bad"), "解析输入")
+        assert str(exc_info.value) == "bad"
+        assert exc_info.value.__notes__ == ["解析输入"]
+
+    def test_safe_execute_nolog(self):
+        """测试不记录日志的安全执行函数"""
+
+        def divide(a, b):
+            return a / b
+
+        with patch("my_python_project.utils.exceptions.logger") as mock_logger:
+            assert safe_execute_nolog(divide, 6, b=3) == 2
+            assert safe_execute_nolog(divide, 1, 0, default_return=-1) == -1
+            assert safe_execute(divide, 1, 0, log_errors=False) is None
+            mock_logger.error.assert_not_called()
+
+            safe_execute(divide, 1, 0)
+            mock_logger.error.assert_called_once()
+
     def test_safe_execute(self):
         """测试安全执行函数"""
 
@@ -380,6 +579,24 @@ class TestUtilityFunctions:
         result = format_exception(error, include_traceback=False)
         assert "traceback" not in result
 
+    def test_format_exception_uses_error_traceback(self):
+        """测试格式化使用异常自带的堆栈，而不是当前正在处理的异常"""
+        try:
+            raise ValueError("raised earlier")
+        except ValueError as e:
+            error = e
+
+        try:
+            raise KeyError("currently handled")
+        except KeyError:
+            result = format_exception(error)
+
+        assert "raised earlier" in result["traceback"]
+        assert "currently handled" not in result["traceback"]
+
+        explicit = format_exception(error, tb=error.__traceback__)
+        assert explicit["traceback"] == result["traceback"]
+
     def test_format_base_error(self):
         """测试BaseError格式化"""
         error = BaseError("Test error", error_code="TEST_001", details={"key": "value"})
@@ -405,6 +622,16 @@ class TestUtilityFunctions:
             assert chain[1]["type"] == "ValueError"
             assert chain[1]["message"] == "Original error"
 
+    def test_get_exception_chain_cycle(self):
+        """测试循环的异常链只遍历一次"""
+        first = ValueError("first")
+        second = RuntimeError("second")
+        first.__cause__ = second
+        second.__cause__ = first
+
+        chain = get_exception_chain(first)
+        assert [item["type"] for item in chain] == ["ValueError", "RuntimeError"]
+
 
 if __name__ == "__main__":
     pytest.main([__file__])
@@ -2,6 +2,7 @@
 测试延迟导入模块
 """
 
+import concurrent.futures
 import pytest
 import sys
 import importlib
@@ -69,6 +70,21 @@ class TestLazyImport:
         assert result == 3
         assert lazy_len._imported is True
 
+    def test_lazy_import_forwards_after_import(self):
+        """测试导入后直接转发到目标对象"""
+        import os
+
+        lazy_os = LazyImport("os")
+        assert lazy_os.getcwd is os.getcwd
+        assert isinstance(lazy_os, LazyImport)
+        assert type(lazy_os) is not LazyImport
+        assert lazy_os.path is os.path
+
+        lazy_len = LazyImport("builtins", "len")
+        assert lazy_len([1, 2]) == 2
+        assert lazy_len([1, 2, 3]) == 3
+        assert lazy_len.__name__ == "len"
+
     def test_lazy_import_invalid_module(self):
         """测试无效模块导入"""
         lazy_invalid = LazyImport("nonexistent_module_12345")
@@ -93,6 +109,20 @@ class TestLazyImport:
         lazy_invalid = LazyImport("nonexistent_module_12345")
         assert lazy_invalid.is_available() is False
 
+    def test_is_available_cached(self):
+        """测试模块可用性检查结果被缓存"""
+        lazy_invalid = LazyImport("nonexistent_module_12345")
+
+        with patch("importlib.util.find_spec", return_value=None) as mock_find:
+            assert lazy_invalid.is_available() is False
+            assert lazy_invalid.is_available() is False
+            assert mock_find.call_count == 1
+
+            mock_find.return_value = object()
+            assert lazy_invalid.is_available() is False
+            assert lazy_invalid.is_available(refresh=True) is True
+            assert mock_find.call_count == 2
+
 
 class TestLazyModule:
     """LazyModule类测试"""
@@ -138,6 +168,20 @@ class TestLazyImportFunction:
         assert lazy_path.module_name == "os"
         assert lazy_path.attribute == "path"
 
+    def test_lazy_import_already_loaded(self):
+        """测试模块已在sys.modules中时直接绑定"""
+        import os
+
+        lazy_sep = lazy_import("os", "sep")
+        assert lazy_sep._imported is True
+        assert lazy_sep._value is os.sep
+
+        # 属性不存在时仍然延迟到访问时报错
+        lazy_missing = lazy_import("os", "nonexistent_attribute")
+        assert lazy_missing._imported is False
+        with pytest.raises(AttributeError):
+            lazy_missing.anything
+
     def test_lazy_import_caching(self):
         """测试延迟导入缓存"""
         # 同一个模块应该返回相同的对象
@@ -181,6 +225,18 @@ class TestConditionalImport:
         assert len(error_caught) == 1
         assert isinstance(error_caught[0], ImportError)
 
+    def test_conditional_import_caches_missing(self):
+        """测试导入失败结果被缓存"""
+        errors = []
+
+        with patch("importlib.import_module", side_effect=ImportError("missing")) as m:
+            assert conditional_import("missing_cached_module", 1, errors.append) == 1
+            assert conditional_import("missing_cached_module", 2, errors.append) == 2
+
+        m.assert_called_once_with("missing_cached_module")
+        assert len(errors) == 2
+        assert errors[0] is errors[1]
+
 
 class TestImportOptional:
     """import_optional函数测试"""
@@ -197,6 +253,15 @@ class TestImportOptional:
             result = import_optional("nonexistent_module_12345")
             assert result is None
 
+    def test_import_optional_warns_once(self):
+        """测试同一缺失模块只警告一次"""
+        with pytest.warns(ImportWarning) as record:
+            assert import_optional("nonexistent_module_once") is None
+            assert import_optional("nonexistent_module_once") is None
+
+        assert len(record) == 1
+        assert record[0].filename == __file__
+
     def test_import_optional_with_package(self):
         """测试带包名的可选导入"""
         # 测试相对导入
@@ -234,6 +299,20 @@ class TestPreloadModules:
         assert "os" in modules
         assert "nonexistent_module_12345" not in modules
 
+    def test_preload_modules_background_bounded(self):
+        """测试后台预加载使用有上限的线程池并报告失败的模块"""
+        names = ["os", "json", "nonexistent_module_12345"] + ["sys"] * 20
+
+        with patch(
+            "concurrent.futures.ThreadPoolExecutor",
+            wraps=concurrent.futures.ThreadPoolExecutor,
+        ) as mock_pool:
+            with pytest.warns(UserWarning, match="预加载模块.*失败"):
+                modules = preload_modules(names, background=True)
+
+        assert mock_pool.call_args.kwargs["max_workers"] <= 8
+        assert set(modules) == {"os", "json", "sys"}
+
 
 class TestOptionalDependency:
     """OptionalDependency类测试"""
@@ -265,6 +344,21 @@ class TestOptionalDependency:
         assert opt_deps.is_available("invalid_test") is False
         assert opt_deps.get_module("invalid_test") is None
 
+    def test_register_does_not_import(self):
+        """测试注册依赖时不导入模块，首次获取时才导入"""
+        opt_deps = OptionalDependency()
+
+        with patch.dict(sys.modules):
+            sys.modules.pop("colorsys", None)
+            opt_deps.register("colorsys_test", "colorsys")
+
+            assert opt_deps.is_available("colorsys_test") is True
+            assert "colorsys" not in sys.modules
+
+            module = opt_deps.get_module("colorsys_test")
+            assert module is sys.modules["colorsys"]
+            assert opt_deps.require("colorsys_test") is module
+
     def test_require_available_dependency(self):
         """测试要求可用依赖"""
         opt_deps = OptionalDependency()
@@ -317,6 +411,22 @@ class TestGlobalLazyImports:
             # 测试requests有get方法
             assert hasattr(requests, "get")
 
+    def test_global_lazy_objects_created_on_access(self):
+        """测试常用延迟导入对象在首次访问时创建并缓存"""
+        from my_python_project.utils import lazy_import as module
+
+        with patch.dict(module.__dict__):
+            module.__dict__.pop("redis_client", None)
+            assert "redis_client" not in vars(module)
+
+            redis_client = module.redis_client
+            assert isinstance(redis_client, LazyImport)
+            assert redis_client.attribute == "Redis"
+            assert vars(module)["redis_client"] is redis_client
+
+        with pytest.raises(AttributeError):
+            module.not_a_lazy_object
+
 
 class TestGlobalOptionalDeps:
     """全局可选依赖测试"""
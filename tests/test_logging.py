@@ -3,6 +3,7 @@
 import json
 import logging
 import tempfile
+import threading
 import time
 from pathlib import Path
 from unittest.mock import patch, MagicMock
@@ -13,6 +14,7 @@ from my_python_project.utils.logging_utils import (
     JsonFormatter,
     PerformanceFilter,
     LoggerManager,
+    get_logger_manager,
     setup_advanced_logger,
     get_project_logger,
     log_performance,
@@ -22,6 +24,10 @@ from my_python_project.utils.logging_utils import (
     get_configured_logger,
     get_logger_with_path,
     get_log_path_from_env,
+    LocalQueueHandler,
+    _stop_queue_listener,
+    read_msgpack_log,
+    BufferedRotatingFileHandler,
 )
 
 
@@ -103,6 +109,93 @@ class TestJsonFormatter:
         assert log_data["extra"]["user_id"] == "123"
         assert log_data["extra"]["request_id"] == "req-456"
 
+    def test_extra_fields_filtering(self):
+        """测试标准字段不进入额外字段，且不可序列化的值转为字符串。"""
+        formatter = JsonFormatter(include_extra=True)
+        record = logging.LogRecord(
+            name="test.logger",
+            level=logging.INFO,
+            pathname="test.py",
+            lineno=42,
+            msg="Test message",
+            args=(),
+            exc_info=None,
+        )
+        record.function = "ignored"
+        record._private = "ignored"
+        record.path = Path("data")
+
+        log_data = json.loads(formatter.format(record))
+
+        assert log_data["extra"] == {"path": "data"}
+        assert log_data["function"] == record.funcName
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_extra_values_same_with_either_backend(self, use_orjson):
+        """测试是否安装orjson时datetime、枚举等额外字段的输出一致。"""
+        from dataclasses import dataclass
+        from datetime import datetime
+        from enum import StrEnum
+
+        if use_orjson:
+            pytest.importorskip("orjson")
+
+        class Color(StrEnum):
+            RED = "red"
+
+        @dataclass
+        class Point:
+            x: int
+
+        point = Point(1)
+        record = logging.makeLogRecord(
+            {
+                "msg": "m",
+                "created_at": datetime(2024, 1, 2, 3, 4, 5),
+                "color": Color.RED,
+                "point": point,
+            }
+        )
+
+        with patch("my_python_project.utils.logging_utils.HAS_ORJSON", use_orjson):
+            log_data = json.loads(JsonFormatter().format(record))
+
+        assert log_data["extra"] == {
+            "created_at": "2024-01-02 03:04:05",
+            "color": "red",
+            "point": str(point),
+        }
+
+    def test_timestamp_matches_isoformat(self):
+        """测试时间戳缓存与datetime.isoformat结果一致。"""
+        from datetime import datetime
+
+        formatter = JsonFormatter()
+        base = 1760594000.0
+
+        for created in (base, base + 0.25, base + 0.9999996, base + 1.000001, base):
+            assert formatter._format_timestamp(created) == (
+                datetime.fromtimestamp(created).isoformat()
+            )
+
+    def test_no_extra_fields(self):
+        """测试没有额外字段时不输出extra。"""
+        formatter = JsonFormatter(include_extra=True)
+        record = logging.LogRecord(
+            name="test.logger",
+            level=logging.INFO,
+            pathname="test.py",
+            lineno=42,
+            msg="中文消息",
+            args=(),
+            exc_info=None,
+        )
+
+        result = formatter.format(record)
+
+        assert "中文消息" in result
+        assert "extra" not in json.loads(result)
+
 
 class TestPerformanceFilter:
     """测试性能过滤器。"""
@@ -164,6 +257,7 @@ class TestLoggerManager:
         manager2 = LoggerManager()
 
         assert manager1 is manager2
+        assert get_logger_manager() is manager1
 
     def test_logger_caching(self):
         """测试日志记录器缓存。"""
@@ -247,6 +341,140 @@ class TestLoggerSetup:
             assert log_data["message"] == "Test message"
             assert log_data["level"] == "INFO"
 
+    def test_queue_setup(self):
+        """测试通过队列异步写日志。"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            log_file = Path(temp_dir) / "test.log"
+
+            logger = setup_advanced_logger(
+                name="test.queue",
+                level=logging.INFO,
+                log_file=log_file,
+                include_console=False,
+                use_queue=True,
+            )
+
+            assert len(logger.handlers) == 1
+            assert isinstance(logger.handlers[0], LocalQueueHandler)
+
+            try:
+                logger.info("Queued %s", "message")
+            finally:
+                # 停止监听器会先处理完队列中的记录
+                _stop_queue_listener("test.queue")
+
+            assert "Queued message" in log_file.read_text()
+
+    def test_queue_handler_captures_message(self):
+        """测试入队时合并消息参数，之后修改参数不影响记录。"""
+        import queue
+
+        log_queue = queue.Queue()
+        handler = LocalQueueHandler(log_queue)
+        items = [1]
+
+        handler.emit(logging.makeLogRecord({"msg": "items: %s", "args": (items,)}))
+        items.append(2)
+
+        assert log_queue.get_nowait().getMessage() == "items: [1]"
+
+    def test_msgpack_format(self):
+        """测试MessagePack二进制格式的文件日志。"""
+        pytest.importorskip("msgpack")
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            log_file = Path(temp_dir) / "test.log"
+
+            logger = setup_advanced_logger(
+                name="test.msgpack",
+                level=logging.INFO,
+                log_file=log_file,
+                log_format="msgpack",
+                include_console=False,
+            )
+
+            logger.info("First", extra={"duration": 0.5})
+            logger.info("Second")
+            for handler in logger.handlers:
+                handler.close()
+
+            records = list(read_msgpack_log(log_file))
+
+            assert [r["message"] for r in records] == ["First", "Second"]
+            assert records[0]["extra"] == {"duration": 0.5}
+
+    def test_buffered_file_handler(self):
+        """测试缓冲文件日志定时刷新。"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            log_file = Path(temp_dir) / "test.log"
+
+            logger = setup_advanced_logger(
+                name="test.buffered",
+                level=logging.INFO,
+                log_file=log_file,
+                include_console=False,
+                flush_interval_ms=20,
+            )
+            handler = logger.handlers[0]
+            assert isinstance(handler, BufferedRotatingFileHandler)
+
+            try:
+                logger.info("Buffered message")
+                deadline = time.time() + 2
+                while "Buffered message" not in log_file.read_text():
+                    assert time.time() < deadline
+                    time.sleep(0.01)
+            finally:
+                handler.close()
+
+    def test_buffered_file_handler_close_with_lock_held(self):
+        """测试持有handler锁时close不会与刷新线程互相等待。"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            log_file = Path(temp_dir) / "test.log"
+            handler = BufferedRotatingFileHandler(log_file, flush_interval=0.02)
+            handler.setFormatter(logging.Formatter("%(message)s"))
+            handler.emit(logging.makeLogRecord({"msg": "pending"}))
+
+            def close_like_shutdown():
+                # 与logging.shutdown()相同：持有锁调用flush()和close()
+                with handler.lock:
+                    time.sleep(0.1)
+                    handler.flush()
+                    handler.close()
+
+            closer = threading.Thread(target=close_like_shutdown, daemon=True)
+            closer.start()
+            closer.join(timeout=5)
+
+            assert not closer.is_alive()
+            assert log_file.read_text() == "pending\n"
+
+    def test_buffered_file_handler_rotation(self):
+        """测试缓冲文件日志按累计大小轮转。"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            log_file = Path(temp_dir) / "test.log"
+            handler = BufferedRotatingFileHandler(
+                log_file, maxBytes=100, backupCount=2, flush_interval=60
+            )
+            handler.setFormatter(logging.Formatter("%(message)s"))
+
+            for i in range(10):
+                handler.emit(logging.makeLogRecord({"msg": f"message {i:02d}" * 2}))
+            handler.close()
+
+            assert log_file.with_name("test.log.1").exists()
+            assert log_file.read_text().endswith("message 09message 09\n")
+
+    def test_formatter_shared(self):
+        """测试相同格式的handlers共享格式化器实例。"""
+        first = setup_advanced_logger(name="test.shared.a", json_format=True)
+        second = setup_advanced_logger(name="test.shared.b", log_format="json")
+        standard = setup_advanced_logger(name="test.shared.c")
+
+        assert isinstance(first.handlers[0].formatter, JsonFormatter)
+        assert first.handlers[0].formatter is second.handlers[0].formatter
+        assert standard.handlers[0].formatter is not first.handlers[0].formatter
+
     def test_rotation_setup(self):
         """测试文件轮转设置。"""
         with tempfile.TemporaryDirectory() as temp_dir:
@@ -295,6 +523,26 @@ class TestDecorators:
         final_call = calls[-1]
         assert "duration" in final_call[1].get("extra", {})
 
+    def test_log_performance_disabled_level(self):
+        """测试级别未启用时不记录日志也不计算参数repr。"""
+        mock_logger = MagicMock()
+        mock_logger.isEnabledFor.return_value = False
+        repr_calls = []
+
+        class Arg:
+            def __repr__(self):
+                repr_calls.append(self)
+                return "Arg()"
+
+        @log_performance(mock_logger, level=logging.DEBUG, include_args=True)
+        def test_function(value):
+            return "result"
+
+        assert test_function(Arg()) == "result"
+        mock_logger.isEnabledFor.assert_called_with(logging.DEBUG)
+        mock_logger.log.assert_not_called()
+        assert repr_calls == []
+
     def test_log_function_call_decorator(self):
         """测试函数调用装饰器。"""
         mock_logger = MagicMock()
@@ -314,6 +562,24 @@ class TestDecorators:
         assert "hello" in call_content
         assert "world" in call_content
 
+    def test_log_function_call_lazy_format(self):
+        """测试函数调用日志使用延迟格式化参数。"""
+        mock_logger = MagicMock()
+
+        @log_function_call(mock_logger, level=logging.INFO, log_args=False)
+        def test_function():
+            return None
+
+        test_function()
+        mock_logger.log.assert_called_once_with(
+            logging.INFO, "调用函数 %s", test_function.__qualname__
+        )
+
+        mock_logger.reset_mock()
+        mock_logger.isEnabledFor.return_value = False
+        test_function()
+        mock_logger.log.assert_not_called()
+
     def test_log_context_manager(self):
         """测试上下文管理器。"""
         mock_logger = MagicMock()
@@ -430,6 +696,31 @@ class TestCustomPathSupport:
             assert "Test main logger" in main_log.read_text()
             assert "Test error logger" in error_log.read_text()
 
+    def test_configure_project_logging_performance_format(self):
+        """测试性能日志默认写JSON行，msgpack需显式指定并使用单独的扩展名。"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            log_dir = Path(temp_dir)
+
+            loggers = configure_project_logging(
+                log_dir=log_dir / "default", enable_file_logging=True
+            )
+            loggers["performance"].info("slow op", extra={"duration": 1.0})
+            json_log = log_dir / "default" / "my_python_project_performance.log"
+            assert json.loads(json_log.read_text())["message"] == "slow op"
+
+            pytest.importorskip("msgpack")
+            loggers = configure_project_logging(
+                log_dir=log_dir / "binary",
+                enable_file_logging=True,
+                performance_log_format="msgpack",
+            )
+            loggers["performance"].info("slow op", extra={"duration": 1.0})
+            binary_log = log_dir / "binary" / "my_python_project_performance.msgpack"
+            assert next(read_msgpack_log(binary_log))["message"] == "slow op"
+            assert not (
+                log_dir / "binary" / "my_python_project_performance.log"
+            ).exists()
+
     def test_configure_project_logging_custom_files(self):
         """测试配置项目日志系统，自定义文件映射。"""
         with tempfile.TemporaryDirectory() as temp_dir: